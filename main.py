@@ -1,5 +1,53 @@
-from src.game_engine import GameEngine
+import argparse
+import sys
+import time
 
-if __name__ == "__main__":
-    engine = GameEngine()
+STARTED = time.perf_counter()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Career Worlds")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="time each startup phase up to the first frame, print the breakdown and exit",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="save each session's input under replays/ for python -m src.replay",
+    )
+    parser.add_argument(
+        "--profile-frames",
+        action="store_true",
+        help="write frame-phase timings under profiles/ on exit (also done when the F3 overlay is open)",
+    )
+    parser.add_argument(
+        "--startup-budget-ms",
+        type=float,
+        default=None,
+        help="with --profile-startup, exit with status 1 when the first frame takes longer than this",
+    )
+    args = parser.parse_args(argv)
+
+    from src.profiler import StartupTimer
+
+    startup = StartupTimer(STARTED)
+    from src.game_engine import GameEngine
+
+    startup.lap("imports")
+    engine = GameEngine(startup, record=args.record, profile_frames=args.profile_frames)
+    if not args.profile_startup:
+        engine.run()
+        return 0
+
+    engine.exit_after_startup = True
     engine.run()
+    print("\n".join(startup.format_lines(args.startup_budget_ms)))
+    if args.startup_budget_ms is not None and startup.total_ms > args.startup_budget_ms:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Any
+
+
+class MusicPlayer:
+    """Background music on a pygame mixer that is brought up off the UI thread.
+
+    Importing pygame and opening the audio device take long enough to delay the
+    first frame, so ``start`` does both on a daemon thread. Requests made before
+    the mixer is ready are queued; when pygame is missing or the device fails,
+    every call quietly does nothing.
+    """
+
+    def __init__(self) -> None:
+        self.state = "idle"
+        self.pygame: Any = None
+        self.pending: tuple[str, int] | None = None
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        self.init_seconds: float | None = None
+
+    def start(self) -> None:
+        with self.lock:
+            if self.state != "idle":
+                return
+            self.state = "loading"
+        self.thread = threading.Thread(target=self._init_mixer, name="audio-init", daemon=True)
+        self.thread.start()
+
+    def _init_mixer(self) -> None:
+        started = time.perf_counter()
+        try:
+            import pygame
+
+            pygame.mixer.init()
+        except ImportError:
+            print("Audio unavailable: pygame is not installed")
+            self._give_up()
+            return
+        except Exception as error:
+            print(f"Audio unavailable: {error}")
+            self._give_up()
+            return
+
+        with self.lock:
+            if self.state != "loading":
+                # The game closed while the device was opening.
+                pygame.mixer.quit()
+                return
+            self.pygame = pygame
+            self.init_seconds = time.perf_counter() - started
+            self.state = "ready"
+            pending, self.pending = self.pending, None
+        if pending:
+            self._play(*pending)
+
+    def _give_up(self) -> None:
+        with self.lock:
+            self.state = "unavailable"
+            self.pending = None
+
+    @property
+    def available(self) -> bool:
+        return self.state == "ready"
+
+    def play(self, path: str, loops: int = -1) -> None:
+        with self.lock:
+            if self.state in ("idle", "loading"):
+                self.pending = (path, loops)
+                return
+            if self.state != "ready":
+                return
+        self._play(path, loops)
+
+    def _play(self, path: str, loops: int) -> None:
+        try:
+            self.pygame.mixer.music.load(path)
+            self.pygame.mixer.music.play(loops)
+        except Exception as error:
+            print(f"Error playing music: {error}")
+
+    def stop(self) -> None:
+        with self.lock:
+            self.pending = None
+            if self.state != "ready":
+                return
+        try:
+            self.pygame.mixer.music.stop()
+        except Exception as error:
+            print(f"Error stopping music: {error}")
+
+    def shutdown(self) -> None:
+        with self.lock:
+            self.pending = None
+            if self.state != "ready":
+                self.state = "unavailable"
+                return
+            self.state = "closed"
+        try:
+            self.pygame.mixer.quit()
+        except Exception:
+            pass
@@ -0,0 +1,122 @@
+"""Monte Carlo sessions of one world spread across every core.
+
+    python -m src.batch_sim --world 7 --sessions 2000 --policy random
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from src.headless import POLICY_NAMES, HeadlessReport, make_policy, run_world
+from src.worlds.registry import WORLD_SPECS
+
+GRADE_ORDER = ("S", "A", "B", "C", "F", "-")
+
+
+@dataclass
+class BatchSummary:
+    world_key: str
+    world_name: str
+    sessions: int = 0
+    wall_seconds: float = 0.0
+    grades: Counter = field(default_factory=Counter)
+    failures: Counter = field(default_factory=Counter)
+    completion_times: list[float] = field(default_factory=list)
+    successes: int = 0
+    unfinished: int = 0
+
+    def add(self, report: HeadlessReport) -> None:
+        self.sessions += 1
+        self.grades[report.grade] += 1
+        if not report.finished:
+            self.unfinished += 1
+            return
+        self.completion_times.append(report.sim_seconds)
+        if report.success:
+            self.successes += 1
+        else:
+            self.failures[report.message or "(no message)"] += 1
+
+    def grade_share(self, grade: str) -> float:
+        return self.grades[grade] / self.sessions if self.sessions else 0.0
+
+    def format(self) -> str:
+        lines = [f"{self.world_name} [{self.world_key}]: {self.sessions} sessions in {self.wall_seconds:.1f}s"]
+        lines.append(f"{'grade':<7}{'count':>8}{'share':>9}")
+        for grade in GRADE_ORDER:
+            if self.grades[grade]:
+                lines.append(f"{grade:<7}{self.grades[grade]:>8}{self.grade_share(grade):>9.1%}")
+        if self.sessions:
+            lines.append(f"success rate {self.successes / self.sessions:.1%}, unfinished {self.unfinished}")
+        if len(self.completion_times) >= 2:
+            cuts = statistics.quantiles(self.completion_times, n=10)
+            lines.append(
+                f"completion time (sim s): p10 {cuts[0]:.1f}  p50 {statistics.median(self.completion_times):.1f}"
+                f"  p90 {cuts[-1]:.1f}  mean {statistics.fmean(self.completion_times):.1f}"
+            )
+        if self.failures:
+            lines.append("top failure messages:")
+            for message, count in self.failures.most_common(5):
+                lines.append(f"  {count:>6}  {message}")
+        return "\n".join(lines)
+
+
+def run_session(task: tuple[str, int, str, float]) -> HeadlessReport:
+    key, seed, policy_name, seconds = task
+    # The world and the input policy draw from separate streams of the same session seed.
+    return run_world(key, seconds, make_policy(policy_name, random.Random(seed ^ 0x5EED)), seed=seed)
+
+
+def run_batch(
+    key: str,
+    sessions: int,
+    policy_name: str = "random",
+    *,
+    seed: int = 0,
+    workers: int | None = None,
+    seconds: float | None = None,
+) -> BatchSummary:
+    spec = WORLD_SPECS[key]
+    if seconds is None:
+        seconds = spec.duration + 5.0
+    summary = BatchSummary(world_key=key, world_name=spec.name)
+    tasks = [(key, seed + index, policy_name, seconds) for index in range(sessions)]
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    if workers == 1:
+        for task in tasks:
+            summary.add(run_session(task))
+    else:
+        chunksize = max(1, sessions // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for report in executor.map(run_session, tasks, chunksize=chunksize):
+                summary.add(report)
+    summary.wall_seconds = time.perf_counter() - started
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Estimate grade odds for a world with many simulated sessions.")
+    parser.add_argument("--world", required=True, help="hub key (1-0, q-u)")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--policy", choices=POLICY_NAMES, default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to every core")
+    parser.add_argument("--seconds", type=float, default=None, help="session cap; defaults to the world duration plus 5s")
+    args = parser.parse_args(argv)
+
+    key = args.world.lower()
+    if key not in WORLD_SPECS:
+        parser.error(f"unknown world key: {key}")
+    summary = run_batch(key, args.sessions, args.policy, seed=args.seed, workers=args.workers, seconds=args.seconds)
+    print(summary.format())
+
+
+if __name__ == "__main__":
+    main()
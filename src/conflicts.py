@@ -0,0 +1,269 @@
+"""Predictive loss-of-separation detection for the ATC radar.
+
+Each aircraft is projected forward over a short horizon, following its drawn
+route (``path`` waypoints) and then its current heading, bouncing off the
+airspace edges the way the simulation does. The projection is sampled at a
+fixed step, so every trajectory is piecewise linear on a shared clock.
+
+Prediction works one time slice (``step``) at a time, where every track is a
+single segment. Each slice buckets the segment midpoints in a
+``SpatialHash``, and only pairs whose midpoints are within the separation
+plus both half-lengths are solved, exactly, for the first moment the two are
+closer than the separation minimum. Planes with no route that stay inside
+the airspace skip the projection: their samples are computed directly, and
+the per-slice solve is the closed form for straight tracks.
+"""
+
+import math
+from typing import Any, NamedTuple, Sequence
+
+from src.utils import NUMPY_MIN_ENTITIES, SpatialHash, load_numpy
+
+WAYPOINT_REACHED = 10.0
+DEFAULT_SPEED = 105.0
+
+
+class Conflict(NamedTuple):
+    first: Any
+    second: Any
+    time: float
+    distance: float
+
+    @property
+    def imminent(self) -> bool:
+        """Separation is already lost."""
+        return self.time == 0.0
+
+
+class ConflictDetector:
+    """Finds pairs of aircraft predicted to come within ``separation`` in the next ``horizon`` seconds.
+
+    Aircraft are dicts with ``x``, ``y``, ``vx``, ``vy`` and optionally
+    ``path`` and ``speed``, as ``ATCWorld`` keeps them. Results are in
+    ascending time to conflict, with ties in input order; ``first`` is
+    always the aircraft that comes earlier in the input. ``update`` is the
+    per-tick entry point: it reruns ``detect`` every ``interval`` seconds,
+    the way a radar sweep refreshes, rather than on every simulation step.
+    From ``NUMPY_MIN_ENTITIES`` aircraft up, when NumPy is installed, each
+    slice is solved as arrays; ``use_numpy`` forces either backend.
+    """
+
+    def __init__(
+        self,
+        separation: float,
+        horizon: float = 3.0,
+        step: float = 0.5,
+        bounds: tuple[float, float, float, float] | None = None,
+        interval: float = 0.25,
+        use_numpy: bool | None = None,
+    ) -> None:
+        if use_numpy and load_numpy() is None:
+            raise ImportError("ConflictDetector(use_numpy=True) needs NumPy")
+        self.separation = separation
+        self.horizon = horizon
+        self.step = step
+        self.samples = max(1, math.ceil(horizon / step))
+        self.offsets = [k * step for k in range(self.samples + 1)]
+        self.bounds = bounds
+        self.interval = interval
+        # Pairs that passed a slice's broadphase in the last ``detect``, summed over its slices.
+        self.use_numpy = use_numpy
+        self.numpy_min = 0 if use_numpy else NUMPY_MIN_ENTITIES
+        self.pairs_tested = 0
+        self.conflicts: list[Conflict] | None = None
+        self.age = 0.0
+
+    def project(self, plane: dict[str, Any]) -> tuple[list[float], list[float]]:
+        """Positions at ``0, step, 2*step, ...`` up to the horizon."""
+        x, y = float(plane["x"]), float(plane["y"])
+        vx, vy = float(plane["vx"]), float(plane["vy"])
+        speed = float(plane.get("speed", DEFAULT_SPEED))
+        path = plane.get("path") or ()
+        waypoint = 0
+        bounds = self.bounds
+        xs, ys = [x], [y]
+        for _ in range(self.samples):
+            remaining = self.step
+            while remaining > 0.0:
+                if waypoint < len(path):
+                    tx, ty = path[waypoint]
+                    dx, dy = tx - x, ty - y
+                    dist = math.hypot(dx, dy)
+                    if dist < WAYPOINT_REACHED:
+                        waypoint += 1
+                        continue
+                    vx, vy = dx / dist * speed, dy / dist * speed
+                    reach = speed * remaining
+                    if reach >= dist:
+                        x, y = tx, ty
+                        remaining -= dist / speed
+                        waypoint += 1
+                        continue
+                x += vx * remaining
+                y += vy * remaining
+                remaining = 0.0
+            if bounds is not None:
+                left, top, right, bottom = bounds
+                if x < left or x > right:
+                    vx = -vx
+                    x = min(max(x, left), right)
+                if y < top or y > bottom:
+                    vy = -vy
+                    y = min(max(y, top), bottom)
+            xs.append(x)
+            ys.append(y)
+        return xs, ys
+
+    def track(self, plane: dict[str, Any]) -> tuple[list[float], list[float]]:
+        """``project``, computed directly for a plane with no route that stays inside the airspace."""
+        x, y = float(plane["x"]), float(plane["y"])
+        vx, vy = float(plane["vx"]), float(plane["vy"])
+        horizon = self.samples * self.step
+        ex, ey = x + vx * horizon, y + vy * horizon
+        bounds = self.bounds
+        if plane.get("path") or (
+            bounds is not None and not (bounds[0] <= min(x, ex) and max(x, ex) <= bounds[2] and bounds[1] <= min(y, ey) and max(y, ey) <= bounds[3])
+        ):
+            return self.project(plane)
+        offsets = self.offsets
+        return [x + vx * t for t in offsets], [y + vy * t for t in offsets]
+
+    def detect(self, planes: Sequence[dict[str, Any]]) -> list[Conflict]:
+        """A full prediction over the horizon, one time slice at a time."""
+        count = len(planes)
+        tracks = [self.track(plane) for plane in planes]
+        np = load_numpy() if self.use_numpy is not False and count >= self.numpy_min else None
+        if np is not None:
+            return self._detect_arrays(np, planes, tracks)
+
+        separation, step = self.separation, self.step
+        limit = separation * separation
+        found: dict[int, float] = {}
+        tested = 0
+        for k in range(self.samples):
+            # Within a slice every track is one segment. Two segments can only come within the
+            # separation if their midpoints are within it plus both half-lengths.
+            x0 = [xs[k] for xs, _ in tracks]
+            y0 = [ys[k] for _, ys in tracks]
+            x1 = [xs[k + 1] for xs, _ in tracks]
+            y1 = [ys[k + 1] for _, ys in tracks]
+            mids = [((ax + bx) * 0.5, (ay + by) * 0.5) for ax, ay, bx, by in zip(x0, y0, x1, y1)]
+            halves = [math.hypot(bx - ax, by - ay) * 0.5 for ax, ay, bx, by in zip(x0, y0, x1, y1)]
+            grid = SpatialHash(separation + 2.0 * max(halves, default=0.0))
+            grid.rebuild(range(count), mids.__getitem__)
+            for a, b in grid.neighbour_pairs():
+                if a > b:
+                    a, b = b, a
+                amx, amy = mids[a]
+                bmx, bmy = mids[b]
+                bound = separation + halves[a] + halves[b]
+                if (amx - bmx) * (amx - bmx) + (amy - bmy) * (amy - bmy) > bound * bound:
+                    continue
+                tested += 1
+                key = a * count + b
+                if key in found:
+                    continue
+                rx, ry = x0[a] - x0[b], y0[a] - y0[b]
+                c = rx * rx + ry * ry - limit
+                if c < 0.0:
+                    found[key] = k * step
+                    continue
+                # Relative motion is linear within a slice: solve |r + d*s| = separation for s in [0, 1].
+                dx, dy = x1[a] - x1[b] - rx, y1[a] - y1[b] - ry
+                da = dx * dx + dy * dy
+                if da > 0.0:
+                    db = 2.0 * (rx * dx + ry * dy)
+                    disc = db * db - 4.0 * da * c
+                    if disc >= 0.0:
+                        s = (-db - math.sqrt(disc)) / (2.0 * da)
+                        if 0.0 <= s <= 1.0:
+                            found[key] = (k + s) * step
+        self.pairs_tested = tested
+
+        conflicts = []
+        for time, key in sorted((time, key) for key, time in found.items()):
+            a, b = divmod(key, count)
+            first, second = planes[a], planes[b]
+            conflicts.append(Conflict(first, second, time, math.hypot(first["x"] - second["x"], first["y"] - second["y"])))
+        return conflicts
+
+    def _detect_arrays(self, np: Any, planes: Sequence[dict[str, Any]], tracks: list[tuple[list[float], list[float]]]) -> list[Conflict]:
+        """``detect`` with each slice's broadphase and solve run as arrays.
+
+        The broadphase sorts the segment midpoints by x and pairs each with
+        the ones following it within reach, instead of bucketing them.
+        """
+        separation, step = self.separation, self.step
+        limit = separation * separation
+        count = len(planes)
+        track_x = np.array([xs for xs, _ in tracks])
+        track_y = np.array([ys for _, ys in tracks])
+        positions = np.arange(count)
+        keys, times = [], []
+        tested = 0
+        for k in range(self.samples):
+            x0, y0, x1, y1 = track_x[:, k], track_y[:, k], track_x[:, k + 1], track_y[:, k + 1]
+            mx, my = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+            half = np.hypot(x1 - x0, y1 - y0) * 0.5
+            order = np.argsort(mx, kind="stable")
+            sorted_x = mx[order]
+            ends = np.searchsorted(sorted_x, sorted_x + separation + 2.0 * half.max(), side="right")
+            spans = ends - positions - 1
+            starts = np.repeat(positions, spans)
+            following = starts + 1 + np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+            a, b = order[starts], order[following]
+            a, b = np.minimum(a, b), np.maximum(a, b)
+            bound = separation + half[a] + half[b]
+            near = (mx[a] - mx[b]) ** 2 + (my[a] - my[b]) ** 2 <= bound * bound
+            a, b = a[near], b[near]
+            tested += len(a)
+
+            rx, ry = x0[a] - x0[b], y0[a] - y0[b]
+            c = rx * rx + ry * ry - limit
+            dx, dy = x1[a] - x1[b] - rx, y1[a] - y1[b] - ry
+            da = dx * dx + dy * dy
+            db = 2.0 * (rx * dx + ry * dy)
+            disc = db * db - 4.0 * da * c
+            with np.errstate(divide="ignore", invalid="ignore"):
+                s = (-db - np.sqrt(disc)) / (2.0 * da)
+            inside = c < 0.0
+            hit = inside | ((da > 0.0) & (disc >= 0.0) & (s >= 0.0) & (s <= 1.0))
+            keys.append(a[hit] * count + b[hit])
+            times.append(np.where(inside, 0.0, s)[hit] * step + k * step)
+        self.pairs_tested = tested
+
+        # Keep each pair's earliest slice, then order by time and input position like ``detect``.
+        key, time = np.concatenate(keys), np.concatenate(times)
+        order = np.lexsort((time, key))
+        key, time = key[order], time[order]
+        first = np.ones(len(key), dtype=bool)
+        first[1:] = key[1:] != key[:-1]
+        key, time = key[first], time[first]
+        order = np.lexsort((key, time))
+        key, time = key[order], time[order]
+        a, b = key // count, key % count
+        distance = np.hypot(track_x[a, 0] - track_x[b, 0], track_y[a, 0] - track_y[b, 0])
+        return list(map(
+            Conflict,
+            [planes[index] for index in a.tolist()],
+            [planes[index] for index in b.tolist()],
+            time.tolist(),
+            distance.tolist(),
+        ))
+
+    def update(self, planes: Sequence[dict[str, Any]], dt: float) -> list[Conflict]:
+        """The latest prediction, rerun once ``interval`` seconds have passed since the last one.
+
+        Between runs the same list is returned; ``age`` is the time since it
+        was made, so a conflict is now ``time - age`` away.
+        """
+        self.age += dt
+        # Allow for rounding in a sum of fixed steps, so 15 ticks of 1/60s make 0.25s.
+        if self.conflicts is None or self.age >= self.interval - 1e-9:
+            self.conflicts = self.detect(planes)
+            self.age = 0.0
+        return self.conflicts
+
+    def reset(self) -> None:
+        self.conflicts = None
+        self.age = 0.0
@@ -4,34 +4,30 @@ import time
 import tkinter as tk
 from typing import Any
 
-import pygame
-
+from src.audio import MusicPlayer
 from src.player import Player
+from src.profiler import PhaseProfiler, StartupTimer
+from src.replay import InputRecorder
 from src.save_system import SaveSystem
-from src.utils import BG, HEIGHT, WIDTH
-from src.worlds.ai_engineer import AIEngineerWorld
-from src.worlds.architect import ArchitectWorld
-from src.worlds.atc import ATCWorld
-from src.worlds.base import BaseWorld
-from src.worlds.bug_hunt import BugHuntWorld
-from src.worlds.chef_rush import ChefRushWorld
-from src.worlds.cybersecurity_analyst import CybersecurityAnalystWorld
-from src.worlds.data_scientist import DataScientistWorld
-from src.worlds.doctor import DoctorWorld
-from src.worlds.electrician import ElectricianWorld
-from src.worlds.entrepreneur_rework import TycoonWorld
-from src.worlds.fire_rescue import FireRescueWorld
-from src.worlds.game_developer import GameDeveloperWorld
-from src.worlds.marine import MarineWorld
-from src.worlds.pilot import PilotWorld
-from src.worlds.psychologist import PsychologistWorld
-from src.worlds.robotics_engineer import RoboticsEngineerWorld
-from src.worlds.software_developer import SoftwareDeveloperWorld
+from src.scene import SceneLayer
+from src.telemetry import CanvasTelemetry
+from src.utils import BG, HEIGHT, SIM_STEP, WIDTH
+from src.worlds.base import BaseWorld, FrameInput
+from src.worlds.registry import WORLD_ORDER, WORLD_SPECS, WorldSpec, create_world
+
+FRAME_INTERVAL = 1.0 / 60.0
+MAX_SIM_STEPS = 6
 
 
 class GameEngine:
-    def __init__(self) -> None:
+    def __init__(self, startup: StartupTimer | None = None, *, record: bool = False, profile_frames: bool = False) -> None:
+        self.startup = startup or StartupTimer()
+        self.exit_after_startup = False
+        self.record_sessions = record
+        self.profile_frames = profile_frames
+        self.first_frame_drawn = False
         self.root = tk.Tk()
+        self.startup.lap("tk_root")
         self.root.title("Career Worlds")
         self.root.configure(bg="#04111f")
         self.root.resizable(True, True)
@@ -52,41 +48,39 @@ class GameEngine:
             highlightthickness=0,
         )
         self.canvas.pack(fill="both", expand=True)
+        self.scene = SceneLayer(self.canvas)
+        self.telemetry = CanvasTelemetry(self.canvas)
+        # Font sizes are scaled by the scene layer, so keep one point per pixel.
+        self.root.tk.call("tk", "scaling", 1.0)
         self.update_viewport(self.screen_width, self.screen_height)
+        self.startup.lap("window_and_canvas")
 
         self.player = Player()
         self.save_system = SaveSystem()
-        self.worlds: dict[str, BaseWorld] = {
-            "1": FireRescueWorld(),
-            "2": ChefRushWorld(),
-            "3": BugHuntWorld(),
-            "4": MarineWorld(),
-            "5": ArchitectWorld(),
-            "6": DoctorWorld(),
-            "7": ATCWorld(),
-            "8": PilotWorld(),
-            "9": SoftwareDeveloperWorld(),
-            "0": PsychologistWorld(),
-            "q": TycoonWorld(),
-            "w": ElectricianWorld(),
-            "e": GameDeveloperWorld(),
-            "r": DataScientistWorld(),
-            "t": AIEngineerWorld(),
-            "y": CybersecurityAnalystWorld(),
-            "u": RoboticsEngineerWorld(),
-        }
-        self.world_order = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "q", "w", "e", "r", "t", "y", "u"]
+        self.startup.lap("save_load")
+        # Worlds are imported and built the first time they are played.
+        self.worlds: dict[str, BaseWorld] = {}
+        self.world_order = list(WORLD_ORDER)
         self.menu_columns = 4
         self.selected_world_index = 0
         self.menu_card_bounds: dict[str, tuple[float, float, float, float]] = {}
+        self.startup.lap("world_registry")
 
         self.active_world: BaseWorld | None = None
+        self.session_seed: int | None = None
+        self.active_key = ""
+        self.recorder: InputRecorder | None = None
         self.state = "title"
         self.message = "Select a profession and jump straight into the challenge."
         self.keys: set[str] = set()
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
+        self.next_frame_at = self.last_time
+        self.accumulator = 0.0
         self.high_contrast = bool(self.save_system.get_setting("high_contrast", False))
         self.debug_mode = False
+        self.profiler = PhaseProfiler()
+        self.profile_lines: list[str] = []
+        self.profile_refresh = 0
         self.fps = 0.0
         self.mouse_x = 0
         self.mouse_y = 0
@@ -101,12 +95,10 @@ class GameEngine:
             self.logo_img = tk.PhotoImage(file=self.logo_path)
         except Exception:
             self.logo_img = None
+        self.startup.lap("logo_decode")
 
-        try:
-            pygame.mixer.init()
-        except pygame.error as error:
-            print(f"Audio unavailable: {error}")
-            self.music_on = False
+        # The mixer is opened on a background thread once the title screen is up.
+        self.audio = MusicPlayer()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.bind("<KeyPress>", self.on_key_press)
@@ -115,7 +107,7 @@ class GameEngine:
         self.root.bind("<Configure>", self.on_configure)
         self.canvas.bind("<Button-1>", self.on_click)
         self.canvas.bind("<Motion>", self.on_mouse_move)
-        self.root.after(16, self.loop)
+        self.startup.lap("engine_init")
 
     def update_viewport(self, width: int, height: int) -> None:
         self.screen_width = max(width, WIDTH)
@@ -126,7 +118,7 @@ class GameEngine:
         self.viewport_x = (self.screen_width - self.viewport_w) / 2.0
         self.viewport_y = (self.screen_height - self.viewport_h) / 2.0
         self.canvas.configure(width=self.screen_width, height=self.screen_height)
-        self.root.tk.call("tk", "scaling", max(1.0, self.render_scale))
+        self.scene.set_viewport(self.render_scale, self.viewport_x, self.viewport_y)
 
     def on_configure(self, event: tk.Event) -> None:
         if event.widget != self.root:
@@ -154,10 +146,13 @@ class GameEngine:
             and self.viewport_y <= y <= self.viewport_y + self.viewport_h
         )
 
-    def apply_viewport_transform(self) -> None:
-        self.canvas.addtag_all("scene")
-        self.canvas.scale("scene", 0.0, 0.0, self.render_scale, self.render_scale)
-        self.canvas.move("scene", self.viewport_x, self.viewport_y)
+    def update_static_layer(self) -> None:
+        if self.state in {"briefing", "world", "result"} and self.active_world:
+            self.scene.set_static(self.active_world, self.active_world.draw_static)
+        elif self.state == "victory":
+            self.scene.set_static("victory", self.draw_victory_backdrop)
+        else:
+            self.scene.set_static(None, None)
 
     def on_mouse_move(self, event: tk.Event) -> None:
         if not self.point_in_viewport(event.x, event.y):
@@ -199,7 +194,7 @@ class GameEngine:
             self.state = "menu"
             self.message = "Browse with arrow keys or hover cards, then press Enter."
         elif self.state == "menu":
-            if lower_key in self.worlds:
+            if lower_key in WORLD_SPECS:
                 self.selected_world_index = self.world_order.index(lower_key)
                 self.start_world(lower_key)
                 return
@@ -212,10 +207,13 @@ class GameEngine:
             elif lower_key == "h":
                 self.high_contrast = not self.high_contrast
                 self.save_system.set_setting("high_contrast", self.high_contrast)
+                self.scene.invalidate_static()
             elif event.keysym in {"?", "slash"}:
                 self.state = "help"
             elif event.keysym == "F3":
                 self.debug_mode = not self.debug_mode
+                # Count Tcl traffic only while the overlay is open.
+                self.scene.canvas = self.telemetry if self.debug_mode else self.canvas
             elif lower_key == "a":
                 self.state = "about"
         elif self.state == "briefing" and event.keysym in {"space", "Return"}:
@@ -294,13 +292,23 @@ class GameEngine:
                 return key
         return None
 
+    def get_world(self, key: str) -> BaseWorld:
+        world = self.worlds.get(key)
+        if world is None:
+            world = self.worlds[key] = create_world(key)
+        return world
+
     def start_world(self, key: str) -> None:
-        self.active_world = self.worlds[key]
+        self.active_key = key
+        self.active_world = self.get_world(key)
+        self.session_seed = self.active_world.seed_rng()
         self.active_world.reset(self.player)
         self.active_world.start_session(self.player)
         self.active_world.high_contrast = self.high_contrast
+        self.scene.invalidate_static()
         self.keys.clear()
         self.active_world.clear_input_state()
+        self.recorder = InputRecorder(key, self.session_seed, self.player) if self.record_sessions else None
         self.state = "briefing"
         self.message = ""
         self.held_keys_to_ignore.update(self.keys)
@@ -315,13 +323,14 @@ class GameEngine:
 
         self.state = "menu"
         self.active_world = None
+        self.recorder = None
         self.held_keys_to_ignore.update(self.keys)
         self.keys.clear()
         comp_count = self.save_system.get_completed_world_count()
         if comp_count >= len(self.world_order):
             all_b_or_higher = True
             ranks = {"S": 5, "A": 4, "B": 3, "C": 2, "-": 1}
-            for world_id in self.worlds:
+            for world_id in self.world_order:
                 if ranks.get(self.save_system.get_grade(world_id, "-"), 0) < 3:
                     all_b_or_higher = False
                     break
@@ -330,44 +339,105 @@ class GameEngine:
 
         self.message = f"{comp_count}/{len(self.world_order)} professions mastered"
 
+    def save_recording(self, *, crashed: bool = False) -> None:
+        if not self.recorder:
+            return
+        if crashed:
+            name = f"crash-{self.recorder.replay.world_key}-{time.strftime('%Y%m%d-%H%M%S')}.cwr"
+        else:
+            name = "last_session.cwr"
+        try:
+            self.recorder.save(name)
+        except OSError as error:
+            print(f"Could not save session input: {error}")
+        self.recorder = None
+
     def loop(self, *args: Any) -> None:
-        now = time.time()
+        now = time.perf_counter()
         raw_dt = now - self.last_time
-        dt = min(0.1, raw_dt)
         self.last_time = now
         self.fps = 1.0 / max(0.001, raw_dt)
 
+        # Simulation runs in fixed steps; a slow frame catches up with several.
+        self.accumulator = min(self.accumulator + raw_dt, SIM_STEP * MAX_SIM_STEPS)
+        steps = 0
+        while self.accumulator >= SIM_STEP:
+            self.accumulator -= SIM_STEP
+            steps += 1
+
+        if steps:
+            profiler = self.profiler
+            frame_started = time.perf_counter()
+            if self.debug_mode:
+                self.telemetry.begin_frame()
+            profiler.call("static_layer", self.update_static_layer)
+            self.advance_frame(steps)
+            if self.debug_mode:
+                self.telemetry.end_frame(len(self.scene.items) + len(self.scene.keyed))
+            # Force Tk's pending redraw now so its cost shows up as its own phase.
+            profiler.call("tk_flush", self.root.update_idletasks)
+            profiler.add("frame", time.perf_counter() - frame_started)
+            if not self.first_frame_drawn:
+                self.first_frame_drawn = True
+                self.startup.lap("first_frame")
+                if self.exit_after_startup:
+                    self.root.after(50, self.finish_startup_profile)
+
+        self.schedule_next_frame()
+
+    def schedule_next_frame(self) -> None:
+        now = time.perf_counter()
+        self.next_frame_at += FRAME_INTERVAL
+        if self.next_frame_at < now - FRAME_INTERVAL:
+            self.next_frame_at = now
+        delay_ms = int((self.next_frame_at - now) * 1000.0)
+        self.root.after(max(1, delay_ms), self.loop)
+
+    def step_world(self, steps: int) -> None:
+        world = self.active_world
+        frame = FrameInput(self.keys, (self.mouse_x, self.mouse_y))
+        for _ in range(steps):
+            if self.recorder:
+                self.recorder.record(SIM_STEP, frame)
+            world.step(SIM_STEP, frame, self.profiler)
+            if world.finished:
+                break
+        self.profiler.call("render", world.render, self.scene)
+
+    def advance_frame(self, steps: int) -> None:
         if self.state == "title":
             self.draw_title()
         elif self.state == "menu":
             self.draw_menu()
         elif self.state == "briefing" and self.active_world:
-            self.active_world.draw_briefing(self.canvas)
+            self.active_world.draw_briefing(self.scene)
         elif self.state == "world" and self.active_world:
-            self.active_world.keys = self.keys
-            self.active_world.begin_frame()
-            self.active_world.tick_timer(dt)
             try:
-                self.active_world.update(
-                    dt,
-                    self.canvas,
-                    self.player,
-                    self.keys,
-                    (self.mouse_x, self.mouse_y),
-                )
+                self.step_world(steps)
             except Exception as error:
                 print(f"CRASH in {self.active_world.name}: {error}")
+                self.save_recording(crashed=True)
                 self.return_to_menu()
                 return
-            self.active_world.update_adaptive_guidance(dt, self.player, self.keys)
-            self.active_world.draw_adaptive_hint(self.canvas, self.player)
+            self.profiler.call("adaptive_hint", self.active_world.draw_adaptive_hint, self.scene, self.player)
 
             if self.active_world.finished:
-                self.active_world.grade = self.active_world.calculate_grade()
+                world = self.active_world
+                world.grade = world.calculate_grade()
+                self.save_system.record_run(
+                    self.active_key,
+                    world.grade,
+                    success=world.success,
+                    time_left=world.timer,
+                    duration=world.duration - world.timer,
+                    seed=self.session_seed,
+                    scores=world.run_scores(),
+                )
+                self.save_recording()
                 self.state = "result"
                 self.held_keys_to_ignore.update(self.keys)
         elif self.state == "result" and self.active_world:
-            self.active_world.draw(self.canvas, self.player)
+            self.active_world.render(self.scene)
         elif self.state == "help":
             self.draw_help()
         elif self.state == "about":
@@ -375,21 +445,19 @@ class GameEngine:
         elif self.state == "victory":
             self.draw_victory()
 
-        self.apply_viewport_transform()
-
         if self.debug_mode:
             self.draw_debug()
 
-        self.root.after(16, self.loop)
+        self.profiler.call("scene_flush", self.scene.end_frame)
 
     def draw_title(self) -> None:
-        self.canvas.delete("all")
+        self.scene.delete("all")
         for i in range(7):
             blend = i / 6
             red = int(4 + 28 * blend)
             green = int(17 + 55 * blend)
             blue = int(31 + 82 * blend)
-            self.canvas.create_rectangle(
+            self.scene.create_rectangle(
                 0,
                 i * HEIGHT / 7,
                 WIDTH,
@@ -400,7 +468,7 @@ class GameEngine:
 
         pulse = (math.sin(time.time() * 1.8) + 1.0) / 2.0
         orb_radius = 90 + pulse * 24
-        self.canvas.create_oval(
+        self.scene.create_oval(
             WIDTH - 270 - orb_radius,
             150 - orb_radius,
             WIDTH - 270 + orb_radius,
@@ -408,25 +476,25 @@ class GameEngine:
             fill="#13314f",
             outline="",
         )
-        self.canvas.create_oval(70, 340, 310, 580, fill="#102844", outline="")
+        self.scene.create_oval(70, 340, 310, 580, fill="#102844", outline="")
         panel_top = 64
         panel_bottom = HEIGHT - 58
-        self.canvas.create_rectangle(70, panel_top, WIDTH - 70, panel_bottom, fill="#08111d", outline="#3ca8d8", width=2)
-        self.canvas.create_rectangle(94, panel_top + 24, WIDTH - 94, panel_bottom - 24, fill="", outline="#163b5f", width=1)
+        self.scene.create_rectangle(70, panel_top, WIDTH - 70, panel_bottom, fill="#08111d", outline="#3ca8d8", width=2)
+        self.scene.create_rectangle(94, panel_top + 24, WIDTH - 94, panel_bottom - 24, fill="", outline="#163b5f", width=1)
 
         if self.logo_img:
-            self.canvas.create_image(WIDTH / 2, 144, image=self.logo_img)
+            self.scene.create_image(WIDTH / 2, 144, image=self.logo_img)
         else:
-            self.canvas.create_text(WIDTH / 2, 132, text="CAREER WORLDS", fill="#8ce1ff", font=("Helvetica", 34, "bold"))
+            self.scene.create_text(WIDTH / 2, 132, text="CAREER WORLDS", fill="#8ce1ff", font=("Helvetica", 34, "bold"))
 
-        self.canvas.create_text(
+        self.scene.create_text(
             WIDTH / 2,
             214,
             text="Arcade career trials with instant retries and persistent ranks",
             fill="#dbeeff",
             font=("Helvetica", 16, "bold"),
         )
-        self.canvas.create_text(
+        self.scene.create_text(
             WIDTH / 2,
             248,
             text="Master 17 professions, improve your grades, and move between worlds without menu friction.",
@@ -439,8 +507,8 @@ class GameEngine:
         self.draw_title_chip(740, 318, "Abort", "Esc")
 
         completed = self.save_system.get_completed_world_count()
-        self.canvas.create_rectangle(188, 366, WIDTH - 188, 406, fill="#0d1d31", outline="#21486b", width=1)
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(188, 366, WIDTH - 188, 406, fill="#0d1d31", outline="#21486b", width=1)
+        self.scene.create_rectangle(
             194,
             372,
             194 + ((WIDTH - 388) * completed / len(self.world_order)),
@@ -448,7 +516,7 @@ class GameEngine:
             fill="#4dd0e1",
             outline="",
         )
-        self.canvas.create_text(
+        self.scene.create_text(
             WIDTH / 2,
             386,
             text=f"Overall Progress  {completed}/{len(self.world_order)}",
@@ -457,15 +525,15 @@ class GameEngine:
         )
 
         cta_fill = "#f7c96a" if pulse > 0.45 else "#ffe2a3"
-        self.canvas.create_rectangle(WIDTH / 2 - 170, 442, WIDTH / 2 + 170, 490, fill=cta_fill, outline="")
-        self.canvas.create_text(
+        self.scene.create_rectangle(WIDTH / 2 - 170, 442, WIDTH / 2 + 170, 490, fill=cta_fill, outline="")
+        self.scene.create_text(
             WIDTH / 2,
             466,
             text="PRESS SPACE TO ENTER THE HUB",
             fill="#12202f",
             font=("Helvetica", 14, "bold"),
         )
-        self.canvas.create_text(
+        self.scene.create_text(
             WIDTH / 2,
             panel_bottom - 18,
             text="Direct selection keys still work in the hub for fast restarts.",
@@ -474,28 +542,55 @@ class GameEngine:
         )
 
         if self.save_system.integrity_error:
-            self.canvas.create_text(
+            self.scene.create_text(
                 WIDTH / 2,
                 panel_bottom + 2,
-                text="Save file signature mismatch detected. Progress was reset.",
+                text="Save signature mismatch detected. Tampered entries were quarantined.",
                 fill="#ff6b6b",
                 font=("Courier", 10),
             )
 
     def draw_title_chip(self, x: float, y: float, label: str, value: str) -> None:
-        self.canvas.create_rectangle(x - 92, y - 26, x + 92, y + 26, fill="#10253c", outline="#27577f", width=1)
-        self.canvas.create_text(x, y - 8, text=label, fill="#79d8ff", font=("Helvetica", 10, "bold"))
-        self.canvas.create_text(x, y + 10, text=value, fill="#eef7ff", font=("Helvetica", 11))
+        self.scene.create_rectangle(x - 92, y - 26, x + 92, y + 26, fill="#10253c", outline="#27577f", width=1)
+        self.scene.create_text(x, y - 8, text=label, fill="#79d8ff", font=("Helvetica", 10, "bold"))
+        self.scene.create_text(x, y + 10, text=value, fill="#eef7ff", font=("Helvetica", 11))
 
     def draw_debug(self) -> None:
         debug_text = f"FPS: {self.fps:02.1f}\nState: {self.state}\nPos: {self.player.x:01f}, {self.player.y:01f}"
-        self.canvas.create_text(10, HEIGHT - 10, anchor="sw", text=debug_text, fill="#00ff88", font=("Consolas", 10))
+        self.scene.create_text(10, HEIGHT - 10, anchor="sw", text=debug_text, fill="#00ff88", font=("Consolas", 10))
+
+        # Percentiles only need to move a couple of times per second.
+        if self.profile_refresh <= 0:
+            self.profile_lines = self.profiler.format_lines()
+            self.profile_refresh = 30
+        self.profile_refresh -= 1
+        height = 14 * len(self.profile_lines) + 12
+        self.scene.create_rectangle(6, HEIGHT - 66 - height, 262, HEIGHT - 60, fill="#05101a", outline="#00ff88")
+        self.scene.create_text(
+            12,
+            HEIGHT - 66,
+            anchor="sw",
+            text="\n".join(self.profile_lines),
+            fill="#00ff88",
+            font=("Consolas", 10),
+        )
 
-    def draw_victory(self) -> None:
-        self.canvas.delete("all")
+        canvas_lines = self.telemetry.format_lines()
+        height = 14 * len(canvas_lines) + 12
+        self.scene.create_rectangle(WIDTH - 322, HEIGHT - 6 - height, WIDTH - 6, HEIGHT - 6, fill="#05101a", outline="#00ff88")
+        self.scene.create_text(
+            WIDTH - 316,
+            HEIGHT - 12,
+            anchor="sw",
+            text="\n".join(canvas_lines),
+            fill="#00ff88",
+            font=("Consolas", 10),
+        )
+
+    def draw_victory_backdrop(self, canvas: Any) -> None:
         for i in range(6):
             shade = 18 + i * 8
-            self.canvas.create_rectangle(
+            canvas.create_rectangle(
                 0,
                 i * HEIGHT / 6,
                 WIDTH,
@@ -503,12 +598,15 @@ class GameEngine:
                 fill=f"#{shade:02x}{shade:02x}{(shade + 20):02x}",
                 outline="",
             )
+
+    def draw_victory(self) -> None:
+        self.scene.delete("all")
         panel_top = 72
         panel_bottom = HEIGHT - 62
-        self.canvas.create_rectangle(110, panel_top, WIDTH - 110, panel_bottom, fill="#111726", outline="#ffb86c", width=3)
-        self.canvas.create_text(WIDTH / 2, panel_top + 64, text="CAREER MASTER", fill="#ffcf7d", font=("Helvetica", 32, "bold"))
-        self.canvas.create_text(WIDTH / 2, panel_top + 112, text="Every profession cleared with a B rank or higher.", fill="#f5f7fb", font=("Helvetica", 14, "bold"))
-        self.canvas.create_text(
+        self.scene.create_rectangle(110, panel_top, WIDTH - 110, panel_bottom, fill="#111726", outline="#ffb86c", width=3)
+        self.scene.create_text(WIDTH / 2, panel_top + 64, text="CAREER MASTER", fill="#ffcf7d", font=("Helvetica", 32, "bold"))
+        self.scene.create_text(WIDTH / 2, panel_top + 112, text="Every profession cleared with a B rank or higher.", fill="#f5f7fb", font=("Helvetica", 14, "bold"))
+        self.scene.create_text(
             WIDTH / 2,
             panel_top + 184,
             text="You built enough consistency across every challenge to complete the full career tour.",
@@ -516,15 +614,15 @@ class GameEngine:
             font=("Helvetica", 13),
             width=540,
         )
-        self.canvas.create_rectangle(225, panel_bottom - 92, WIDTH - 225, panel_bottom - 38, fill="#172338", outline="#364a6a")
-        self.canvas.create_text(WIDTH / 2, panel_bottom - 65, text="Press SPACE to return to the hub", fill="#8ff0a4", font=("Helvetica", 14, "bold"))
+        self.scene.create_rectangle(225, panel_bottom - 92, WIDTH - 225, panel_bottom - 38, fill="#172338", outline="#364a6a")
+        self.scene.create_text(WIDTH / 2, panel_bottom - 65, text="Press SPACE to return to the hub", fill="#8ff0a4", font=("Helvetica", 14, "bold"))
 
     def draw_menu(self) -> None:
-        self.canvas.delete("all")
+        self.scene.delete("all")
         self.menu_card_bounds.clear()
 
         if self.high_contrast:
-            self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#000000", outline="")
+            self.scene.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#000000", outline="")
             header_fill = "#ffff00"
             sub_fill = "#ffffff"
             panel_fill = "#000000"
@@ -536,7 +634,7 @@ class GameEngine:
                 red = int(8 + 15 * blend)
                 green = int(18 + 36 * blend)
                 blue = int(32 + 55 * blend)
-                self.canvas.create_rectangle(
+                self.scene.create_rectangle(
                     0,
                     i * HEIGHT / 10,
                     WIDTH,
@@ -544,16 +642,16 @@ class GameEngine:
                     fill=f"#{red:02x}{green:02x}{blue:02x}",
                     outline="",
                 )
-            self.canvas.create_oval(-120, -40, 220, 300, fill="#12385b", outline="")
-            self.canvas.create_oval(WIDTH - 260, HEIGHT - 250, WIDTH + 70, HEIGHT + 60, fill="#0b2945", outline="")
+            self.scene.create_oval(-120, -40, 220, 300, fill="#12385b", outline="")
+            self.scene.create_oval(WIDTH - 260, HEIGHT - 250, WIDTH + 70, HEIGHT + 60, fill="#0b2945", outline="")
             header_fill = "#dff6ff"
             sub_fill = "#8ecae6"
             panel_fill = "#0a1421"
             panel_outline = "#1f4d75"
             accent_fill = "#4dd0e1"
 
-        self.canvas.create_text(48, 40, anchor="w", text="Career Worlds Hub", fill=header_fill, font=("Helvetica", 28, "bold"))
-        self.canvas.create_text(
+        self.scene.create_text(48, 40, anchor="w", text="Career Worlds Hub", fill=header_fill, font=("Helvetica", 28, "bold"))
+        self.scene.create_text(
             48,
             72,
             anchor="w",
@@ -564,18 +662,18 @@ class GameEngine:
 
         progress = self.save_system.get_completed_world_count()
         progress_ratio = progress / len(self.world_order)
-        self.canvas.create_text(48, 112, anchor="w", text=self.message, fill=header_fill, font=("Helvetica", 12, "bold"))
-        self.canvas.create_rectangle(48, 126, 390, 144, fill=panel_fill, outline=panel_outline)
-        self.canvas.create_rectangle(50, 128, 50 + 338 * progress_ratio, 142, fill=accent_fill, outline="")
-        self.canvas.create_text(402, 135, anchor="w", text=f"{int(progress_ratio * 100)}% cleared", fill=sub_fill, font=("Helvetica", 11))
+        self.scene.create_text(48, 112, anchor="w", text=self.message, fill=header_fill, font=("Helvetica", 12, "bold"))
+        self.scene.create_rectangle(48, 126, 390, 144, fill=panel_fill, outline=panel_outline)
+        self.scene.create_rectangle(50, 128, 50 + 338 * progress_ratio, 142, fill=accent_fill, outline="")
+        self.scene.create_text(402, 135, anchor="w", text=f"{int(progress_ratio * 100)}% cleared", fill=sub_fill, font=("Helvetica", 11))
 
         controls = [("Arrows", "move focus"), ("Enter", "launch"), ("H", "contrast"), ("?", "help"), ("A", "about/rationale")]
         for index, (control, label) in enumerate(controls):
             x1 = 510 + index * 82
             x2 = x1 + 74
-            self.canvas.create_rectangle(x1, 34, x2, 60, fill=panel_fill, outline=panel_outline, width=1)
-            self.canvas.create_text((x1 + x2) / 2, 44, text=control, fill=header_fill, font=("Helvetica", 8, "bold"))
-            self.canvas.create_text((x1 + x2) / 2, 53, text=label, fill=sub_fill, font=("Helvetica", 7))
+            self.scene.create_rectangle(x1, 34, x2, 60, fill=panel_fill, outline=panel_outline, width=1)
+            self.scene.create_text((x1 + x2) / 2, 44, text=control, fill=header_fill, font=("Helvetica", 8, "bold"))
+            self.scene.create_text((x1 + x2) / 2, 53, text=label, fill=sub_fill, font=("Helvetica", 7))
 
         grid_x = 44
         grid_y = 182
@@ -592,14 +690,14 @@ class GameEngine:
             y2 = y1 + card_h
             self.menu_card_bounds[key] = (x1, y1, x2, y2)
 
-            world = self.worlds[key]
+            spec = WORLD_SPECS[key]
             grade = self.save_system.get_grade(key)
             is_selected = index == self.selected_world_index
             is_hovered = x1 <= self.mouse_x <= x2 and y1 <= self.mouse_y <= y2
-            self.draw_world_card(x1, y1, x2, y2, key, world, grade, is_selected, is_hovered)
+            self.draw_world_card(x1, y1, x2, y2, key, spec, grade, is_selected, is_hovered)
 
         self.draw_selected_world_panel(panel_fill, panel_outline, header_fill, sub_fill, accent_fill)
-        self.canvas.create_text(
+        self.scene.create_text(
             WIDTH / 2,
             HEIGHT - 14,
             text="Completed cards retain your best grade. Direct hotkeys still work: 1-0, Q-U.",
@@ -614,7 +712,7 @@ class GameEngine:
         x2: float,
         y2: float,
         key: str,
-        world: BaseWorld,
+        spec: WorldSpec,
         grade: str | None,
         is_selected: bool,
         is_hovered: bool,
@@ -633,21 +731,21 @@ class GameEngine:
         grade_color = self.get_grade_color(grade)
         outline = "#ffffff" if self.high_contrast and is_selected else grade_color
         width = 3 if is_selected else 1
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, width=width)
+        self.scene.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, width=width)
         if is_selected and not self.high_contrast:
-            self.canvas.create_rectangle(x1 + 4, y1 + 4, x2 - 4, y2 - 4, outline="#65d6ff", width=1)
+            self.scene.create_rectangle(x1 + 4, y1 + 4, x2 - 4, y2 - 4, outline="#65d6ff", width=1)
 
-        self.canvas.create_text(x1 + 12, y1 + 13, anchor="nw", text=f"[{key.upper()}]", fill=muted, font=("Helvetica", 10, "bold"))
-        self.canvas.create_text(
+        self.scene.create_text(x1 + 12, y1 + 13, anchor="nw", text=f"[{key.upper()}]", fill=muted, font=("Helvetica", 10, "bold"))
+        self.scene.create_text(
             x1 + 12,
             y1 + 24,
             anchor="nw",
-            text=world.name,
+            text=spec.name,
             fill=text_fill,
             font=("Helvetica", 9, "bold"),
             width=x2 - x1 - 24,
         )
-        self.canvas.create_text(
+        self.scene.create_text(
             x1 + 12,
             y2 - 12,
             anchor="w",
@@ -665,31 +763,42 @@ class GameEngine:
         accent_fill: str,
     ) -> None:
         key = self.get_selected_key()
-        world = self.worlds[key]
+        spec = WORLD_SPECS[key]
         grade = self.save_system.get_grade(key)
-        completed = world.name in self.save_system.get_completed_worlds()
+        completed = spec.name in self.save_system.get_completed_worlds()
 
         x1, y1, x2, y2 = 640, 102, 920, 542
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=panel_fill, outline=panel_outline, width=2)
-        self.canvas.create_text(x1 + 20, y1 + 24, anchor="w", text="Selected World", fill=sub_fill, font=("Helvetica", 10, "bold"))
-        self.canvas.create_text(x1 + 20, y1 + 52, anchor="w", text=world.name, fill=header_fill, font=("Helvetica", 18, "bold"), width=220)
+        self.scene.create_rectangle(x1, y1, x2, y2, fill=panel_fill, outline=panel_outline, width=2)
+        self.scene.create_text(x1 + 20, y1 + 24, anchor="w", text="Selected World", fill=sub_fill, font=("Helvetica", 10, "bold"))
+        self.scene.create_text(x1 + 20, y1 + 52, anchor="w", text=spec.name, fill=header_fill, font=("Helvetica", 18, "bold"), width=220)
 
         badge_fill = "#1b3d24" if completed and not self.high_contrast else panel_fill
         badge_outline = "#7cf29a" if completed and not self.high_contrast else panel_outline
-        self.canvas.create_rectangle(x1 + 20, y1 + 110, x1 + 118, y1 + 140, fill=badge_fill, outline=badge_outline)
-        self.canvas.create_text(
+        self.scene.create_rectangle(x1 + 20, y1 + 110, x1 + 118, y1 + 140, fill=badge_fill, outline=badge_outline)
+        self.scene.create_text(
             x1 + 69,
             y1 + 125,
             text="Cleared" if completed else "Uncleared",
             fill=accent_fill if not completed else "#7cf29a",
             font=("Helvetica", 10, "bold"),
         )
-        self.canvas.create_text(x1 + 145, y1 + 125, anchor="w", text=f"Best Rank: {grade or '-'}", fill=header_fill, font=("Helvetica", 11, "bold"))
-        self.canvas.create_text(
+        self.scene.create_text(x1 + 145, y1 + 125, anchor="w", text=f"Best Rank: {grade or '-'}", fill=header_fill, font=("Helvetica", 11, "bold"))
+        stats = self.save_system.get_run_stats(key)
+        if stats.attempts:
+            best_time = f"{stats.best_time:.1f}s" if stats.best_time is not None else "-"
+            self.scene.create_text(
+                x1 + 20,
+                y1 + 152,
+                anchor="w",
+                text=f"Runs: {stats.attempts}   Avg Rank: {stats.average_rank}   Best Time: {best_time}",
+                fill=sub_fill,
+                font=("Helvetica", 9, "bold"),
+            )
+        self.scene.create_text(
             x1 + 20,
             y1 + 168,
             anchor="nw",
-            text=world.summary,
+            text=spec.summary,
             fill=header_fill if self.high_contrast else "#d7e7f5",
             font=("Helvetica", 11),
             width=230,
@@ -702,13 +811,13 @@ class GameEngine:
             "Hover any card to update this panel",
         ]
         panel_y = y1 + 258
-        self.canvas.create_text(x1 + 20, panel_y, anchor="w", text="Quick Actions", fill=sub_fill, font=("Helvetica", 10, "bold"))
+        self.scene.create_text(x1 + 20, panel_y, anchor="w", text="Quick Actions", fill=sub_fill, font=("Helvetica", 10, "bold"))
         for hint in hints:
             panel_y += 24
-            self.canvas.create_text(x1 + 20, panel_y, anchor="w", text=f"- {hint}", fill=header_fill, font=("Helvetica", 10), width=225)
+            self.scene.create_text(x1 + 20, panel_y, anchor="w", text=f"- {hint}", fill=header_fill, font=("Helvetica", 10), width=225)
 
-        self.canvas.create_rectangle(x1 + 20, y2 - 64, x2 - 20, y2 - 20, fill=accent_fill, outline="")
-        self.canvas.create_text((x1 + x2) / 2, y2 - 42, text="Press Enter To Start", fill="#08111d", font=("Helvetica", 13, "bold"))
+        self.scene.create_rectangle(x1 + 20, y2 - 64, x2 - 20, y2 - 20, fill=accent_fill, outline="")
+        self.scene.create_text((x1 + x2) / 2, y2 - 42, text="Press Enter To Start", fill="#08111d", font=("Helvetica", 13, "bold"))
 
     def get_grade_color(self, grade: str | None) -> str:
         palette = {"S": "#7cf29a", "A": "#67d7ff", "B": "#f5d76e", "C": "#ff9e57", "-": "#4d657d"}
@@ -717,13 +826,13 @@ class GameEngine:
         return palette.get(grade or "-", "#4d657d")
 
     def draw_help(self) -> None:
-        self.canvas.delete("all")
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#07111b", outline="")
+        self.scene.delete("all")
+        self.scene.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#07111b", outline="")
         panel_top = 30
         panel_bottom = HEIGHT - 34
-        self.canvas.create_rectangle(42, panel_top, WIDTH - 42, panel_bottom, fill="#0d1724", outline="#2a587d", width=2)
-        self.canvas.create_text(WIDTH / 2, panel_top + 38, text="How To Navigate Career Worlds", fill="#dff6ff", font=("Helvetica", 24, "bold"))
-        self.canvas.create_text(
+        self.scene.create_rectangle(42, panel_top, WIDTH - 42, panel_bottom, fill="#0d1724", outline="#2a587d", width=2)
+        self.scene.create_text(WIDTH / 2, panel_top + 38, text="How To Navigate Career Worlds", fill="#dff6ff", font=("Helvetica", 24, "bold"))
+        self.scene.create_text(
             WIDTH / 2,
             panel_top + 68,
             text="Everything important is reachable by keyboard, with the mouse only adding faster browsing.",
@@ -733,10 +842,10 @@ class GameEngine:
 
         left_x1, left_x2 = 82, 440
         right_x1, right_x2 = 510, 878
-        self.canvas.create_rectangle(left_x1, 130, left_x2, 454, fill="#101d2c", outline="#284f74")
-        self.canvas.create_rectangle(right_x1, 130, right_x2, 454, fill="#101d2c", outline="#284f74")
+        self.scene.create_rectangle(left_x1, 130, left_x2, 454, fill="#101d2c", outline="#284f74")
+        self.scene.create_rectangle(right_x1, 130, right_x2, 454, fill="#101d2c", outline="#284f74")
 
-        self.canvas.create_text(left_x1 + 18, 158, anchor="w", text="Controls", fill="#7cd7ff", font=("Helvetica", 16, "bold"))
+        self.scene.create_text(left_x1 + 18, 158, anchor="w", text="Controls", fill="#7cd7ff", font=("Helvetica", 16, "bold"))
         controls = [
             "WASD / Arrows: move in worlds",
             "Arrow keys in hub: move focus",
@@ -749,10 +858,10 @@ class GameEngine:
         ]
         y = 192
         for line in controls:
-            self.canvas.create_text(left_x1 + 18, y, anchor="w", text=f"- {line}", fill="#eef7ff", font=("Helvetica", 12), width=320)
+            self.scene.create_text(left_x1 + 18, y, anchor="w", text=f"- {line}", fill="#eef7ff", font=("Helvetica", 12), width=320)
             y += 28
 
-        self.canvas.create_text(right_x1 + 18, 158, anchor="w", text="Flow", fill="#7cd7ff", font=("Helvetica", 16, "bold"))
+        self.scene.create_text(right_x1 + 18, 158, anchor="w", text="Flow", fill="#7cd7ff", font=("Helvetica", 16, "bold"))
         flow = [
             "1. Start from the title screen.",
             "2. Pick a profession from the hub.",
@@ -763,21 +872,21 @@ class GameEngine:
         ]
         y = 192
         for line in flow:
-            self.canvas.create_text(right_x1 + 18, y, anchor="w", text=line, fill="#eef7ff", font=("Helvetica", 12), width=320)
+            self.scene.create_text(right_x1 + 18, y, anchor="w", text=line, fill="#eef7ff", font=("Helvetica", 12), width=320)
             y += 34
 
-        self.canvas.create_rectangle(220, panel_bottom - 56, WIDTH - 220, panel_bottom - 10, fill="#4dd0e1", outline="")
-        self.canvas.create_text(WIDTH / 2, panel_bottom - 33, text="Press ESC To Return To The Hub", fill="#07111b", font=("Helvetica", 13, "bold"))
+        self.scene.create_rectangle(220, panel_bottom - 56, WIDTH - 220, panel_bottom - 10, fill="#4dd0e1", outline="")
+        self.scene.create_text(WIDTH / 2, panel_bottom - 33, text="Press ESC To Return To The Hub", fill="#07111b", font=("Helvetica", 13, "bold"))
 
     def draw_about(self) -> None:
-        self.canvas.delete("all")
-        self.canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#040b14", outline="")
+        self.scene.delete("all")
+        self.scene.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#040b14", outline="")
         panel_top = 24
         panel_bottom = HEIGHT - 28
-        self.canvas.create_rectangle(32, panel_top, WIDTH - 32, panel_bottom, fill="#0a1421", outline="#30506c", width=2)
+        self.scene.create_rectangle(32, panel_top, WIDTH - 32, panel_bottom, fill="#0a1421", outline="#30506c", width=2)
         
-        self.canvas.create_text(WIDTH / 2, panel_top + 40, text="Design Rationale & Technical Report", fill="#dff6ff", font=("Helvetica", 24, "bold"))
-        self.canvas.create_text(WIDTH / 2, panel_top + 70, text="FBLA 2025-2026 Competitive Event: 'Career Quest'", fill="#8ecae6", font=("Helvetica", 12, "italic"))
+        self.scene.create_text(WIDTH / 2, panel_top + 40, text="Design Rationale & Technical Report", fill="#dff6ff", font=("Helvetica", 24, "bold"))
+        self.scene.create_text(WIDTH / 2, panel_top + 70, text="FBLA 2025-2026 Competitive Event: 'Career Quest'", fill="#8ecae6", font=("Helvetica", 12, "italic"))
 
         y = 105
         sections = [
@@ -789,12 +898,12 @@ class GameEngine:
         ]
         
         for title, body in sections:
-            self.canvas.create_text(58, y, anchor="nw", text=title, fill="#4dd0e1", font=("Helvetica", 14, "bold"))
-            self.canvas.create_text(58, y + 26, anchor="nw", text=body, fill="#eef7ff", font=("Helvetica", 11), width=WIDTH - 116)
+            self.scene.create_text(58, y, anchor="nw", text=title, fill="#4dd0e1", font=("Helvetica", 14, "bold"))
+            self.scene.create_text(58, y + 26, anchor="nw", text=body, fill="#eef7ff", font=("Helvetica", 11), width=WIDTH - 116)
             y += 82
 
-        self.canvas.create_rectangle(WIDTH / 2 - 160, panel_bottom - 58, WIDTH / 2 + 160, panel_bottom - 18, fill="#4dd0e1", outline="")
-        self.canvas.create_text(WIDTH / 2, panel_bottom - 38, text="Press ESC To Return To The Hub", fill="#07111b", font=("Helvetica", 13, "bold"))
+        self.scene.create_rectangle(WIDTH / 2 - 160, panel_bottom - 58, WIDTH / 2 + 160, panel_bottom - 18, fill="#4dd0e1", outline="")
+        self.scene.create_text(WIDTH / 2, panel_bottom - 38, text="Press ESC To Return To The Hub", fill="#07111b", font=("Helvetica", 13, "bold"))
 
     def start_music(self) -> None:
         try:
@@ -802,31 +911,57 @@ class GameEngine:
             if not os.path.exists(music_path):
                 print(f"Music file not found: {music_path}")
                 return
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.play(-1)
+            self.audio.play(music_path)
         except Exception as error:
             print(f"Error playing music: {error}")
 
     def stop_music(self) -> None:
+        self.audio.stop()
+
+    def export_profile(self) -> None:
+        if not self.profiler.samples:
+            return
+        folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "profiles"))
+        stamp = time.strftime("%Y%m%d-%H%M%S")
         try:
-            pygame.mixer.music.stop()
-        except Exception as error:
-            print(f"Error stopping music: {error}")
+            for ext in ("json", "csv"):
+                self.profiler.export(os.path.join(folder, f"frame-phases-{stamp}.{ext}"))
+            if self.telemetry.frames:
+                self.telemetry.dump(os.path.join(folder, f"canvas-calls-{stamp}.json"))
+            print(f"Frame phase profile saved to {folder}")
+        except OSError as error:
+            print(f"Could not save frame phase profile: {error}")
+
+    def finish_startup_profile(self, waited: float = 0.0) -> None:
+        # Give the background mixer a moment so its cost is reported too.
+        if self.audio.state == "loading" and waited < 10.0:
+            self.root.after(50, self.finish_startup_profile, waited + 0.05)
+            return
+        if self.audio.init_seconds is not None:
+            self.startup.add_background("mixer_init", self.audio.init_seconds)
+        self.shutdown()
 
     def on_closing(self) -> None:
+        # The profiler always runs for the F3 overlay; only write it out when someone is looking.
+        if self.profile_frames or self.debug_mode:
+            self.export_profile()
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Flush settings, stop the save writer and audio, then close the window."""
         self.save_system.set_setting("high_contrast", self.high_contrast, save_immediately=False)
         self.save_system.set_setting("music_on", self.music_on, save_immediately=False)
         self.save_system.save()
+        self.save_system.close()
         self.stop_music()
-        try:
-            pygame.mixer.quit()
-        except Exception:
-            pass
+        self.audio.shutdown()
         self.root.destroy()
 
     def run(self) -> None:
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
+        self.next_frame_at = self.last_time
         if self.music_on:
             self.start_music()
         self.loop()
+        self.root.after_idle(self.audio.start)
         self.root.mainloop()
@@ -0,0 +1,167 @@
+"""Run worlds without a display.
+
+    python -m src.headless --world all --seconds 60 --policy random
+"""
+
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.player import Player
+from src.scene import NullCanvas
+from src.utils import HEIGHT, SIM_STEP, WIDTH
+from src.worlds.base import BaseWorld, FrameInput
+from src.worlds.registry import WORLD_ORDER, WORLD_SPECS, create_world
+
+InputPolicy = Callable[[BaseWorld, Player, int], FrameInput]
+
+MOVE_KEYS = ("w", "a", "s", "d", "Up", "Down", "Left", "Right")
+ACTION_KEYS = ("space", "Return", "BackSpace", "e", "f", "r", "1", "2", "3", "4", "5")
+
+
+@dataclass
+class HeadlessReport:
+    world_key: str
+    world_name: str
+    ticks: int
+    seed: int
+    sim_seconds: float
+    wall_seconds: float
+    finished: bool
+    success: bool
+    grade: str
+    message: str
+    time_remaining: float
+    scores: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.wall_seconds <= 0.0:
+            return float("inf")
+        return self.ticks / self.wall_seconds
+
+
+def idle_policy(world: BaseWorld, player: Player, tick: int) -> FrameInput:
+    return FrameInput(set(), (WIDTH / 2, HEIGHT / 2))
+
+
+def scripted_policy(script: list[tuple[float, set[str]]]) -> InputPolicy:
+    """Hold each key set from its start time (in seconds) until the next entry begins."""
+    timeline = sorted(script, key=lambda entry: entry[0])
+
+    def policy(world: BaseWorld, player: Player, tick: int) -> FrameInput:
+        now = tick * SIM_STEP
+        held: set[str] = set()
+        for start, keys in timeline:
+            if start > now:
+                break
+            held = keys
+        return FrameInput(set(held), (player.x, player.y))
+
+    return policy
+
+
+def random_policy(rng: random.Random, hold_ticks: int = 12) -> InputPolicy:
+    """Hold a random direction, sometimes with an action key, re-rolled every hold_ticks."""
+    current: dict[str, object] = {"keys": set(), "mouse": (WIDTH / 2, HEIGHT / 2)}
+
+    def policy(world: BaseWorld, player: Player, tick: int) -> FrameInput:
+        if tick % hold_ticks == 0:
+            keys = {rng.choice(MOVE_KEYS)}
+            if rng.random() < 0.5:
+                keys.add(rng.choice(ACTION_KEYS))
+            current["keys"] = keys
+            current["mouse"] = (rng.uniform(0.0, WIDTH), rng.uniform(0.0, HEIGHT))
+        return FrameInput(set(current["keys"]), current["mouse"])
+
+    return policy
+
+
+POLICY_NAMES = ("idle", "random")
+
+
+def make_policy(name: str, rng: random.Random) -> InputPolicy:
+    if name == "idle":
+        return idle_policy
+    if name == "random":
+        return random_policy(rng)
+    raise ValueError(f"unknown input policy: {name}")
+
+
+def run_world(
+    key: str,
+    seconds: float,
+    policy: InputPolicy | None = None,
+    *,
+    seed: int | None = None,
+    render: bool = False,
+    stop_when_finished: bool = True,
+) -> HeadlessReport:
+    world = create_world(key)
+    player = Player()
+    canvas = NullCanvas()
+    policy = policy or idle_policy
+
+    seed = world.seed_rng(seed)
+    world.reset(player)
+    world.start_session(player)
+    total_ticks = int(round(seconds / SIM_STEP))
+    ticks = 0
+    started = time.perf_counter()
+    while ticks < total_ticks:
+        world.step(SIM_STEP, policy(world, player, ticks))
+        ticks += 1
+        if render:
+            world.render(canvas)
+            world.draw_adaptive_hint(canvas, player)
+        if world.finished and stop_when_finished:
+            break
+    wall_seconds = time.perf_counter() - started
+
+    if world.finished:
+        world.grade = world.calculate_grade()
+    return HeadlessReport(
+        world_key=key,
+        world_name=world.name,
+        ticks=ticks,
+        seed=seed,
+        sim_seconds=ticks * SIM_STEP,
+        wall_seconds=wall_seconds,
+        finished=world.finished,
+        success=world.success,
+        grade=world.grade,
+        message=world.message,
+        time_remaining=world.timer,
+        scores=world.run_scores(),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Soak-test worlds without a display.")
+    parser.add_argument("--world", default="all", help="hub key (1-0, q-u) or 'all'")
+    parser.add_argument("--seconds", type=float, default=60.0, help="simulated seconds per world")
+    parser.add_argument("--policy", choices=POLICY_NAMES, default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--render", action="store_true", help="also run every draw call into a null canvas")
+    args = parser.parse_args(argv)
+
+    keys = WORLD_ORDER if args.world == "all" else [args.world.lower()]
+    for key in keys:
+        if key not in WORLD_SPECS:
+            parser.error(f"unknown world key: {key}")
+
+    print(f"{'key':<4}{'world':<28}{'ticks':>8}{'sim s':>9}{'ticks/s':>11}  grade  result")
+    for key in keys:
+        policy = make_policy(args.policy, random.Random(args.seed))
+        report = run_world(key, args.seconds, policy, seed=args.seed, render=args.render)
+        result = "running" if not report.finished else ("success" if report.success else "failed")
+        print(
+            f"{key:<4}{report.world_name[:27]:<28}{report.ticks:>8}{report.sim_seconds:>9.1f}"
+            f"{report.ticks_per_second:>11.0f}  {report.grade:<5}  {result}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import csv
+import json
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Callable
+
+PHASE_WINDOW = 600
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class NullProfiler:
+    """Stand-in that runs phases untimed, so callers never branch on profiling."""
+
+    def call(self, phase: str, func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    def add(self, phase: str, seconds: float) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class PhaseProfiler(NullProfiler):
+    """Rolling per-phase timings in milliseconds, kept for the last PHASE_WINDOW samples."""
+
+    def __init__(self, window: int = PHASE_WINDOW) -> None:
+        self.window = window
+        self.samples: dict[str, deque[float]] = {}
+        self.totals: dict[str, tuple[int, float]] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        ms = seconds * 1000.0
+        bucket = self.samples.get(phase)
+        if bucket is None:
+            bucket = self.samples[phase] = deque(maxlen=self.window)
+        bucket.append(ms)
+        count, total = self.totals.get(phase, (0, 0.0))
+        self.totals[phase] = (count + 1, total + ms)
+
+    def call(self, phase: str, func: Callable[..., Any], *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.add(phase, time.perf_counter() - started)
+
+    def summary(self) -> list[dict[str, Any]]:
+        rows = []
+        for phase, bucket in self.samples.items():
+            ordered = sorted(bucket)
+            count, total = self.totals[phase]
+            row: dict[str, Any] = {"phase": phase, "samples": count, "mean_ms": total / count}
+            for pct in PERCENTILES:
+                row[f"p{pct}_ms"] = percentile(ordered, pct)
+            row["max_ms"] = ordered[-1]
+            rows.append(row)
+        return rows
+
+    def format_lines(self) -> list[str]:
+        lines = [f"{'phase':<16}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for row in self.summary():
+            lines.append(f"{row['phase']:<16}{row['p50_ms']:>7.2f}{row['p95_ms']:>7.2f}{row['p99_ms']:>7.2f}")
+        return lines
+
+    def export(self, path: str) -> str:
+        """Write the current summary as CSV or JSON, picked by the file extension."""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        rows = self.summary()
+        if path.endswith(".csv"):
+            fields = ["phase", "samples", "mean_ms", *(f"p{pct}_ms" for pct in PERCENTILES), "max_ms"]
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"window": self.window, "phases": rows}, file, indent=2)
+        return path
+
+
+class StartupTimer:
+    """Wall-clock laps from process start to the first rendered frame."""
+
+    def __init__(self, started: float | None = None) -> None:
+        self.started = time.perf_counter() if started is None else started
+        self.last = self.started
+        self.phases: list[tuple[str, float]] = []
+        self.background: list[tuple[str, float]] = []
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def add_background(self, phase: str, seconds: float) -> None:
+        """Record work that runs off the UI thread and so is not on the critical path."""
+        self.background.append((phase, seconds))
+
+    @property
+    def total_ms(self) -> float:
+        return (self.last - self.started) * 1000.0
+
+    def format_lines(self, budget_ms: float | None = None) -> list[str]:
+        lines = [f"{'startup phase':<24}{'ms':>9}"]
+        for phase, seconds in self.phases:
+            lines.append(f"{phase:<24}{seconds * 1000.0:>9.1f}")
+        lines.append(f"{'total to first frame':<24}{self.total_ms:>9.1f}")
+        for phase, seconds in self.background:
+            lines.append(f"{phase + ' (background)':<24}{seconds * 1000.0:>9.1f}")
+        if budget_ms is not None:
+            verdict = "within" if self.total_ms <= budget_ms else "OVER"
+            lines.append(f"{verdict} budget of {budget_ms:.0f} ms")
+        return lines
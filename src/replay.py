@@ -0,0 +1,229 @@
+"""Record a world session's per-tick input and play it back without a human.
+
+    python -m src.replay replays/crash-7-20260101-120000.cwr --render
+
+A log holds the world key, its RNG seed, the player's starting state and one
+record per simulation tick. Each tick stores only what changed since the
+previous one (key set, mouse position, dt), so an idle second costs 60 bytes.
+"""
+
+import argparse
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+
+from src.headless import HeadlessReport
+from src.player import Player
+from src.scene import NullCanvas
+from src.utils import SIM_STEP
+from src.worlds.base import FrameInput
+from src.worlds.registry import create_world
+
+MAGIC = b"CWRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHIdI")
+PLAYER_STATE = struct.Struct("<5d")
+MOUSE = struct.Struct("<dd")
+DT = struct.Struct("<d")
+
+TICK_DT = 1
+TICK_MOUSE = 2
+TICK_KEYS = 4
+
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "replays")
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return bytes((len(raw),)) + raw
+
+
+def _read_str(data: bytes, offset: int) -> tuple[str, int]:
+    length = data[offset]
+    start = offset + 1
+    return data[start:start + length].decode("utf-8"), start + length
+
+
+@dataclass
+class Replay:
+    world_key: str
+    seed: int
+    step: float = SIM_STEP
+    player_state: tuple[float, float, float, float, float] = (0.0, 0.0, 0.0, 0.0, 0.0)
+    ticks: list[tuple[float, FrameInput]] = field(default_factory=list)
+
+    def to_bytes(self) -> bytes:
+        vocab: dict[str, int] = {}
+        body = bytearray()
+        last_keys: frozenset[str] = frozenset()
+        last_mouse = (0.0, 0.0)
+        for dt, frame in self.ticks:
+            keys = frozenset(frame.keys)
+            mouse = (float(frame.mouse_pos[0]), float(frame.mouse_pos[1]))
+            flags = 0
+            payload = bytearray()
+            if dt != self.step:
+                flags |= TICK_DT
+                payload += DT.pack(dt)
+            if mouse != last_mouse:
+                flags |= TICK_MOUSE
+                payload += MOUSE.pack(*mouse)
+                last_mouse = mouse
+            if keys != last_keys:
+                flags |= TICK_KEYS
+                indices = [vocab.setdefault(key, len(vocab)) for key in sorted(keys)]
+                payload.append(len(indices))
+                payload += bytes(indices)
+                last_keys = keys
+            body.append(flags)
+            body += payload
+        if len(vocab) > 255:
+            raise ValueError("replay logs hold at most 255 distinct key names")
+
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.step, len(self.ticks)))
+        out += _pack_str(self.world_key)
+        out += PLAYER_STATE.pack(*self.player_state)
+        out.append(len(vocab))
+        for key in vocab:
+            out += _pack_str(key)
+        out += body
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        magic, version, seed, step, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a replay log")
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        offset = HEADER.size
+        world_key, offset = _read_str(data, offset)
+        player_state = PLAYER_STATE.unpack_from(data, offset)
+        offset += PLAYER_STATE.size
+        vocab: list[str] = []
+        vocab_size = data[offset]
+        offset += 1
+        for _ in range(vocab_size):
+            key, offset = _read_str(data, offset)
+            vocab.append(key)
+
+        ticks: list[tuple[float, FrameInput]] = []
+        keys: frozenset[str] = frozenset()
+        mouse = (0.0, 0.0)
+        for _ in range(count):
+            flags = data[offset]
+            offset += 1
+            dt = step
+            if flags & TICK_DT:
+                (dt,) = DT.unpack_from(data, offset)
+                offset += DT.size
+            if flags & TICK_MOUSE:
+                mouse = MOUSE.unpack_from(data, offset)
+                offset += MOUSE.size
+            if flags & TICK_KEYS:
+                length = data[offset]
+                keys = frozenset(vocab[index] for index in data[offset + 1:offset + 1 + length])
+                offset += 1 + length
+            ticks.append((dt, FrameInput(set(keys), mouse)))
+        return cls(world_key, seed, step, player_state, ticks)
+
+    def save(self, path: str) -> str:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class InputRecorder:
+    """Collects the exact input each simulation tick of one session received."""
+
+    def __init__(self, world_key: str, seed: int, player: Player, step: float = SIM_STEP) -> None:
+        self.replay = Replay(
+            world_key,
+            seed,
+            step,
+            (player.x, player.y, player.vx, player.vy, player.speed),
+        )
+
+    def record(self, dt: float, frame: FrameInput) -> None:
+        # The engine hands worlds its live key set, so snapshot it per tick.
+        self.replay.ticks.append((dt, FrameInput(set(frame.keys), frame.mouse_pos)))
+
+    def save(self, name: str) -> str:
+        return self.replay.save(os.path.join(REPLAY_DIR, name))
+
+
+def play_replay(replay: Replay, *, render: bool = False) -> HeadlessReport:
+    """Feed a log back through the world at full speed; a crash names its tick."""
+    world = create_world(replay.world_key)
+    player = Player()
+    canvas = NullCanvas()
+
+    world.seed_rng(replay.seed)
+    world.reset(player)
+    world.start_session(player)
+    world.clear_input_state()
+    player.x, player.y, player.vx, player.vy, player.speed = replay.player_state
+
+    tick = 0
+    started = time.perf_counter()
+    sim_seconds = 0.0
+    for dt, frame in replay.ticks:
+        try:
+            world.step(dt, frame)
+            if render:
+                world.render(canvas)
+                world.draw_adaptive_hint(canvas, player)
+        except Exception as error:
+            error.add_note(f"replay of world {replay.world_key} (seed {replay.seed}) failed at tick {tick}")
+            raise
+        tick += 1
+        sim_seconds += dt
+        if world.finished:
+            break
+    wall_seconds = time.perf_counter() - started
+
+    if world.finished:
+        world.grade = world.calculate_grade()
+    return HeadlessReport(
+        world_key=replay.world_key,
+        world_name=world.name,
+        ticks=tick,
+        seed=replay.seed,
+        sim_seconds=sim_seconds,
+        wall_seconds=wall_seconds,
+        finished=world.finished,
+        success=world.success,
+        grade=world.grade,
+        message=world.message,
+        time_remaining=world.timer,
+        scores=world.run_scores(),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded session without a display.")
+    parser.add_argument("path", help="replay log written by the game")
+    parser.add_argument("--render", action="store_true", help="also run every draw call into a null canvas")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    print(f"world {replay.world_key}, seed {replay.seed}, {len(replay.ticks)} ticks")
+    report = play_replay(replay, render=args.render)
+    result = "running" if not report.finished else ("success" if report.success else "failed")
+    print(
+        f"{report.world_name}: {report.ticks} ticks in {report.wall_seconds:.2f}s "
+        f"({report.ticks_per_second:.0f} ticks/s), grade {report.grade}, {result}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Serializers for a whole-profile save snapshot, plus a size/speed benchmark.
+
+    python -m src.save_format --runs 5000
+
+A snapshot is the dict ``SaveSystem.snapshot`` builds: settings, progress
+and the run journal. ``json`` is the original double-encoded layout, a signed
+JSON string inside a JSON wrapper. ``binary`` is a versioned ``struct``
+layout: a string table, fixed-size run records that refer to it by index,
+and a raw HMAC-SHA256 trailer over everything before it.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import random
+import struct
+import tempfile
+import time
+from typing import Any
+
+FORMATS = ("json", "binary")
+DEFAULT_FORMAT = "json"
+
+MAGIC = b"CWSV"
+VERSION = 2
+HEADER = struct.Struct("<4sHI")
+COUNT = struct.Struct("<I")
+PAIR = struct.Struct("<HH")
+RUN = struct.Struct("<HHBdddqB")
+SCORE_V1 = struct.Struct("<Hd")
+# Name index, type tag, then the value as an int64 or a float64.
+SCORE_TAG = struct.Struct("<HB")
+SCORE_INT = struct.Struct("<HBq")
+SCORE_FLOAT = struct.Struct("<HBd")
+TAG_INT = 0
+TAG_FLOAT = 1
+DIGEST_SIZE = hashlib.sha256().digest_size
+NO_SEED = -1
+
+
+class SaveFormatError(ValueError):
+    """The data is not a snapshot in the expected format, or its signature does not match."""
+
+
+def _signature(key: bytes, data: bytes) -> bytes:
+    return hmac.new(key, data, hashlib.sha256).digest()
+
+
+def dumps_json(snapshot: dict[str, Any], key: bytes) -> bytes:
+    payload = json.dumps(snapshot, sort_keys=True)
+    signature = _signature(key, payload.encode()).hex()
+    return json.dumps({"payload": payload, "signature": signature}).encode("utf-8")
+
+
+def loads_json(data: bytes, key: bytes) -> dict[str, Any]:
+    try:
+        wrapper = json.loads(data)
+        payload = wrapper["payload"]
+        signature = wrapper["signature"]
+    except (ValueError, KeyError, TypeError) as error:
+        raise SaveFormatError(f"not a JSON save: {error}") from error
+    if not hmac.compare_digest(_signature(key, payload.encode()).hex(), signature):
+        raise SaveFormatError("signature mismatch")
+    return json.loads(payload)
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return struct.pack("<H", len(raw)) + raw
+
+
+def _read_str(data: bytes, offset: int) -> tuple[str, int]:
+    (length,) = struct.unpack_from("<H", data, offset)
+    start = offset + 2
+    return data[start:start + length].decode("utf-8"), start + length
+
+
+def dumps_binary(snapshot: dict[str, Any], key: bytes) -> bytes:
+    strings: dict[str, int] = {}
+
+    def index(text: str) -> int:
+        return strings.setdefault(text, len(strings))
+
+    progress = snapshot["progress"]
+    body = bytearray()
+    body += COUNT.pack(len(progress["world_grades"]))
+    for world_id, grade in progress["world_grades"].items():
+        body += PAIR.pack(index(world_id), index(grade))
+    body += COUNT.pack(len(progress["completed_worlds"]))
+    for name in progress["completed_worlds"]:
+        body += struct.pack("<H", index(name))
+
+    runs = snapshot.get("runs", [])
+    body += COUNT.pack(len(runs))
+    for run in runs:
+        seed = run["seed"]
+        scores = run["scores"]
+        body += RUN.pack(
+            index(run["world_id"]),
+            index(run["grade"]),
+            run["success"],
+            run["time_left"],
+            run["duration"],
+            run["recorded"],
+            NO_SEED if seed is None else seed,
+            len(scores),
+        )
+        for name, value in scores.items():
+            if isinstance(value, int):
+                body += SCORE_INT.pack(index(name), TAG_INT, value)
+            else:
+                body += SCORE_FLOAT.pack(index(name), TAG_FLOAT, value)
+
+    # Settings are free-form values, so they stay JSON; the block is tiny.
+    head = bytearray()
+    head += _pack_str(snapshot.get("profile", ""))
+    head += _pack_str(json.dumps(snapshot["settings"], sort_keys=True))
+    head += COUNT.pack(len(strings))
+    for text in strings:
+        head += _pack_str(text)
+
+    data = HEADER.pack(MAGIC, VERSION, snapshot.get("version", 0)) + head + body
+    return data + _signature(key, data)
+
+
+def loads_binary(data: bytes, key: bytes) -> dict[str, Any]:
+    if len(data) < HEADER.size + DIGEST_SIZE:
+        raise SaveFormatError("file too short")
+    data, signature = data[:-DIGEST_SIZE], data[-DIGEST_SIZE:]
+    magic, version, snapshot_version = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("not a binary save")
+    if version not in (1, VERSION):
+        raise SaveFormatError(f"unsupported binary save version {version}")
+    if not hmac.compare_digest(_signature(key, data), signature):
+        raise SaveFormatError("signature mismatch")
+
+    try:
+        offset = HEADER.size
+        profile, offset = _read_str(data, offset)
+        settings_json, offset = _read_str(data, offset)
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        strings = []
+        for _ in range(count):
+            text, offset = _read_str(data, offset)
+            strings.append(text)
+
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        world_grades = {}
+        for world, grade in PAIR.iter_unpack(data[offset:offset + count * PAIR.size]):
+            world_grades[strings[world]] = strings[grade]
+        offset += count * PAIR.size
+
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        completed = [strings[name] for name in struct.unpack_from(f"<{count}H", data, offset)]
+        offset += count * 2
+
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        runs = []
+        for _ in range(count):
+            world, grade, success, time_left, duration, recorded, seed, score_count = RUN.unpack_from(data, offset)
+            offset += RUN.size
+            scores = {}
+            for _ in range(score_count):
+                if version == 1:
+                    name, value = SCORE_V1.unpack_from(data, offset)
+                    offset += SCORE_V1.size
+                else:
+                    name, tag = SCORE_TAG.unpack_from(data, offset)
+                    record = SCORE_INT if tag == TAG_INT else SCORE_FLOAT
+                    _, _, value = record.unpack_from(data, offset)
+                    offset += record.size
+                scores[strings[name]] = value
+            runs.append(
+                {
+                    "world_id": strings[world],
+                    "grade": strings[grade],
+                    "success": bool(success),
+                    "time_left": time_left,
+                    "duration": duration,
+                    "recorded": recorded,
+                    "seed": None if seed == NO_SEED else seed,
+                    "scores": scores,
+                }
+            )
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise SaveFormatError(f"truncated binary save: {error}") from error
+
+    return {
+        "version": snapshot_version,
+        "profile": profile,
+        "settings": json.loads(settings_json),
+        "progress": {"completed_worlds": completed, "world_grades": world_grades},
+        "runs": runs,
+    }
+
+
+def dumps(snapshot: dict[str, Any], key: bytes, fmt: str = DEFAULT_FORMAT) -> bytes:
+    if fmt == "binary":
+        return dumps_binary(snapshot, key)
+    if fmt == "json":
+        return dumps_json(snapshot, key)
+    raise ValueError(f"unknown save format: {fmt}")
+
+
+def loads(data: bytes, key: bytes) -> dict[str, Any]:
+    """Decode either format; binary saves are told apart by their magic bytes."""
+    if data[:len(MAGIC)] == MAGIC:
+        return loads_binary(data, key)
+    return loads_json(data, key)
+
+
+def sample_snapshot(runs: int, seed: int = 0) -> dict[str, Any]:
+    rng = random.Random(seed)
+    worlds = [str(index) for index in range(10)] + list("qwertyu")
+    grades = ("S", "A", "B", "C", "-")
+    return {
+        "version": 3,
+        "profile": "benchmark",
+        "settings": {"high_contrast": False, "music_on": True, "save_format": "json"},
+        "progress": {
+            "completed_worlds": [f"World {world}" for world in worlds],
+            "world_grades": {world: rng.choice(grades[:4]) for world in worlds},
+        },
+        "runs": [
+            {
+                "world_id": rng.choice(worlds),
+                "grade": rng.choice(grades),
+                "success": rng.random() < 0.6,
+                "time_left": rng.uniform(0.0, 60.0),
+                "duration": rng.uniform(20.0, 120.0),
+                "recorded": 1.7e9 + index * 90.0,
+                "seed": rng.getrandbits(32),
+                "scores": {"review_score": rng.uniform(0.0, 100.0)} if rng.random() < 0.5 else {"landed_count": rng.randint(0, 30)},
+            }
+            for index in range(runs)
+        ],
+    }
+
+
+def benchmark(runs: int, repeats: int = 5) -> list[tuple[str, float, float, int]]:
+    """Best-of-``repeats`` save and load wall time (through a real file) and size per format."""
+    snapshot = sample_snapshot(runs)
+    key = b"benchmark-key"
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "profile.sav")
+        for fmt in FORMATS:
+            save_times, load_times = [], []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                with open(path, "wb") as file:
+                    file.write(dumps(snapshot, key, fmt))
+                save_times.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                with open(path, "rb") as file:
+                    loads(file.read(), key)
+                load_times.append(time.perf_counter() - started)
+            results.append((fmt, min(save_times), min(load_times), os.path.getsize(path)))
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare save formats on a synthetic profile.")
+    parser.add_argument("--runs", type=int, default=5000, help="run records in the profile")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"profile with {args.runs} run records, best of {args.repeats}")
+    print(f"{'format':<8}{'save ms':>10}{'load ms':>10}{'bytes':>12}")
+    for fmt, save_time, load_time, size in benchmark(args.runs, args.repeats):
+        print(f"{fmt:<8}{save_time * 1000:>10.2f}{load_time * 1000:>10.2f}{size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,26 +2,236 @@ import hashlib
 import hmac
 import json
 import os
-from typing import Any
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, NamedTuple
+
+from src import save_format
 
 SECRET_KEY = os.getenv("GAME_SECRET_KEY", "fallback_secure_key_2025").encode()
 
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 _project_root = os.path.dirname(_current_dir)
 SAVE_FILE = os.path.join(_project_root, "save_data.json")
+SAVE_DB = os.path.join(_project_root, "save_data.db")
+DEFAULT_PROFILE = "default"
 LEGACY_FRAGMENT_FILES = {
     "completed_worlds": "completed_worlds.json",
     "world_grades": "world_grades.json",
     "settings": "game_settings.json",
 }
+SAVE_DEBOUNCE = 0.5
+COMPACT_EVERY = 32
+_MISSING = object()
+
+
+class SaveWriter:
+    """Background thread that coalesces queued saves into one write per window.
+
+    Only the newest payload matters, so a burst of mutations inside the
+    debounce window costs a single file write. ``flush`` writes whatever is
+    still queued on the calling thread.
+    """
+
+    def __init__(self, write: Callable[[Any], None], delay: float = SAVE_DEBOUNCE) -> None:
+        self.write = write
+        self.delay = delay
+        self.cond = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.pending: Any = None
+        self.pending_seq = 0
+        self.written_seq = 0
+        self.due = 0.0
+        self.closed = False
+        self.thread: threading.Thread | None = None
+
+    def submit(self, payload: Any = True) -> None:
+        with self.cond:
+            if self.pending is None:
+                self.due = time.monotonic() + self.delay
+            self.pending = payload
+            self.pending_seq += 1
+            if self.thread is None and not self.closed:
+                self.thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self.thread.start()
+            self.cond.notify()
+
+    def _take(self) -> tuple[Any, int]:
+        payload, self.pending = self.pending, None
+        return payload, self.pending_seq
+
+    def _run(self) -> None:
+        while True:
+            with self.cond:
+                while self.pending is None and not self.closed:
+                    self.cond.wait()
+                if self.closed:
+                    return
+                remaining = self.due - time.monotonic()
+                while remaining > 0 and not self.closed:
+                    self.cond.wait(remaining)
+                    remaining = self.due - time.monotonic()
+                if self.closed:
+                    return
+                payload, seq = self._take()
+            if payload is not None:
+                self._write(payload, seq)
+
+    def _write(self, payload: Any, seq: int) -> None:
+        with self.write_lock:
+            # A flush may already have written something newer.
+            if seq <= self.written_seq:
+                return
+            self.write(payload)
+            self.written_seq = seq
+
+    def flush(self) -> None:
+        with self.cond:
+            payload, seq = self._take()
+        if payload is not None:
+            self._write(payload, seq)
+        # Wait out a write the thread may have in progress.
+        with self.write_lock:
+            pass
+
+    def close(self) -> None:
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.flush()
+        if self.thread is not None:
+            self.thread.join()
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    PRIMARY KEY (profile_id, key)
+);
+CREATE TABLE IF NOT EXISTS world_grades (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    world_id TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    PRIMARY KEY (profile_id, world_id)
+);
+CREATE TABLE IF NOT EXISTS completed_worlds (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    name TEXT NOT NULL,
+    world_id TEXT,
+    signature TEXT NOT NULL,
+    PRIMARY KEY (profile_id, name)
+);
+CREATE TABLE IF NOT EXISTS grade_history (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    world_id TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    recorded REAL NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS grade_history_by_world ON grade_history (profile_id, world_id);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    world_id TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    time_left REAL NOT NULL,
+    duration REAL NOT NULL,
+    seed INTEGER,
+    scores TEXT NOT NULL,
+    recorded REAL NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_world ON runs (profile_id, world_id, id);
+CREATE TABLE IF NOT EXISTS run_summary (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    world_id TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    rank_total INTEGER NOT NULL,
+    best_time REAL,
+    signature TEXT NOT NULL,
+    PRIMARY KEY (profile_id, world_id)
+);
+CREATE TABLE IF NOT EXISTS quarantine (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    row TEXT NOT NULL,
+    quarantined REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_compaction (
+    profile_id INTEGER PRIMARY KEY REFERENCES profiles(id),
+    last_run_id INTEGER NOT NULL,
+    signature TEXT NOT NULL
+);
+"""
+RANKS = {"S": 5, "A": 4, "B": 3, "C": 2, "-": 1}
+
+
+class RunStats(NamedTuple):
+    attempts: int = 0
+    rank_total: int = 0
+    best_time: float | None = None
+
+    @property
+    def average_rank(self) -> str:
+        if not self.attempts:
+            return "-"
+        average = self.rank_total / self.attempts
+        return min(RANKS, key=lambda grade: abs(RANKS[grade] - average))
+
+    def merge(self, other: "RunStats") -> "RunStats":
+        times = [seconds for seconds in (self.best_time, other.best_time) if seconds is not None]
+        return RunStats(self.attempts + other.attempts, self.rank_total + other.rank_total, min(times, default=None))
 
 
 class SaveSystem:
-    def __init__(self) -> None:
-        self.data: dict[str, Any] = self._default_data()
+    """Player profiles in a SQLite file, one signed row per fact.
+
+    Every settings, grade, completion and grade-history row carries its own
+    HMAC, so an update signs only the row it touches. Rows are verified the
+    first time they are read and the result is kept in ``verified``, so
+    nothing is checked at load and per-frame reads skip the HMAC. A row that
+    fails verification is moved to ``quarantine`` and the rest of the profile
+    stays intact. Lookups go straight to the primary-key indexes. Changes
+    land in the open transaction at once (so reads see them) and the
+    background writer commits them.
+
+    Finished sessions are appended to the ``runs`` journal. Every
+    ``COMPACT_EVERY`` appends the new rows are folded into ``run_summary``,
+    so hub statistics read one summary row plus the short uncompacted tail.
+    """
+
+    def __init__(self, path: str = SAVE_DB, profile: str = DEFAULT_PROFILE, legacy_path: str = SAVE_FILE) -> None:
+        self.path = path
+        self.legacy_path = legacy_path
         self.integrity_error = False
-        print(f"[SaveSystem] Save file location: {SAVE_FILE}")
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.writer = SaveWriter(self._commit)
+        print(f"[SaveSystem] Save file location: {self.path}")
+        self.profile = profile
+        self.profile_id = self._profile_id(profile)
+        self.verified: dict[tuple[str, str], Any] = {}
+        self.run_stats: dict[str, RunStats] = {}
+        self.pending_runs = 0
         self.load()
+        self.compact_runs()
 
     def _default_data(self) -> dict[str, Any]:
         return {
@@ -105,79 +315,448 @@ class SaveSystem:
     def get_signature(self, data_str: str) -> str:
         return hmac.new(SECRET_KEY, data_str.encode(), hashlib.sha256).hexdigest()
 
-    def save(self) -> None:
-        try:
-            json_str = json.dumps(self.data, sort_keys=True)
-            signature = self.get_signature(json_str)
-            with open(SAVE_FILE, "w", encoding="utf-8") as file:
-                json.dump({"payload": json_str, "signature": signature}, file)
-            print(
-                "[SaveSystem] Saved! Completed:"
-                f" {self.data['progress']['completed_worlds']}"
+    def _row_signature(self, table: str, *fields: Any) -> str:
+        return self.get_signature("|".join([table, str(self.profile_id), *(str(field) for field in fields)]))
+
+    def _verified(self, table: str, signature: str, *fields: Any) -> bool:
+        if hmac.compare_digest(self._row_signature(table, *fields), signature):
+            return True
+        self._quarantine(table, signature, fields)
+        return False
+
+    def _quarantine(self, table: str, signature: str, fields: tuple[Any, ...]) -> None:
+        """Move a row whose signature fails out of its table so only that entry is lost."""
+        print(f"[SaveSystem] Signature mismatch in {table}; quarantining row {fields[0]!r}.")
+        self.integrity_error = True
+        row = json.dumps({"fields": list(fields), "signature": signature}, default=str)
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO quarantine (profile_id, source, row, quarantined) VALUES (?, ?, ?, ?)",
+                (self.profile_id, table, row, time.time()),
             )
-        except Exception as error:
+            self.conn.execute(f"DELETE FROM {table} WHERE profile_id = ? AND signature = ?", (self.profile_id, signature))
+        self.verified = {key: value for key, value in self.verified.items() if key[0] != table}
+        self.run_stats.clear()
+        self.save()
+
+    def get_quarantined_count(self) -> int:
+        with self.lock:
+            row = self.conn.execute("SELECT COUNT(*) FROM quarantine WHERE profile_id = ?", (self.profile_id,)).fetchone()
+        return row[0]
+
+    def _profile_id(self, name: str) -> int:
+        with self.lock:
+            row = self.conn.execute("SELECT id FROM profiles WHERE name = ?", (name,)).fetchone()
+            if row:
+                return row[0]
+            cursor = self.conn.execute("INSERT INTO profiles (name, created) VALUES (?, ?)", (name, time.time()))
+            self.conn.commit()
+            return cursor.lastrowid
+
+    def list_profiles(self) -> list[str]:
+        with self.lock:
+            return [row[0] for row in self.conn.execute("SELECT name FROM profiles ORDER BY created, id")]
+
+    def switch_profile(self, name: str) -> None:
+        self.flush()
+        self.profile = name
+        self.profile_id = self._profile_id(name)
+        self.integrity_error = False
+        self.verified.clear()
+        self.run_stats.clear()
+        self.compact_runs()
+
+    def _commit(self, _: Any = None) -> None:
+        try:
+            with self.lock:
+                self.conn.commit()
+            print("[SaveSystem] Saved!")
+        except sqlite3.Error as error:
             print(f"[SaveSystem] Failed to save: {error}")
 
-    def load(self) -> None:
-        if os.path.exists(SAVE_FILE):
-            try:
-                with open(SAVE_FILE, "r", encoding="utf-8") as file:
-                    wrapper = json.load(file)
-
-                payload = wrapper["payload"]
-                signature = wrapper["signature"]
-
-                if self.get_signature(payload) != signature:
-                    print("Save file signature mismatch. Resetting data.")
-                    self.integrity_error = True
-                    self.data = self._default_data()
-                    return
+    def save(self) -> None:
+        """Queue a commit of pending changes; call flush() to commit now."""
+        self.writer.submit()
 
-                loaded = json.loads(payload)
-                self.data = self._normalize_data(loaded)
-                return
-            except Exception as error:
+    def flush(self) -> None:
+        self.writer.flush()
+
+    def close(self) -> None:
+        self.compact_runs()
+        self.writer.close()
+        with self.lock:
+            self.conn.close()
+
+    def load(self) -> None:
+        with self.lock:
+            migrated = self.conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+        if migrated:
+            return
+
+        data = self._load_json_save()
+        if data is None:
+            data = self._load_legacy_fragments()
+        if data != self._default_data():
+            print(f"[SaveSystem] Migrating existing progress into profile '{self.profile}'.")
+            self._import(data)
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)", (str(time.time()),))
+            self.conn.commit()
+
+    def _load_json_save(self) -> dict[str, Any] | None:
+        if not os.path.exists(self.legacy_path):
+            return None
+        try:
+            with open(self.legacy_path, "rb") as file:
+                loaded = save_format.loads_json(file.read(), SECRET_KEY)
+            return self._normalize_data(loaded)
+        except save_format.SaveFormatError as error:
+            if str(error) != "signature mismatch":
                 print(f"[SaveSystem] Failed to load canonical save file: {error}")
+                return None
+            print("Save file signature mismatch. Not migrating it.")
+            self.integrity_error = True
+            return self._default_data()
+        except Exception as error:
+            print(f"[SaveSystem] Failed to load canonical save file: {error}")
+            return None
+
+    def _import(self, data: dict[str, Any]) -> None:
+        progress = data["progress"]
+        for world_id, grade in progress["world_grades"].items():
+            self._put_grade(world_id, grade)
+        for name in progress["completed_worlds"]:
+            self._put_completion(name, None)
+        for key, value in data["settings"].items():
+            self._put_setting(key, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """The active profile as one dict: settings, progress and every run."""
+        with self.lock:
+            settings = {
+                key: self.get_setting(key)
+                for (key,) in self.conn.execute("SELECT key FROM settings WHERE profile_id = ?", (self.profile_id,)).fetchall()
+            }
+            world_ids = [
+                world_id
+                for (world_id,) in self.conn.execute("SELECT world_id FROM world_grades WHERE profile_id = ?", (self.profile_id,)).fetchall()
+            ]
+            run_worlds = [
+                world_id
+                for (world_id,) in self.conn.execute("SELECT DISTINCT world_id FROM runs WHERE profile_id = ?", (self.profile_id,)).fetchall()
+            ]
+        grades = {world_id: self.get_grade(world_id) for world_id in world_ids}
+        return {
+            "version": 3,
+            "profile": self.profile,
+            "settings": settings,
+            "progress": {
+                "completed_worlds": self.get_completed_worlds(),
+                "world_grades": {world_id: grade for world_id, grade in grades.items() if grade is not None},
+            },
+            "runs": sorted(
+                (run for world_id in run_worlds for run in self.get_run_history(world_id)),
+                key=lambda run: run["recorded"],
+            ),
+        }
 
-        migrated = self._load_legacy_fragments()
-        if migrated != self._default_data():
-            self.data = migrated
-            self.save()
+    def export_profile(self, path: str, fmt: str | None = None) -> None:
+        """Write the active profile to ``path`` in ``fmt``, or the ``save_format`` setting."""
+        fmt = fmt or self.get_setting("save_format", save_format.DEFAULT_FORMAT)
+        data = save_format.dumps(self.snapshot(), SECRET_KEY, fmt)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    def import_profile(self, path: str) -> None:
+        """Merge an exported profile of either format into the active profile."""
+        with open(path, "rb") as file:
+            snapshot = save_format.loads(file.read(), SECRET_KEY)
+        for key, value in snapshot["settings"].items():
+            self._put_setting(key, value)
+        for world_id, grade in snapshot["progress"]["world_grades"].items():
+            if RANKS.get(grade, 0) > RANKS.get(self.get_grade(world_id, "-"), 0):
+                self._put_grade(world_id, grade)
+        for name in snapshot["progress"]["completed_worlds"]:
+            if name not in self._completed_worlds():
+                self._put_completion(name, None)
+        for run in snapshot.get("runs", []):
+            self._append_run(
+                run["world_id"],
+                run["grade"],
+                run["success"],
+                run["time_left"],
+                run["duration"],
+                run["seed"],
+                run["scores"],
+                run["recorded"],
+            )
+        self.compact_runs()
+
+    def _put_setting(self, key: str, value: Any) -> None:
+        encoded = json.dumps(value)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO settings (profile_id, key, value, signature) VALUES (?, ?, ?, ?)",
+                (self.profile_id, key, encoded, self._row_signature("settings", key, encoded)),
+            )
+        self.verified["settings", key] = value
+
+    def _put_grade(self, world_id: str, grade: str) -> None:
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO world_grades (profile_id, world_id, grade, signature) VALUES (?, ?, ?, ?)",
+                (self.profile_id, world_id, grade, self._row_signature("world_grades", world_id, grade)),
+            )
+        self.verified["world_grades", world_id] = grade
+
+    def _put_completion(self, name: str, world_id: str | None) -> None:
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO completed_worlds (profile_id, name, world_id, signature) VALUES (?, ?, ?, ?)",
+                (self.profile_id, name, world_id, self._row_signature("completed_worlds", name, world_id)),
+            )
+        completed = self.verified.get(("completed_worlds", ""))
+        if completed is not None and name not in completed:
+            completed.append(name)
 
     def mark_world_complete(self, world_id: str, grade: str = "-", display_name: str | None = None) -> None:
         display_name = display_name or world_id
         print(f"[SaveSystem] Marking world '{display_name}' ({world_id}) as complete with rank {grade}...")
 
-        ranks = {"S": 5, "A": 4, "B": 3, "C": 2, "-": 1}
-        current_grade = self.data["progress"]["world_grades"].get(world_id, "-")
+        recorded = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO grade_history (profile_id, world_id, grade, recorded, signature) VALUES (?, ?, ?, ?, ?)",
+                (self.profile_id, world_id, grade, recorded, self._row_signature("grade_history", world_id, grade, recorded)),
+            )
 
-        if ranks.get(grade, 0) > ranks.get(current_grade, 0):
-            self.data["progress"]["world_grades"][world_id] = grade
+        current_grade = self.get_grade(world_id, "-")
+        if RANKS.get(grade, 0) > RANKS.get(current_grade, 0):
+            self._put_grade(world_id, grade)
 
-        if display_name not in self.data["progress"]["completed_worlds"]:
-            self.data["progress"]["completed_worlds"].append(display_name)
-            print(
-                f"[SaveSystem] World '{display_name}' added! "
-                f"Total: {len(self.data['progress']['completed_worlds'])}"
-            )
+        if display_name not in self.get_completed_worlds():
+            self._put_completion(display_name, world_id)
+            print(f"[SaveSystem] World '{display_name}' added! Total: {self.get_completed_world_count()}")
 
         self.save()
 
     def get_grade(self, world_id: str, default: str | None = None) -> str | None:
-        return self.data["progress"]["world_grades"].get(world_id, default)
+        grade = self.verified.get(("world_grades", world_id), _MISSING)
+        if grade is _MISSING:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT grade, signature FROM world_grades WHERE profile_id = ? AND world_id = ?",
+                    (self.profile_id, world_id),
+                ).fetchone()
+            grade = row[0] if row is not None and self._verified("world_grades", row[1], world_id, row[0]) else None
+            self.verified["world_grades", world_id] = grade
+        return default if grade is None else grade
+
+    def get_grade_history(self, world_id: str) -> list[tuple[str, float]]:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT grade, recorded, signature FROM grade_history WHERE profile_id = ? AND world_id = ? ORDER BY id",
+                (self.profile_id, world_id),
+            ).fetchall()
+        return [
+            (grade, recorded)
+            for grade, recorded, signature in rows
+            if self._verified("grade_history", signature, world_id, grade, recorded)
+        ]
+
+    def _completed_worlds(self) -> list[str]:
+        completed = self.verified.get(("completed_worlds", ""))
+        if completed is None:
+            with self.lock:
+                rows = self.conn.execute(
+                    "SELECT name, world_id, signature FROM completed_worlds WHERE profile_id = ? ORDER BY rowid",
+                    (self.profile_id,),
+                ).fetchall()
+            completed = [
+                name for name, world_id, signature in rows if self._verified("completed_worlds", signature, name, world_id)
+            ]
+            self.verified["completed_worlds", ""] = completed
+        return completed
 
     def get_completed_worlds(self) -> list[str]:
-        return list(self.data["progress"]["completed_worlds"])
+        return list(self._completed_worlds())
 
     def get_completed_world_count(self) -> int:
-        return len(self.data["progress"]["completed_worlds"])
+        # Counted from verified rows so a forged completion never counts.
+        return len(self._completed_worlds())
 
     def get_setting(self, key: str, default: Any = None) -> Any:
-        return self.data["settings"].get(key, default)
+        value = self.verified.get(("settings", key), _MISSING)
+        if value is _MISSING:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT value, signature FROM settings WHERE profile_id = ? AND key = ?",
+                    (self.profile_id, key),
+                ).fetchone()
+            if row is None or not self._verified("settings", row[1], key, row[0]):
+                return default
+            value = self.verified["settings", key] = json.loads(row[0])
+        return value
 
     def set_setting(self, key: str, value: Any, *, save_immediately: bool = True) -> None:
-        self.data["settings"][key] = value
+        self._put_setting(key, value)
         if save_immediately:
             self.save()
 
+    def record_run(
+        self,
+        world_id: str,
+        grade: str,
+        *,
+        success: bool,
+        time_left: float,
+        duration: float,
+        seed: int | None = None,
+        scores: dict[str, float] | None = None,
+    ) -> None:
+        """Append one finished session to the run journal."""
+        self._append_run(world_id, grade, success, time_left, duration, seed, scores or {}, time.time())
+        if self.pending_runs >= COMPACT_EVERY:
+            self.compact_runs()
+        self.save()
+
+    def _append_run(
+        self,
+        world_id: str,
+        grade: str,
+        success: bool,
+        time_left: float,
+        duration: float,
+        seed: int | None,
+        scores: dict[str, float],
+        recorded: float,
+    ) -> None:
+        fields = (world_id, grade, int(success), float(time_left), float(duration), seed, json.dumps(scores, sort_keys=True), recorded)
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO runs (profile_id, world_id, grade, success, time_left, duration, seed, scores, recorded, signature)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.profile_id, *fields, self._row_signature("runs", *fields)),
+            )
+        self.run_stats.pop(world_id, None)
+        self.pending_runs += 1
+
+    def _fold_runs(self, rows: list[tuple]) -> RunStats:
+        stats = RunStats()
+        for world_id, grade, success, time_left, duration, seed, scores, recorded, signature in rows:
+            if not self._verified("runs", signature, world_id, grade, success, time_left, duration, seed, scores, recorded):
+                continue
+            stats = stats.merge(RunStats(1, RANKS.get(grade, 0), duration if success else None))
+        return stats
+
+    def _compaction_cursor(self) -> int | None:
+        """Id of the last run folded into ``run_summary``; None means the summary can't be trusted."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT last_run_id, signature FROM run_compaction WHERE profile_id = ?", (self.profile_id,)
+            ).fetchone()
+        if row is None or not self._verified("run_compaction", row[1], row[0]):
+            return None
+        return row[0]
+
+    def _run_summary(self, world_id: str) -> RunStats | None:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT attempts, rank_total, best_time, signature FROM run_summary WHERE profile_id = ? AND world_id = ?",
+                (self.profile_id, world_id),
+            ).fetchone()
+        if row is None:
+            return RunStats()
+        if not self._verified("run_summary", row[3], world_id, *row[:3]):
+            return None
+        return RunStats(*row[:3])
+
+    def compact_runs(self) -> None:
+        """Fold journal rows appended since the last compaction into ``run_summary``."""
+        with self.lock:
+            cursor = self._compaction_cursor()
+            trusted = cursor is not None
+            if not trusted:
+                # Nothing trustworthy to build on: start the summary over.
+                self.conn.execute("DELETE FROM run_summary WHERE profile_id = ?", (self.profile_id,))
+                cursor = 0
+            rows = self.conn.execute(
+                "SELECT id, world_id, grade, success, time_left, duration, seed, scores, recorded, signature"
+                " FROM runs WHERE id > ? AND profile_id = ? ORDER BY id",
+                (cursor, self.profile_id),
+            ).fetchall()
+            self.pending_runs = 0
+            if not rows and trusted:
+                return
+
+            by_world: dict[str, list[tuple]] = {}
+            for row in rows:
+                by_world.setdefault(row[1], []).append(row[1:])
+            for world_id, world_rows in by_world.items():
+                summary = self._run_summary(world_id)
+                if summary is None:
+                    # A tampered summary row is rebuilt from the whole journal for that world.
+                    world_rows = self.conn.execute(
+                        "SELECT world_id, grade, success, time_left, duration, seed, scores, recorded, signature"
+                        " FROM runs WHERE profile_id = ? AND world_id = ?",
+                        (self.profile_id, world_id),
+                    ).fetchall()
+                    summary = RunStats()
+                summary = summary.merge(self._fold_runs(world_rows))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO run_summary (profile_id, world_id, attempts, rank_total, best_time, signature)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.profile_id, world_id, *summary, self._row_signature("run_summary", world_id, *summary)),
+                )
+
+            last_run_id = rows[-1][0] if rows else cursor
+            self.conn.execute(
+                "INSERT OR REPLACE INTO run_compaction (profile_id, last_run_id, signature) VALUES (?, ?, ?)",
+                (self.profile_id, last_run_id, self._row_signature("run_compaction", last_run_id)),
+            )
+        self.save()
 
+    def get_run_stats(self, world_id: str) -> RunStats:
+        """Attempts, rank total and best clear time for one world, from the summary plus the journal tail."""
+        stats = self.run_stats.get(world_id)
+        if stats is not None:
+            return stats
+        with self.lock:
+            cursor = self._compaction_cursor()
+            summary = self._run_summary(world_id) if cursor is not None else None
+            if summary is None:
+                summary, cursor = RunStats(), 0
+            rows = self.conn.execute(
+                "SELECT world_id, grade, success, time_left, duration, seed, scores, recorded, signature"
+                " FROM runs WHERE profile_id = ? AND world_id = ? AND id > ?",
+                (self.profile_id, world_id, cursor),
+            ).fetchall()
+        stats = self.run_stats[world_id] = summary.merge(self._fold_runs(rows))
+        return stats
+
+    def get_run_history(self, world_id: str) -> list[dict[str, Any]]:
+        """Every verified journal row for one world, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT world_id, grade, success, time_left, duration, seed, scores, recorded, signature"
+                " FROM runs WHERE profile_id = ? AND world_id = ? ORDER BY id",
+                (self.profile_id, world_id),
+            ).fetchall()
+        return [
+            {
+                "world_id": world_id,
+                "grade": grade,
+                "success": bool(success),
+                "time_left": time_left,
+                "duration": duration,
+                "seed": seed,
+                "scores": json.loads(scores),
+                "recorded": recorded,
+            }
+            for world_id, grade, success, time_left, duration, seed, scores, recorded, signature in rows
+            if self._verified("runs", signature, world_id, grade, success, time_left, duration, seed, scores, recorded)
+        ]
@@ -0,0 +1,245 @@
+import tkinter as tk
+from typing import Any, Callable
+
+STATIC_TAG = "scene_static"
+SCALED_OPTIONS = ("width", "arrowshape")
+
+
+def flatten_coords(values: Any) -> tuple[Any, ...]:
+    flat: list[Any] = []
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            flat.extend(flatten_coords(value))
+        else:
+            flat.append(value)
+    return tuple(flat)
+
+
+def _discard(*args: Any, **kwargs: Any) -> int:
+    return 0
+
+
+class NullCanvas:
+    """Canvas sink for frames that are simulated but never shown."""
+
+    def __getattr__(self, name: str) -> Any:
+        return _discard
+
+
+class StaticPainter:
+    """Canvas stand-in that stamps every created item into the static layer."""
+
+    def __init__(self, scene: "SceneLayer") -> None:
+        self.scene = scene
+
+    def __getattr__(self, name: str) -> Any:
+        target = getattr(self.scene.canvas, name)
+        if not name.startswith("create_"):
+            return target
+
+        def create(*args: Any, **options: Any) -> int:
+            coords = self.scene.project(flatten_coords(args))
+            return target(*coords, **self.scene.project_options(options), tags=STATIC_TAG)
+
+        return create
+
+
+class SceneLayer:
+    """Retained canvas items that survive between frames.
+
+    Drawing code keeps emitting ``create_*`` calls in back-to-front order. The
+    n-th primitive of a frame is matched to the n-th item the layer already
+    owns, so Tk only sees ``coords``/``itemconfigure`` for values that changed.
+    ``delete("all")`` starts a new frame instead of destroying every item.
+
+    Callers draw in the virtual WIDTH x HEIGHT space. The viewport scale and
+    offset are applied once as items are emitted, including font sizes and
+    stroke widths, so Tk never has to rewrite coordinates after the fact.
+
+    Backdrops that never change can be painted once into a static layer that
+    sits below every retained item and is only rebuilt when invalidated.
+
+    Items that persist across many frames behind a list of varying length,
+    such as an aircraft's route, can be keyed instead with ``create_keyed``
+    so they keep their item whatever is drawn before them.
+    """
+
+    def __init__(self, canvas: tk.Canvas) -> None:
+        self.canvas = canvas
+        # Each entry is [item_id, signature, coords, options].
+        self.items: list[list[Any]] = []
+        # Each keyed entry is [item_id, kind, coords, options, frame last drawn].
+        self.keyed: dict[Any, list[Any]] = {}
+        self.frame = 0
+        self.cursor = 0
+        self.frame_open = False
+        self.static_key: Any = None
+        self.scale = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.canvas, name)
+
+    def begin_frame(self) -> None:
+        self.cursor = 0
+        self.frame += 1
+        self.frame_open = True
+
+    def end_frame(self) -> None:
+        if not self.frame_open:
+            return
+        self.frame_open = False
+        if self.cursor < len(self.items):
+            for item in self.items[self.cursor:]:
+                self.canvas.delete(item[0])
+            del self.items[self.cursor:]
+        stale = [key for key, entry in self.keyed.items() if entry[4] != self.frame]
+        for key in stale:
+            self.canvas.delete(self.keyed.pop(key)[0])
+
+    def set_viewport(self, scale: float, offset_x: float, offset_y: float) -> None:
+        self.scale = scale
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        for item in self.items:
+            item[2] = None
+            item[3] = {}
+        for entry in self.keyed.values():
+            entry[2] = None
+            entry[3] = {}
+        self.invalidate_static()
+
+    def project(self, coords: tuple[Any, ...]) -> list[float]:
+        scale = self.scale
+        projected = list(coords)
+        projected[0::2] = [x * scale + self.offset_x for x in coords[0::2]]
+        projected[1::2] = [y * scale + self.offset_y for y in coords[1::2]]
+        return projected
+
+    def project_options(self, options: dict[str, Any]) -> dict[str, Any]:
+        scale = self.scale
+        if scale == 1.0:
+            return options
+        projected = dict(options)
+        font = options.get("font")
+        if isinstance(font, (tuple, list)) and len(font) > 1:
+            projected["font"] = (font[0], max(1, round(font[1] * scale)), *font[2:])
+        for key in SCALED_OPTIONS:
+            value = options.get(key)
+            if isinstance(value, (tuple, list)):
+                projected[key] = tuple(part * scale for part in value)
+            elif isinstance(value, (int, float)):
+                projected[key] = value * scale
+        return projected
+
+    def set_static(self, key: Any, painter: Callable[[Any], None] | None) -> None:
+        if key == self.static_key:
+            return
+        self.canvas.delete(STATIC_TAG)
+        self.static_key = key
+        if painter is None:
+            return
+        painter(StaticPainter(self))
+        self.canvas.tag_lower(STATIC_TAG)
+
+    def invalidate_static(self) -> None:
+        self.canvas.delete(STATIC_TAG)
+        self.static_key = None
+
+    def clear(self) -> None:
+        for item in self.items:
+            self.canvas.delete(item[0])
+        for entry in self.keyed.values():
+            self.canvas.delete(entry[0])
+        self.items = []
+        self.keyed = {}
+        self.cursor = 0
+
+    def delete(self, *tags: Any) -> None:
+        if tags == ("all",):
+            self.begin_frame()
+            return
+        self.canvas.delete(*tags)
+
+    def create_rectangle(self, *args: Any, **options: Any) -> int:
+        return self._emit("rectangle", args, options)
+
+    def create_oval(self, *args: Any, **options: Any) -> int:
+        return self._emit("oval", args, options)
+
+    def create_line(self, *args: Any, **options: Any) -> int:
+        return self._emit("line", args, options)
+
+    def create_polygon(self, *args: Any, **options: Any) -> int:
+        return self._emit("polygon", args, options)
+
+    def create_arc(self, *args: Any, **options: Any) -> int:
+        return self._emit("arc", args, options)
+
+    def create_text(self, *args: Any, **options: Any) -> int:
+        return self._emit("text", args, options)
+
+    def create_image(self, *args: Any, **options: Any) -> int:
+        return self._emit("image", args, options)
+
+    def create_keyed(self, key: Any, kind: str, coords: tuple[Any, ...], **options: Any) -> int:
+        """A retained item matched by ``key`` instead of by draw order; dropped after a frame without it.
+
+        ``coords`` is compared by identity, so pass a flat tuple that is only
+        rebuilt when the shape really changes.
+        """
+        entry = self.keyed.get(key)
+        if entry is None or entry[1] != kind:
+            if entry is not None:
+                self.canvas.delete(entry[0])
+            item_id = self._create(kind, coords, options)
+            self.keyed[key] = [item_id, kind, coords, options, self.frame]
+            return item_id
+        entry[4] = self.frame
+        item_id = entry[0]
+        if entry[2] is not coords:
+            self.canvas.coords(item_id, *self.project(coords))
+            entry[2] = coords
+        if entry[3] != options:
+            changed = {name: value for name, value in options.items() if entry[3].get(name) != value}
+            self.canvas.itemconfigure(item_id, **self.project_options(changed))
+            entry[3] = options
+        return item_id
+
+    def _emit(self, kind: str, args: tuple[Any, ...], options: dict[str, Any]) -> int:
+        coords = flatten_coords(args)
+        signature = (kind, tuple(sorted(options)))
+        index = self.cursor
+        self.cursor += 1
+
+        if index < len(self.items):
+            item = self.items[index]
+            if item[1] == signature:
+                item_id = item[0]
+                if item[2] != coords:
+                    self.canvas.coords(item_id, *self.project(coords))
+                    item[2] = coords
+                if item[3] != options:
+                    changed = {key: value for key, value in options.items() if item[3].get(key) != value}
+                    self.canvas.itemconfigure(item_id, **self.project_options(changed))
+                    item[3] = options
+                return item_id
+
+            # A different primitive now lives at this depth; swap it in place.
+            item_id = self._create(kind, coords, options)
+            self.canvas.tag_lower(item_id, item[0])
+            self.canvas.delete(item[0])
+            self.items[index] = [item_id, signature, coords, options]
+            return item_id
+
+        item_id = self._create(kind, coords, options)
+        self.items.append([item_id, signature, coords, options])
+        return item_id
+
+    def _create(self, kind: str, coords: tuple[Any, ...], options: dict[str, Any]) -> int:
+        factory = getattr(self.canvas, f"create_{kind}")
+        return factory(*self.project(coords), **self.project_options(options))
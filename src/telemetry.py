@@ -0,0 +1,112 @@
+import json
+import os
+import sys
+from collections import Counter
+from typing import Any
+
+OPS = ("create", "coords", "itemconfigure", "delete", "tag_lower")
+# Frames from these files are plumbing; the caller above them gets the blame.
+PLUMBING_FILES = ("scene.py", "telemetry.py", "profiler.py")
+
+
+def classify(name: str) -> str | None:
+    if name.startswith("create_"):
+        return "create"
+    if name in ("itemconfigure", "itemconfig"):
+        return "itemconfigure"
+    if name in OPS:
+        return name
+    return None
+
+
+def call_site() -> str:
+    """Name the drawing method behind a canvas call, e.g. ``TycoonWorld.draw_portfolio``."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if not frame.f_code.co_filename.endswith(PLUMBING_FILES):
+            owner = frame.f_locals.get("self")
+            if owner is None:
+                return frame.f_code.co_name
+            # Inherited helpers such as draw_hud are charged to the concrete world.
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+class CanvasTelemetry:
+    """Counting proxy for the Tk canvas behind the scene layer.
+
+    Only installed while the F3 overlay is open, so normal play pays nothing.
+    Every create_*/coords/itemconfigure/delete/tag_lower that reaches Tcl is
+    charged to the drawing method that caused it.
+    """
+
+    def __init__(self, canvas: Any) -> None:
+        self.canvas = canvas
+        self.frame_ops: Counter = Counter()
+        self.frame_sites: Counter = Counter()
+        self.last_ops: Counter = Counter()
+        self.last_sites: Counter = Counter()
+        self.last_items = 0
+        self.last_primitives = 0
+        self.totals: dict[str, Counter] = {}
+        self.peak_ops: Counter = Counter()
+        self.peak_items = 0
+        self.frames = 0
+
+    def __getattr__(self, name: str) -> Any:
+        target = getattr(self.canvas, name)
+        op = classify(name)
+        if op is None:
+            return target
+
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            site = call_site()
+            self.frame_ops[op] += 1
+            self.frame_sites[site] += 1
+            self.totals.setdefault(site, Counter())[op] += 1
+            return target(*args, **kwargs)
+
+        return counted
+
+    def begin_frame(self) -> None:
+        self.frame_ops = Counter()
+        self.frame_sites = Counter()
+
+    def end_frame(self, primitives: int) -> None:
+        self.frames += 1
+        self.last_ops = self.frame_ops
+        self.last_sites = self.frame_sites
+        self.last_primitives = primitives
+        self.last_items = len(self.canvas.find_all())
+        self.peak_items = max(self.peak_items, self.last_items)
+        for op, count in self.frame_ops.items():
+            self.peak_ops[op] = max(self.peak_ops[op], count)
+
+    def format_lines(self, top: int = 6) -> list[str]:
+        ops = " ".join(f"{op} {self.last_ops[op]}" for op in OPS)
+        lines = [
+            f"items {self.last_items}  primitives {self.last_primitives}",
+            f"tcl/frame: {ops}",
+        ]
+        for site, count in self.last_sites.most_common(top):
+            lines.append(f"{count:>5}  {site}")
+        return lines
+
+    def dump(self, path: str) -> str:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        sites = {
+            site: {"per_frame": sum(ops.values()) / max(1, self.frames), **ops}
+            for site, ops in sorted(self.totals.items(), key=lambda entry: -sum(entry[1].values()))
+        }
+        report = {
+            "frames": self.frames,
+            "peak_items": self.peak_items,
+            "peak_ops_per_frame": dict(self.peak_ops),
+            "sites": sites,
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        return path
@@ -1,4 +1,8 @@
+import math
 import random
+from array import array
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator
 
 WIDTH, HEIGHT = 960, 600
 BG = "#0f1326"
@@ -7,6 +11,11 @@ ACCENT = "#5fb6ff"
 DANGER = "#ff5555"
 SUCCESS = "#50fa7b"
 GOLD = "#ffb86c"
+SIM_STEP = 1.0 / 60.0
+ENTITY_FIELDS = ("x", "y", "vx", "vy", "radius", "speed", "kind")
+NUMPY_MIN_ENTITIES = 32
+
+_numpy: Any = None
 
 def lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
@@ -14,6 +23,341 @@ def lerp(a: float, b: float, t: float) -> float:
 def clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
+class SpatialHash:
+    """Uniform grid of points for radius and nearest-neighbour queries.
+
+    Items are tracked by identity, so plain dicts work. Pick ``cell_size``
+    near the usual query radius: a query then touches only a 3x3 block of
+    cells instead of every item. "Within r" means a distance strictly less
+    than r, matching the ``math.hypot(...) < r`` checks it replaces.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = float(cell_size)
+        self.cells: dict[tuple[int, int], list[Any]] = {}
+        self.entries: dict[int, tuple[Any, float, float, tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self.entries
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.entries.clear()
+
+    def insert(self, item: Any, x: float, y: float) -> None:
+        if id(item) in self.entries:
+            self.move(item, x, y)
+            return
+        cell = self.cell_of(x, y)
+        self.cells.setdefault(cell, []).append(item)
+        self.entries[id(item)] = (item, x, y, cell)
+
+    def remove(self, item: Any) -> None:
+        _, _, _, cell = self.entries.pop(id(item))
+        bucket = self.cells[cell]
+        for index, other in enumerate(bucket):
+            if other is item:
+                bucket.pop(index)
+                break
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, item: Any, x: float, y: float) -> None:
+        _, _, _, cell = self.entries[id(item)]
+        new_cell = self.cell_of(x, y)
+        if new_cell != cell:
+            self.remove(item)
+            self.cells.setdefault(new_cell, []).append(item)
+        self.entries[id(item)] = (item, x, y, new_cell)
+
+    def rebuild(self, items: Iterable[Any], position: Callable[[Any], tuple[float, float]]) -> None:
+        """Replace the contents with ``items``, cheaper than moving each one when most have changed cell."""
+        self.clear()
+        cell_size = self.cell_size
+        for item in items:
+            x, y = position(item)
+            cell = (math.floor(x / cell_size), math.floor(y / cell_size))
+            self.cells.setdefault(cell, []).append(item)
+            self.entries[id(item)] = (item, x, y, cell)
+
+    def _candidates(self, x: float, y: float, radius: float) -> Iterator[tuple[Any, float]]:
+        cell_size = self.cell_size
+        min_cx, min_cy = math.floor((x - radius) / cell_size), math.floor((y - radius) / cell_size)
+        max_cx, max_cy = math.floor((x + radius) / cell_size), math.floor((y + radius) / cell_size)
+        entries = self.entries
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for item in self.cells.get((cx, cy), ()):
+                    _, ix, iy, _ = entries[id(item)]
+                    yield item, math.hypot(ix - x, iy - y)
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[Any]:
+        return [item for item, dist in self._candidates(x, y, radius) if dist < radius]
+
+    def any_within(self, x: float, y: float, radius: float, exclude: Any = None) -> bool:
+        return any(dist < radius and item is not exclude for item, dist in self._candidates(x, y, radius))
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        max_radius: float = math.inf,
+        where: Callable[[Any], bool] | None = None,
+    ) -> Any | None:
+        """Closest item within ``max_radius`` (optionally passing ``where``), or None.
+
+        Searches outward ring by ring and stops once no unvisited cell can
+        hold anything closer than the best match so far.
+        """
+        if not self.entries:
+            return None
+        cell_size = self.cell_size
+        cx, cy = self.cell_of(x, y)
+        if math.isinf(max_radius):
+            max_ring = max(max(abs(ox - cx), abs(oy - cy)) for ox, oy in self.cells)
+        else:
+            max_ring = math.ceil(max_radius / cell_size) + 1
+        best, best_dist = None, max_radius
+        for ring in range(max_ring + 1):
+            for ox in range(cx - ring, cx + ring + 1):
+                edge = ox in (cx - ring, cx + ring)
+                for oy in range(cy - ring, cy + ring + 1) if edge else (cy - ring, cy + ring):
+                    for item in self.cells.get((ox, oy), ()):
+                        _, ix, iy, _ = self.entries[id(item)]
+                        dist = math.hypot(ix - x, iy - y)
+                        if dist < best_dist and (where is None or where(item)):
+                            best, best_dist = item, dist
+            # Every cell past this ring is at least ring * cell_size away.
+            if best is not None and best_dist <= ring * cell_size:
+                break
+        return best
+
+    def neighbour_pairs(self) -> Iterator[tuple[Any, Any]]:
+        """Each unordered pair of items in the same or touching cells, with no distance test.
+
+        For callers whose own per-pair test is cheaper than a distance and
+        whose reach is at most ``cell_size``.
+        """
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            for index, item in enumerate(bucket):
+                for other in bucket[index + 1:]:
+                    yield item, other
+            for offset in ((1, -1), (1, 0), (1, 1), (0, 1)):
+                other_bucket = cells.get((cx + offset[0], cy + offset[1]))
+                if other_bucket:
+                    for item in bucket:
+                        for other in other_bucket:
+                            yield item, other
+
+    def pairs_within(self, radius: float) -> Iterator[tuple[Any, Any]]:
+        """Each unordered pair of items closer than ``radius``, reported once."""
+        reach = math.ceil(radius / self.cell_size)
+        entries = self.entries
+        for (cx, cy), bucket in self.cells.items():
+            for ox in range(cx - reach, cx + reach + 1):
+                for oy in range(cy - reach, cy + reach + 1):
+                    if (ox, oy) < (cx, cy):
+                        continue
+                    other_bucket = self.cells.get((ox, oy))
+                    if not other_bucket:
+                        continue
+                    same = (ox, oy) == (cx, cy)
+                    for index, item in enumerate(bucket):
+                        _, ix, iy, _ = entries[id(item)]
+                        for other in other_bucket[index + 1:] if same else other_bucket:
+                            _, jx, jy, _ = entries[id(other)]
+                            if math.hypot(ix - jx, iy - jy) < radius:
+                                yield item, other
+
+def load_numpy() -> Any:
+    """NumPy if it is installed, else None. Imported on first use so startup never pays for it."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+class EntityStore:
+    """Point entities held column-wise: one contiguous ``array('d')`` per field.
+
+    Worlds hand the per-tick bulk work (integrate, home, cull, collide) to
+    the store instead of looping over per-entity dicts. Once a store holds
+    ``NUMPY_MIN_ENTITIES`` or more and NumPy is installed, each operation is
+    one vectorized pass over zero-copy views of the same buffers; smaller
+    stores, or machines without NumPy, walk the arrays in Python, which is
+    cheaper than NumPy's per-call overhead at a dozen entities. Removal keeps
+    the remaining entities in spawn order.
+
+    Both paths perform the same float64 operations in the same order and
+    avoid transcendental functions (square roots and squared distances
+    only), so they agree bit for bit and a replay does not depend on
+    whether NumPy is installed.
+    """
+
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        np = load_numpy() if use_numpy is not False else None
+        if use_numpy and np is None:
+            raise ImportError("EntityStore(use_numpy=True) needs NumPy")
+        self.np = np
+        # Forcing NumPy on vectorizes from the first entity, e.g. for benchmarks.
+        self.numpy_min = 0 if use_numpy else NUMPY_MIN_ENTITIES
+        self.columns = {name: array("d") for name in ENTITY_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.columns["x"])
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def _vectorized(self) -> bool:
+        return self.np is not None and len(self) >= max(1, self.numpy_min)
+
+    def _views(self, *names: str) -> list[Any]:
+        # Views must not outlive the call: an array exporting its buffer cannot grow.
+        return [self.np.frombuffer(self.columns[name]) for name in names]
+
+    def clear(self) -> None:
+        for values in self.columns.values():
+            del values[:]
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        vx: float = 0.0,
+        vy: float = 0.0,
+        radius: float = 0.0,
+        speed: float = 0.0,
+        kind: int = 0,
+    ) -> int:
+        for name, value in zip(ENTITY_FIELDS, (x, y, vx, vy, radius, speed, kind)):
+            self.columns[name].append(value)
+        return len(self) - 1
+
+    def get(self, index: int, name: str) -> float:
+        return self.columns[name][index]
+
+    def rows(self, *names: str) -> Iterator[tuple[float, ...]]:
+        """Yield the named fields of every entity, in order; for drawing."""
+        return zip(*(self.columns[name] for name in names))
+
+    def integrate(self, dt: float) -> None:
+        if self._vectorized():
+            x, y, vx, vy = self._views("x", "y", "vx", "vy")
+            x += vx * dt
+            y += vy * dt
+            return
+        x, y, vx, vy = (self.columns[name] for name in ("x", "y", "vx", "vy"))
+        for index in range(len(x)):
+            x[index] += vx[index] * dt
+            y[index] += vy[index] * dt
+
+    def home(self, tx: float, ty: float) -> None:
+        """Point every entity's velocity at (tx, ty) at its own ``speed``."""
+        # An entity sitting on the target heads along +x, as atan2(0, 0) would have it.
+        if self._vectorized():
+            np = self.np
+            x, y, vx, vy, speed = self._views("x", "y", "vx", "vy", "speed")
+            dx = tx - x
+            dy = ty - y
+            dist = np.sqrt(dx * dx + dy * dy)
+            moving = dist > 0.0
+            safe = np.where(moving, dist, 1.0)
+            vx[:] = np.where(moving, dx / safe, 1.0) * speed
+            vy[:] = np.where(moving, dy / safe, 0.0) * speed
+            return
+        x, y, vx, vy, speed = (self.columns[name] for name in ("x", "y", "vx", "vy", "speed"))
+        for index in range(len(x)):
+            dx = tx - x[index]
+            dy = ty - y[index]
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist > 0.0:
+                vx[index] = dx / dist * speed[index]
+                vy[index] = dy / dist * speed[index]
+            else:
+                vx[index] = 1.0 * speed[index]
+                vy[index] = 0.0 * speed[index]
+
+    def touching(self, x: float, y: float, reach: float = 0.0, use_radius: bool = True) -> list[int]:
+        """Indices closer to (x, y) than ``reach`` plus (optionally) their own radius."""
+        if self._vectorized():
+            xs, ys, radius = self._views("x", "y", "radius")
+            limit = radius + reach if use_radius else reach
+            dx = xs - x
+            dy = ys - y
+            return self.np.flatnonzero((dx * dx + dy * dy < limit * limit) & (limit > 0.0)).tolist()
+        xs, ys, radius = (self.columns[name] for name in ("x", "y", "radius"))
+        hits = []
+        for index in range(len(xs)):
+            dx = xs[index] - x
+            dy = ys[index] - y
+            limit = radius[index] + reach if use_radius else reach
+            if limit > 0.0 and dx * dx + dy * dy < limit * limit:
+                hits.append(index)
+        return hits
+
+    def covering(self, x: float, y: float, aspect: float = 1.0) -> list[int]:
+        """Indices whose box (half-width ``radius``, half-height ``radius * aspect``) contains (x, y)."""
+        if self._vectorized():
+            np = self.np
+            xs, ys, radius = self._views("x", "y", "radius")
+            return np.flatnonzero((np.abs(xs - x) < radius) & (np.abs(ys - y) < radius * aspect)).tolist()
+        xs, ys, radius = (self.columns[name] for name in ("x", "y", "radius"))
+        return [
+            index
+            for index in range(len(xs))
+            if abs(xs[index] - x) < radius[index] and abs(ys[index] - y) < radius[index] * aspect
+        ]
+
+    def outside(self, x1: float, y1: float, x2: float, y2: float) -> list[int]:
+        """Indices whose position is off the half-open rectangle [x1, x2) x [y1, y2)."""
+        if self._vectorized():
+            xs, ys = self._views("x", "y")
+            return self.np.flatnonzero((xs < x1) | (xs >= x2) | (ys < y1) | (ys >= y2)).tolist()
+        xs, ys = self.columns["x"], self.columns["y"]
+        return [index for index in range(len(xs)) if not (x1 <= xs[index] < x2 and y1 <= ys[index] < y2)]
+
+    def remove(self, indices: Iterable[int]) -> None:
+        drop = set(indices)
+        if not drop:
+            return
+        if self._vectorized():
+            keep = self.np.ones(len(self), dtype=bool)
+            keep[list(drop)] = False
+            for name in ENTITY_FIELDS:
+                kept = array("d", self.np.frombuffer(self.columns[name])[keep].tobytes())
+                self.columns[name] = kept
+            return
+        for name, values in self.columns.items():
+            self.columns[name] = array("d", (value for index, value in enumerate(values) if index not in drop))
+
+    def nearest(self, x: float, y: float, kind: int | None = None) -> int | None:
+        if not self:
+            return None
+        if self._vectorized():
+            np = self.np
+            xs, ys, kinds = self._views("x", "y", "kind")
+            dx = xs - x
+            dy = ys - y
+            dist = dx * dx + dy * dy
+            if kind is not None:
+                dist = np.where(kinds == kind, dist, np.inf)
+            best = int(dist.argmin())
+            return best if np.isfinite(dist[best]) else None
+        xs, ys, kinds = (self.columns[name] for name in ("x", "y", "kind"))
+        candidates = [index for index in range(len(xs)) if kind is None or kinds[index] == kind]
+        return min(candidates, key=lambda index: (xs[index] - x) * (xs[index] - x) + (ys[index] - y) * (ys[index] - y), default=None)
+
 class Audio:
     @staticmethod
     def play(sound_name: str):
@@ -26,7 +370,73 @@ class Audio:
         except:
              pass
 
+def simplify_path(points: list[tuple[float, float]], tolerance: float) -> list[tuple[float, float]]:
+    """Ramer-Douglas-Peucker: keep the endpoints and every point more than ``tolerance`` off the simplified line."""
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    spans = [(0, len(points) - 1)]
+    while spans:
+        start, end = spans.pop()
+        ax, ay = points[start]
+        bx, by = points[end]
+        dx, dy = bx - ax, by - ay
+        length = math.hypot(dx, dy)
+        worst, worst_dist = -1, tolerance
+        for index in range(start + 1, end):
+            px, py = points[index]
+            if length == 0.0:
+                dist = math.hypot(px - ax, py - ay)
+            else:
+                dist = abs(dy * (px - ax) - dx * (py - ay)) / length
+            if dist > worst_dist:
+                worst, worst_dist = index, dist
+        if worst >= 0:
+            keep[worst] = True
+            spans.append((start, worst))
+            spans.append((worst, end))
+    return [point for point, kept in zip(points, keep) if kept]
+
+class Route:
+    """Waypoints consumed from the front, with their flat line coordinates cached for drawing.
+
+    The cache is only rebuilt after ``advance``, so a retained canvas line
+    drawn from ``coords()`` sees new coordinates once per waypoint rather
+    than once per frame.
+    """
+
+    __slots__ = ("points", "_coords")
+
+    def __init__(self, points: Iterable[tuple[float, float]] = ()) -> None:
+        self.points: deque[tuple[float, float]] = deque(points)
+        self._coords: tuple[float, ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __bool__(self) -> bool:
+        return bool(self.points)
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        return self.points[index]
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return iter(self.points)
+
+    def advance(self) -> None:
+        self.points.popleft()
+        self._coords = None
+
+    def coords(self) -> tuple[float, ...]:
+        if self._coords is None:
+            self._coords = tuple(value for point in self.points for value in point)
+        return self._coords
+
+
 class Particle:
+    __slots__ = ("x", "y", "color", "vx", "vy", "life", "max_life", "size")
+
     def __init__(self, x: float, y: float, color: str, vx: float, vy: float, life: float, size: float = 2.0):
         self.x = x
         self.y = y
@@ -44,3 +454,153 @@ class Particle:
 
     def is_dead(self) -> bool:
         return self.life <= 0
+
+PARTICLE_CAPACITY = 256
+
+class ParticleEmitter:
+    """A continuous source: ``rate`` particles a second, fired in random directions."""
+
+    __slots__ = ("x", "y", "color", "rate", "speed", "life", "size", "carry", "active")
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        color: str,
+        rate: float,
+        speed: float,
+        life: tuple[float, float] = (0.25, 0.55),
+        size: tuple[float, float] = (2.0, 4.0),
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.color = color
+        self.rate = rate
+        self.speed = speed
+        self.life = life
+        self.size = size
+        self.carry = 0.0
+        self.active = True
+
+class ParticleSystem:
+    """Fixed-capacity particle pool with one preallocated array per field.
+
+    Live particles are packed into slots ``0..count-1``; one that dies is
+    replaced by the last live particle, so its slot is reused by the next
+    emit. Nothing is allocated per particle after construction. Emits past
+    capacity are dropped. Drawing issues one ``create_oval`` per live slot;
+    the engine's retained scene layer matches those calls to the canvas
+    items it already owns, so steady-state frames create no Tk items either.
+    Emitters fire from ``update``, drawing from the RNG the world passes in.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY) -> None:
+        self.capacity = capacity
+        self.count = 0
+        zeros = [0.0] * capacity
+        self.x = array("d", zeros)
+        self.y = array("d", zeros)
+        self.vx = array("d", zeros)
+        self.vy = array("d", zeros)
+        self.life = array("d", zeros)
+        self.max_life = array("d", zeros)
+        self.size = array("d", zeros)
+        self.color: list[str] = [""] * capacity
+        self.emitters: list[ParticleEmitter] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    def __iter__(self) -> Iterator[Particle]:
+        """Snapshot the live particles as ``Particle`` objects; for inspection, not the hot path."""
+        for index in range(self.count):
+            particle = Particle(self.x[index], self.y[index], self.color[index], self.vx[index], self.vy[index], self.life[index], self.size[index])
+            particle.max_life = self.max_life[index]
+            yield particle
+
+    def clear(self) -> None:
+        self.count = 0
+        self.emitters.clear()
+
+    def emit(self, x: float, y: float, color: str, vx: float, vy: float, life: float, size: float = 2.0) -> bool:
+        index = self.count
+        if index >= self.capacity:
+            return False
+        self.x[index] = x
+        self.y[index] = y
+        self.vx[index] = vx
+        self.vy[index] = vy
+        self.life[index] = life
+        self.max_life[index] = life
+        self.size[index] = size
+        self.color[index] = color
+        self.count = index + 1
+        return True
+
+    def append(self, particle: Particle) -> None:
+        """Accept a ``Particle`` like the plain list this replaced."""
+        self.emit(particle.x, particle.y, particle.color, particle.vx, particle.vy, particle.life, particle.size)
+
+    def burst(
+        self,
+        x: float,
+        y: float,
+        color: str,
+        count: int,
+        speed: float,
+        rng: random.Random,
+        life: tuple[float, float] = (0.25, 0.55),
+        size: tuple[float, float] = (2.0, 4.0),
+    ) -> None:
+        """``count`` particles from one point, each at a random angle and 35-100% of ``speed``."""
+        for _ in range(count):
+            angle = rng.uniform(0.0, math.tau)
+            magnitude = rng.uniform(speed * 0.35, speed)
+            self.emit(x, y, color, math.cos(angle) * magnitude, math.sin(angle) * magnitude, rng.uniform(*life), rng.uniform(*size))
+
+    def add_emitter(self, emitter: ParticleEmitter) -> ParticleEmitter:
+        self.emitters.append(emitter)
+        return emitter
+
+    def update(self, dt: float, rng: random.Random) -> None:
+        for emitter in self.emitters:
+            if not emitter.active:
+                continue
+            emitter.carry += emitter.rate * dt
+            due = int(emitter.carry)
+            emitter.carry -= due
+            if due:
+                self.burst(emitter.x, emitter.y, emitter.color, due, emitter.speed, rng, emitter.life, emitter.size)
+
+        x, y, vx, vy, life = self.x, self.y, self.vx, self.vy, self.life
+        index = 0
+        while index < self.count:
+            remaining = life[index] - dt
+            if remaining > 0:
+                life[index] = remaining
+                x[index] += vx[index] * dt
+                y[index] += vy[index] * dt
+                index += 1
+                continue
+            # Move the last live particle into this slot; it is updated on the next pass of the loop.
+            last = self.count - 1
+            if index != last:
+                for field in (x, y, vx, vy, life, self.max_life, self.size):
+                    field[index] = field[last]
+                self.color[index] = self.color[last]
+            self.count = last
+
+    def draw(self, canvas: Any, offset_x: float = 0.0, offset_y: float = 0.0, centered: bool = False) -> None:
+        """One oval per live particle; ``centered`` draws around the point instead of from its top-left."""
+        x, y, size, color = self.x, self.y, self.size, self.color
+        for index in range(self.count):
+            px = x[index] + offset_x
+            py = y[index] + offset_y
+            radius = size[index]
+            if centered:
+                canvas.create_oval(px - radius, py - radius, px + radius, py + radius, fill=color[index], outline="")
+            else:
+                canvas.create_oval(px, py, px + radius, py + radius, fill=color[index], outline="")
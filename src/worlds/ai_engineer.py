@@ -1,11 +1,10 @@
-import random
 import math
 import tkinter as tk
 from typing import Any
 
 from src.player import Player
 from src.utils import WIDTH, HEIGHT, clamp
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 
 class AIEngineerWorld(BaseWorld):
     def __init__(self) -> None:
@@ -65,14 +64,14 @@ class AIEngineerWorld(BaseWorld):
         
         # Generate 20 random cards
         for _ in range(self.max_cards):
-            template = random.choice(self.data_templates)
+            template = self.rng.choice(self.data_templates)
             self.cards.append({
                 "title": template["title"],
                 "body": template["body"],
-                "cred": int(random.uniform(*template["cred"])),
-                "peer": int(random.uniform(*template["peer"])),
-                "size": int(random.uniform(*template["size"])),
-                "bias": int(random.uniform(*template["bias"])),
+                "cred": int(self.rng.uniform(*template["cred"])),
+                "peer": int(self.rng.uniform(*template["peer"])),
+                "size": int(self.rng.uniform(*template["size"])),
+                "bias": int(self.rng.uniform(*template["bias"])),
             })
 
     def just_pressed(self, keys: set[str], key: str) -> bool:
@@ -140,9 +139,10 @@ class AIEngineerWorld(BaseWorld):
 
         return ("Review each dataset card, keep strong low-bias sources, and discard weak ones.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -193,7 +193,6 @@ class AIEngineerWorld(BaseWorld):
             self.grade = "F"
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw_bar(self, canvas: tk.Canvas, x: float, y: float, w: float, h: float, val: int, color: str, label: str) -> None:
         canvas.create_rectangle(x, y, x + w, y + h, fill="#2a3b4c", outline="#445c75")
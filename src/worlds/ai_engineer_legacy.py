@@ -37,7 +37,7 @@ class AIEngineerWorld(BaseWorld):
         self.success = False
         self.message = ""
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         
         self.ai_node = {"x": WIDTH/2, "y": 50, "speed": 160.0}
         self.data_points = []
@@ -4,7 +4,7 @@ import math
 
 from src.player import Player
 from src.utils import HEIGHT, TEXT, WIDTH, clamp
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 
 
 class ArchitectWorld(BaseWorld):
@@ -299,9 +299,10 @@ class ArchitectWorld(BaseWorld):
 
         return ("Budget exceeded! Remove expensive rooms with BACKSPACE.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         player.update(dt, keys, self.bounds)
@@ -311,7 +312,6 @@ class ArchitectWorld(BaseWorld):
             if self.finished:
                 self.success = False
                 self.message = "Deadline missed before the design review."
-                self.draw(canvas, player)
                 return
 
             for index, room in enumerate(self.room_types):
@@ -355,7 +355,6 @@ class ArchitectWorld(BaseWorld):
                     self.message = f"Design rejected. Review score: {int(self.review_score)}."
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw_workspace(self, canvas: tk.Canvas) -> None:
         canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#f4efe6", outline="")
@@ -453,9 +452,11 @@ class ArchitectWorld(BaseWorld):
         status_text = self.message or "Build out the program and submit for review."
         canvas.create_text(430, 563, text=status_text, fill="#3e2723", font=("Helvetica", 10, "bold"), width=360)
 
+    def draw_static(self, canvas: tk.Canvas) -> None:
+        self.draw_workspace(canvas)
+
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
-        self.draw_workspace(canvas)
         self.draw_status_bar(canvas)
         self.draw_program_panel(canvas)
         self.draw_grid(canvas, player)
@@ -1,11 +1,11 @@
-import random
 import math
 import time
 import tkinter as tk
-from src.utils import WIDTH, HEIGHT, TEXT, SUCCESS, DANGER
+from src.conflicts import Conflict, ConflictDetector
+from src.utils import WIDTH, HEIGHT, TEXT, SUCCESS, DANGER, GOLD, Route, SpatialHash, simplify_path
 from src.player import Player
-from src.worlds.base import BaseWorld
-from typing import Any, cast
+from src.worlds.base import BaseWorld, FrameInput
+from typing import Any, Iterator, cast
 
 class ATCWorld(BaseWorld):
     def __init__(self) -> None:
@@ -33,9 +33,18 @@ class ATCWorld(BaseWorld):
         self.plane_limit = 35
         self.is_drawing = False
         self.current_path = [] # list of (x,y)
+        self.current_coords: list[float] = []
+        self.route_tolerance = 4.0
         self.selected_plane = None
         self.collision_radius = 22.0
         self.landing_radius = 42.0
+        self.warning_radius = self.collision_radius * 2.5
+        self.conflict_horizon = 3.0
+        self.conflict_detector = ConflictDetector(self.warning_radius, self.conflict_horizon, bounds=(0, 0, WIDTH, HEIGHT))
+        self.plane_grid = SpatialHash(self.collision_radius)
+        self.conflicts: list[Conflict] = []
+        self.collisions = 0
+        self.end_on_collision = True
         
         self.runways = [
             {"x": WIDTH/2, "y": HEIGHT/2, "w": 320, "h": 60, "angle": 0},
@@ -51,9 +60,14 @@ class ATCWorld(BaseWorld):
         self.spawn_timer = 0.4
         self.is_drawing = False
         self.current_path = []
+        self.current_coords = []
         self.selected_plane = None
+        self.conflicts = []
+        self.conflict_detector.reset()
+        self.plane_grid.clear()
+        self.collisions = 0
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
 
     def calculate_grade(self) -> str:
         if not self.success:
@@ -75,25 +89,65 @@ class ATCWorld(BaseWorld):
         if self.is_drawing and self.selected_plane is not None:
             return ("Keep holding SPACE and drag a safe route. Release SPACE to assign it to this aircraft.", (float(self.selected_plane["x"]), float(self.selected_plane["y"])))
             
-        danger_plane = None
-        for i, p1 in enumerate(self.planes):
-            for p2 in self.planes[i+1:]:
-                if math.hypot(p1["x"] - p2["x"], p1["y"] - p2["y"]) < self.collision_radius * 2.5:
-                    danger_plane = p1
-                    break
-            if danger_plane: break
-            
-        if danger_plane:
-            return ("Collision warning: move the cursor onto this plane, hold SPACE, drag a new route, then release.", (float(danger_plane["x"]), float(danger_plane["y"])))
+        # Conflicts from the latest prediction, soonest first.
+        conflict = next(self.live_conflicts(), None)
+        if conflict is not None:
+            danger_plane = conflict.first
+            if conflict.imminent:
+                return ("Collision warning: move the cursor onto this plane, hold SPACE, drag a new route, then release.", (float(danger_plane["x"]), float(danger_plane["y"])))
+            remaining = max(0.0, conflict.time - self.conflict_detector.age)
+            return (f"Conflict predicted in {remaining:.1f}s: hold SPACE on this plane and route it clear of the other.", (float(danger_plane["x"]), float(danger_plane["y"])))
             
         runway = self.runways[0]
         far_plane = max(self.planes, key=lambda p: math.hypot(p["x"] - runway["x"], p["y"] - runway["y"]))
         
         return ("Move the cursor onto this plane, hold SPACE, and draw a path into the runway box.", (float(far_plane["x"]), float(far_plane["y"])))
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def live_conflicts(self) -> Iterator[Conflict]:
+        """The predicted conflicts whose planes are both still on the radar."""
+        for conflict in self.conflicts:
+            if not conflict.first["landed"] and not conflict.second["landed"]:
+                yield conflict
+
+    def spawn_plane(self) -> dict[str, Any]:
+        """Enter a plane at a random edge, heading roughly for the runway."""
+        side = self.rng.randint(0, 3)
+        if side == 0: x, y = self.rng.uniform(20, WIDTH-20), 20
+        elif side == 1: x, y = WIDTH-20, self.rng.uniform(20, HEIGHT-20)
+        elif side == 2: x, y = self.rng.uniform(20, WIDTH-20), HEIGHT-20
+        else: x, y = 20, self.rng.uniform(20, HEIGHT-20)
+        
+        target_x = WIDTH / 2 + self.rng.uniform(-155, 155)
+        target_y = HEIGHT / 2 + self.rng.uniform(-115, 115)
+        angle = math.atan2(target_y - y, target_x - x) + self.rng.uniform(-0.13, 0.13)
+        speed = self.rng.uniform(55, 80)
+        vx = math.cos(angle) * speed
+        vy = math.sin(angle) * speed
+        
+        plane = {
+            "x": x, "y": y, "vx": vx, "vy": vy, 
+            "path": Route(), "landed": False, "color": "#fff", "speed": speed
+        }
+        self.planes.append(plane)
+        return plane
+
+    def assign_route(self, plane: dict[str, Any], points: list[tuple[float, float]]) -> None:
+        """Give ``plane`` a drawn route and turn it toward the first waypoint."""
+        # Hand-drawn routes are dense and jittery; commit only the points that shape them.
+        route = Route(simplify_path(points, self.route_tolerance))
+        plane["path"] = route
+        if route:
+            pt = route[0]
+            angle = math.atan2(pt[1] - plane["y"], pt[0] - plane["x"])
+            speed = float(plane.get("speed", 105.0))
+            plane["vx"] = math.cos(angle) * speed
+            plane["vy"] = math.sin(angle) * speed
+
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
+        mouse_pos = frame.mouse_pos
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -103,24 +157,8 @@ class ATCWorld(BaseWorld):
         # Spawn planes
         self.spawn_timer -= dt
         if self.spawn_timer <= 0 and len(self.planes) < self.plane_limit:
-            self.spawn_timer = random.uniform(0.4, 1.1)
-            side = random.randint(0, 3)
-            if side == 0: x, y = random.uniform(20, WIDTH-20), 20
-            elif side == 1: x, y = WIDTH-20, random.uniform(20, HEIGHT-20)
-            elif side == 2: x, y = random.uniform(20, WIDTH-20), HEIGHT-20
-            else: x, y = 20, random.uniform(20, HEIGHT-20)
-            
-            target_x = WIDTH / 2 + random.uniform(-155, 155)
-            target_y = HEIGHT / 2 + random.uniform(-115, 115)
-            angle = math.atan2(target_y - y, target_x - x) + random.uniform(-0.13, 0.13)
-            speed = random.uniform(55, 80)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            self.planes.append({
-                "x": x, "y": y, "vx": vx, "vy": vy, 
-                "path": [], "landed": False, "color": "#fff", "speed": speed
-            })
+            self.spawn_timer = self.rng.uniform(0.4, 1.1)
+            self.spawn_plane()
             
         # Selection Logic
         if "space" in keys:
@@ -136,22 +174,19 @@ class ATCWorld(BaseWorld):
                     self.is_drawing = True
                     self.selected_plane = nearest
                     self.current_path = [(player.x, player.y)]
+                    self.current_coords = [player.x, player.y]
             else:
                 if len(self.current_path) == 0 or math.hypot(player.x - self.current_path[-1][0], player.y - self.current_path[-1][1]) > 15:
                     self.current_path.append((player.x, player.y))
+                    self.current_coords += (player.x, player.y)
         else:
             if self.is_drawing:
                 if self.selected_plane:
-                    self.selected_plane["path"] = self.current_path
-                    if self.current_path:
-                        pt = self.current_path[0]
-                        angle = math.atan2(pt[1] - self.selected_plane["y"], pt[0] - self.selected_plane["x"])
-                        speed = float(self.selected_plane.get("speed", 105.0))
-                        self.selected_plane["vx"] = math.cos(angle) * speed
-                        self.selected_plane["vy"] = math.sin(angle) * speed
+                    self.assign_route(self.selected_plane, self.current_path)
                 self.is_drawing = False
                 self.selected_plane = None
                 self.current_path = []
+                self.current_coords = []
 
         # Update Planes
         runway = self.runways[0]
@@ -165,7 +200,7 @@ class ATCWorld(BaseWorld):
                 dx, dy = target[0] - p["x"], target[1] - p["y"]
                 dist = math.hypot(dx, dy)
                 if dist < 10:
-                    p["path"].pop(0)
+                    p["path"].advance()
                 else:
                     angle = math.atan2(dy, dx)
                     speed = float(p.get("speed", 105.0))
@@ -184,28 +219,29 @@ class ATCWorld(BaseWorld):
 
             rx1, ry1, rx2, ry2 = rw_rect
             if rx1 <= p["x"] <= rx2 and ry1 <= p["y"] <= ry2:
+                p["landed"] = True
                 self.landed_count += 1
                 continue
             active_planes.append(p)
 
         # Collision detection
-        for i, p1 in enumerate(active_planes):
-            for p2 in active_planes[i+1:]:
-                if math.hypot(p1["x"] - p2["x"], p1["y"] - p2["y"]) < self.collision_radius:
-                    crashed = True
-                    break
-            if crashed: break
-            
+        self.plane_grid.rebuild(active_planes, lambda p: (p["x"], p["y"]))
+        crashed = next(self.plane_grid.pairs_within(self.collision_radius), None) is not None
+        # The prediction refreshes a few times a second; conflicts that name a landed plane are stale.
+        self.conflicts = self.conflict_detector.update(active_planes, dt)
+
         self.planes = active_planes
         
         if crashed:
+            self.collisions += 1
+        if crashed and self.end_on_collision:
             self.finished = True
             self.success = False
             self.message = "Operational safety compromised! Mid-air collision detected."
             self.shake = 8.0
             self.grade = "F"
             
-        if self.timer <= 0 and not crashed:
+        if self.timer <= 0 and not self.finished:
             self.finished = True
             self.success = self.landed_count >= 19
             if self.success:
@@ -216,12 +252,11 @@ class ATCWorld(BaseWorld):
                 self.grade = "F"
             
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
-        sx = random.uniform(-self.shake, self.shake) if self.shake > 0 else 0
-        sy = random.uniform(-self.shake, self.shake) if self.shake > 0 else 0
+        sx = self.fx_rng.uniform(-self.shake, self.shake) if self.shake > 0 else 0
+        sy = self.fx_rng.uniform(-self.shake, self.shake) if self.shake > 0 else 0
         bg = "#071207" if not self.high_contrast else "#000000"
         canvas.create_rectangle(sx, sy, WIDTH+sx, HEIGHT+sy, fill=bg)
         for i in range(1, 10):
@@ -236,14 +271,25 @@ class ATCWorld(BaseWorld):
             color = "#0f0" if p == self.selected_plane else "#fff"
             canvas.create_oval(p["x"]-8, p["y"]-8, p["x"]+8, p["y"]+8, fill=color, outline="")
             canvas.create_text(p["x"], p["y"]-15, text="FLT", fill=color, font=("Helvetica", 8))
-            if p["path"]:
-                pts = [(p["x"], p["y"])] + p["path"]
-                flat_pts = [c for pt in pts for c in pt]
-                if len(flat_pts) >= 4:
-                    canvas.create_line(flat_pts, fill=color, tag="path")
+            route = p["path"]
+            if route:
+                # Keyed by route, so items drawn before them never shift them. Only the leg to the next
+                # waypoint moves every frame; the rest of the route is reshaped when a waypoint is consumed.
+                tx, ty = route[0]
+                canvas.create_keyed((route, "leg"), "line", (p["x"], p["y"], tx, ty), fill=color, tag="path")
+                if len(route) > 1:
+                    canvas.create_keyed((route, "rest"), "line", route.coords(), fill=color, tag="path")
+        age = self.conflict_detector.age
+        for conflict in self.live_conflicts():
+            a, b = conflict.first, conflict.second
+            alert = DANGER if conflict.imminent else GOLD
+            canvas.create_line(a["x"], a["y"], b["x"], b["y"], fill=alert, dash=(3, 3))
+            for p in (a, b):
+                canvas.create_oval(p["x"]-14, p["y"]-14, p["x"]+14, p["y"]+14, outline=alert, width=2)
+            if not conflict.imminent:
+                canvas.create_text((a["x"] + b["x"]) / 2, (a["y"] + b["y"]) / 2 - 8, text=f"{max(0.0, conflict.time - age):.1f}s", fill=alert, font=("Helvetica", 8, "bold"))
         if self.is_drawing and len(self.current_path) > 1:
-            flat = [c for pt in self.current_path for c in pt]
-            canvas.create_line(flat, fill="#ff0", width=2, dash=(4,4))
+            canvas.create_line(self.current_coords, fill="#ff0", width=2, dash=(4,4))
         canvas.create_line(player.x-10, player.y, player.x+10, player.y, fill="#ff0")
         canvas.create_line(player.x, player.y-10, player.x, player.y+10, fill="#ff0")
         canvas.create_text(WIDTH-20, 60, anchor="e", text=f"Landed: {self.landed_count} / 19", fill="#0f0", font=("Helvetica", 14, "bold"))
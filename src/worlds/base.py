@@ -1,9 +1,16 @@
 import math
+import random
 import tkinter as tk
-from typing import Set
+from typing import NamedTuple, Set
 
 from src.player import Player
-from src.utils import ACCENT, DANGER, HEIGHT, Particle, SUCCESS, TEXT, WIDTH
+from src.profiler import NULL_PROFILER, NullProfiler
+from src.utils import ACCENT, DANGER, HEIGHT, ParticleSystem, SUCCESS, TEXT, WIDTH
+
+
+class FrameInput(NamedTuple):
+    keys: set[str]
+    mouse_pos: tuple[float, float]
 
 
 class BaseWorld:
@@ -29,7 +36,7 @@ class BaseWorld:
         self.hint_display_timer = 0.0
         self.current_hint_index = 0
         self.high_contrast = False
-        self.particles: list[Particle] = []
+        self.particles = ParticleSystem()
         self.shake = 0.0
         self.keys: Set[str] = set()
         self._pressed: dict[str, bool] = {}
@@ -44,10 +51,49 @@ class BaseWorld:
         self._last_player_position: tuple[float, float] | None = None
         self._hud_player: Player | None = None
         self._timer_ticked_this_frame = False
+        self.player: Player | None = None
+        self.rng = random.Random()
+        # Shake, flicker and other draw-only noise; never touched by simulate, so frames drawn cannot shift the sim.
+        self.fx_rng = random.Random()
+        self.seed: int | None = None
+
+    def seed_rng(self, seed: int | None = None) -> int:
+        """Reseed this world's private RNG; a fresh seed is drawn when none is given."""
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.fx_rng.seed(seed ^ 0xF00D)
+        return seed
+
+    def run_scores(self) -> dict[str, float]:
+        """Numeric ``*_score`` / ``*_count`` fields, logged with each finished run."""
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name.endswith(("_score", "_count")) and isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
 
     def reset(self, player: Player) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def simulate(self, dt: float, frame: FrameInput) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def draw(self, canvas: tk.Canvas, player: Player) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def step(self, dt: float, frame: FrameInput, profiler: NullProfiler = NULL_PROFILER) -> None:
+        """One fixed simulation tick, exactly as the engine runs it."""
+        self.keys = frame.keys
+        self.begin_frame()
+        profiler.call("tick_timer", self.tick_timer, dt)
+        profiler.call("simulate", self.simulate, dt, frame)
+        profiler.call("guidance", self.update_adaptive_guidance, dt, self.player, frame.keys)
+
+    def render(self, canvas: tk.Canvas) -> None:
+        self.draw(canvas, self.player)
+
     def update(
         self,
         dt: float,
@@ -55,8 +101,15 @@ class BaseWorld:
         player: Player,
         keys: set[str],
         mouse_pos: tuple[int, int],
-    ) -> None:  # pragma: no cover - interface
-        raise NotImplementedError
+    ) -> None:
+        """Advance one tick and draw it; simulate() and render() can also be driven separately."""
+        self.player = player
+        self.keys = keys
+        self.simulate(dt, FrameInput(keys, mouse_pos))
+        self.render(canvas)
+
+    def draw_static(self, canvas: tk.Canvas) -> None:
+        """Paint the backdrop that stays fixed for a whole run; drawn once per session."""
 
     def tick_timer(self, dt: float) -> None:
         if self._timer_ticked_this_frame:
@@ -97,6 +150,7 @@ class BaseWorld:
         self.adaptive_hint_ready = True
         self._last_player_position = (player.x, player.y)
         self._hud_player = player
+        self.player = player
 
     def just_pressed(self, keys: set[str], key: str) -> bool:
         is_down = key in keys
@@ -112,9 +166,7 @@ class BaseWorld:
         return is_down and not was_down
 
     def update_particles(self, dt: float) -> None:
-        for particle in self.particles:
-            particle.update(dt)
-        self.particles = [particle for particle in self.particles if not particle.is_dead()]
+        self.particles.update(dt, self.rng)
         if self.shake > 0:
             self.shake = max(0.0, self.shake - dt * 20)
 
@@ -290,15 +342,7 @@ class BaseWorld:
         #     canvas.create_text(WIDTH/2, HEIGHT/2 + 10, text="Use WASD / Arrows / Space", fill="#ffffff", font=("Helvetica", 10))
 
     def draw_particles(self, canvas: tk.Canvas) -> None:
-        for particle in self.particles:
-            canvas.create_oval(
-                particle.x,
-                particle.y,
-                particle.x + particle.size,
-                particle.y + particle.size,
-                fill=particle.color,
-                outline="",
-            )
+        self.particles.draw(canvas)
 
     def draw_result(self, canvas: tk.Canvas) -> None:
         color = "#ffff00" if self.high_contrast else (SUCCESS if self.success else DANGER)
@@ -358,6 +402,7 @@ class BaseWorld:
         accent = "#ffff00" if self.high_contrast else ACCENT
         copy_fill = "#ffffff" if self.high_contrast else "#dce9f7"
 
+        canvas.delete("all")
         canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill=bg_fill, outline="")
         if not self.high_contrast:
             canvas.create_oval(-80, -40, 260, 280, fill="#12314d", outline="")
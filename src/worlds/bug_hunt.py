@@ -1,10 +1,9 @@
-import random
 import math
 import time
 import tkinter as tk
 from src.utils import WIDTH, HEIGHT, TEXT, clamp
 from src.player import Player
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 from typing import Any, cast
 
 class BugHuntWorld(BaseWorld):
@@ -48,7 +47,7 @@ class BugHuntWorld(BaseWorld):
         self.deploy_progress = 0.0
         self.warning = ""
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.leak["r"] = 40.0
         self.nodes = [
             {"name": "Telemetry", "x": 200, "y": 200, "color": "#8be9fd"},
@@ -61,11 +60,11 @@ class BugHuntWorld(BaseWorld):
         for _ in range(5):
             self.glitches.append(
                 {
-                    "x": random.randint(180, WIDTH - 180),
-                    "y": random.randint(140, HEIGHT - 140),
-                    "dx": random.choice([-1, 1]) * random.uniform(80, 130),
-                    "dy": random.choice([-1, 1]) * random.uniform(80, 130),
-                    "r": random.randint(18, 28),
+                    "x": self.rng.randint(180, WIDTH - 180),
+                    "y": self.rng.randint(140, HEIGHT - 140),
+                    "dx": self.rng.choice([-1, 1]) * self.rng.uniform(80, 130),
+                    "dy": self.rng.choice([-1, 1]) * self.rng.uniform(80, 130),
+                    "r": self.rng.randint(18, 28),
                 }
             )
 
@@ -85,9 +84,10 @@ class BugHuntWorld(BaseWorld):
             
         return ("System stabilized. Deployment in progress.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
         self.tick_timer(dt)
         x1, y1, x2, y2 = self.bounds
@@ -155,7 +155,6 @@ class BugHuntWorld(BaseWorld):
             if math.hypot(player.x - nx, player.y - ny) < player.size + 18:
                 self.timer = max(0.0, self.timer - dt * 0.5)
                 self.warning = "Wrong Node!"
-        self.draw(canvas, player)
 
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
@@ -1,10 +1,9 @@
-import random
 import math
 import time
 import tkinter as tk
 from src.utils import WIDTH, HEIGHT, TEXT, clamp
 from src.player import Player
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 from typing import Any, cast
 
 class ChefRushWorld(BaseWorld):
@@ -68,7 +67,7 @@ class ChefRushWorld(BaseWorld):
         self.customers_served = 0
         self.customers_failed = 0
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         
         self.active_order = None
         self.current_steps = []
@@ -78,9 +77,9 @@ class ChefRushWorld(BaseWorld):
 
         # Spawn 3 customers
         self.customers = [
-             {"id": 0, "order": random.choice(list(self.recipes.keys())), "patience": 50.0, "max_patience": 50.0, "x": WIDTH/2 - 150, "y": 40},
-             {"id": 1, "order": random.choice(list(self.recipes.keys())), "patience": 55.0, "max_patience": 55.0, "x": WIDTH/2, "y": 40},
-             {"id": 2, "order": random.choice(list(self.recipes.keys())), "patience": 60.0, "max_patience": 60.0, "x": WIDTH/2 + 150, "y": 40}
+             {"id": 0, "order": self.rng.choice(list(self.recipes.keys())), "patience": 50.0, "max_patience": 50.0, "x": WIDTH/2 - 150, "y": 40},
+             {"id": 1, "order": self.rng.choice(list(self.recipes.keys())), "patience": 55.0, "max_patience": 55.0, "x": WIDTH/2, "y": 40},
+             {"id": 2, "order": self.rng.choice(list(self.recipes.keys())), "patience": 60.0, "max_patience": 60.0, "x": WIDTH/2 + 150, "y": 40}
         ]
 
     def get_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
@@ -112,9 +111,10 @@ class ChefRushWorld(BaseWorld):
             return (f"Stay on the {self.station_labels[next_station]} to complete this {customer['order']} step.", station_pos)
         return (f"Go straight to the {self.station_labels[next_station]} for the next {customer['order']} step.", station_pos)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -126,7 +126,7 @@ class ChefRushWorld(BaseWorld):
             if customer["patience"] <= 0:
                 self.customers_failed += 1
                 self.shake = 3.0
-                customer["order"] = random.choice(list(self.recipes.keys()))
+                customer["order"] = self.rng.choice(list(self.recipes.keys()))
                 customer["patience"] = customer["max_patience"]
                 if self.active_order == customer["id"]:
                     self.active_order = None
@@ -163,7 +163,7 @@ class ChefRushWorld(BaseWorld):
                 earned = int(customer["patience"])
                 self.money += earned
                 self.customers_served += 1
-                customer["order"] = random.choice(list(self.recipes.keys()))
+                customer["order"] = self.rng.choice(list(self.recipes.keys()))
                 customer["patience"] = customer["max_patience"]
                 self.active_order = None
                 self.repeat_customer = customer
@@ -214,12 +214,11 @@ class ChefRushWorld(BaseWorld):
                 self.grade = "F"
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
-        sx = random.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
-        sy = random.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
+        sx = self.fx_rng.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
+        sy = self.fx_rng.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
         
         bg = "#f3f3f3"
         canvas.create_rectangle(0+sx, 0+sy, WIDTH+sx, HEIGHT+sy, fill=bg)
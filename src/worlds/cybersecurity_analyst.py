@@ -1,10 +1,8 @@
-import random
 import math
 import tkinter as tk
-from src.utils import WIDTH, HEIGHT, TEXT, clamp, Particle
+from src.utils import WIDTH, HEIGHT, TEXT, EntityStore, clamp
 from src.player import Player
-from src.worlds.base import BaseWorld
-from typing import Any
+from src.worlds.base import BaseWorld, FrameInput
 
 class CybersecurityAnalystWorld(BaseWorld):
     def __init__(self) -> None:
@@ -26,7 +24,8 @@ class CybersecurityAnalystWorld(BaseWorld):
              "Tip: You are faster than the packets, prioritize targets.",
              "Tip: Protect the server integrity."
         ]
-        self.attacks: list[dict[str, Any]] = []
+        # Packets home on the server; radius is how close the firewall must get to intercept one.
+        self.attacks = EntityStore()
         self.integrity = 100.0
         self.server_x = WIDTH / 2
         self.server_y = HEIGHT / 2
@@ -38,17 +37,17 @@ class CybersecurityAnalystWorld(BaseWorld):
         self.success = False
         self.message = ""
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         
-        self.attacks = []
+        self.attacks.clear()
         self.integrity = 100.0
 
     def _build_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
         if not self.attacks:
             return ("No active breach. Hover near the CORE so you can cut off the next packet fast.", (self.server_x, self.server_y))
 
-        threat = min(self.attacks, key=lambda a: math.hypot(self.server_x - a["x"], self.server_y - a["y"]))
-        target_pos = (float(threat["x"]), float(threat["y"]))
+        threat = self.attacks.nearest(self.server_x, self.server_y)
+        target_pos = (self.attacks.get(threat, "x"), self.attacks.get(threat, "y"))
         dist_player = math.hypot(player.x - target_pos[0], player.y - target_pos[1])
         dist_server = math.hypot(self.server_x - target_pos[0], self.server_y - target_pos[1])
 
@@ -63,43 +62,38 @@ class CybersecurityAnalystWorld(BaseWorld):
     def get_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
         return self._build_adaptive_hint(player)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
         player.update(dt, keys, (0, 0, WIDTH, HEIGHT))
         
         # Spawn attacks
-        if random.random() < 1.4 * dt:
-            side = random.randint(0, 3)
-            if side == 0: x, y = random.uniform(0, WIDTH), -20
-            elif side == 1: x, y = WIDTH+20, random.uniform(0, HEIGHT)
-            elif side == 2: x, y = random.uniform(0, WIDTH), HEIGHT+20
-            else: x, y = -20, random.uniform(0, HEIGHT)
+        if self.rng.random() < 1.4 * dt:
+            side = self.rng.randint(0, 3)
+            if side == 0: x, y = self.rng.uniform(0, WIDTH), -20
+            elif side == 1: x, y = WIDTH+20, self.rng.uniform(0, HEIGHT)
+            elif side == 2: x, y = self.rng.uniform(0, WIDTH), HEIGHT+20
+            else: x, y = -20, self.rng.uniform(0, HEIGHT)
             
-            speed = random.uniform(55.0, 95.0)
-            self.attacks.append({"x": x, "y": y, "speed": speed})
+            speed = self.rng.uniform(55.0, 95.0)
+            self.attacks.add(x, y, radius=15.0, speed=speed)
 
-        new_attacks = []
-        for a in self.attacks:
-            angle = math.atan2(self.server_y - a["y"], self.server_x - a["x"])
-            a["x"] += math.cos(angle) * a["speed"] * dt
-            a["y"] += math.sin(angle) * a["speed"] * dt
-            
-            dist_server = math.hypot(self.server_x - a["x"], self.server_y - a["y"])
-            dist_player = math.hypot(player.x - a["x"], player.y - a["y"])
-            
-            if dist_player < player.size + 15: # Intercepted!
-                self.particles.append(Particle(a["x"], a["y"], "#00a8ff", 0, 0, 0.5, 5.0))
-            elif dist_server < 30: # Hit server!
-                self.integrity -= 10.0
-                self.shake = 5.0
-            else:
-                new_attacks.append(a)
-        self.attacks = new_attacks
+        self.attacks.home(self.server_x, self.server_y)
+        self.attacks.integrate(dt)
+        intercepted = self.attacks.touching(player.x, player.y, player.size)
+        for index in intercepted:
+            self.particles.emit(self.attacks.get(index, "x"), self.attacks.get(index, "y"), "#00a8ff", 0.0, 0.0, 0.5, 5.0)
+        # An intercept wins over a server hit on the same tick.
+        breaches = set(self.attacks.touching(self.server_x, self.server_y, 30.0, use_radius=False)) - set(intercepted)
+        for _ in breaches:
+            self.integrity -= 10.0
+            self.shake = 5.0
+        self.attacks.remove(intercepted + sorted(breaches))
         
         if self.integrity <= 0:
             self.finished = True
@@ -116,15 +110,14 @@ class CybersecurityAnalystWorld(BaseWorld):
 
         self.update_particles(dt)
         self.update_adaptive_guidance(dt, player, keys)
-        self.draw(canvas, player)
 
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
         sx, sy = 0, 0
         if self.shake > 0:
              self.shake = max(0, self.shake - 0.5)
-             sx = random.uniform(-self.shake, self.shake)
-             sy = random.uniform(-self.shake, self.shake)
+             sx = self.fx_rng.uniform(-self.shake, self.shake)
+             sy = self.fx_rng.uniform(-self.shake, self.shake)
              
         bg = "#111" if not self.high_contrast else "#000000"
         canvas.create_rectangle(sx, sy, WIDTH+sx, HEIGHT+sy, fill=bg)
@@ -138,12 +131,11 @@ class CybersecurityAnalystWorld(BaseWorld):
         canvas.create_text(self.server_x+sx, self.server_y+sy, text="CORE", fill="#4cd137", font=("Courier", 12, "bold"))
         
         # Attacks
-        for a in self.attacks:
-             canvas.create_polygon(a["x"]-10+sx, a["y"]+sy, a["x"]+sx, a["y"]-10+sy, a["x"]+10+sx, a["y"]+sy, a["x"]+sx, a["y"]+10+sy, fill="#e84118", outline="#fff")
+        for ax, ay in self.attacks.rows("x", "y"):
+             canvas.create_polygon(ax-10+sx, ay+sy, ax+sx, ay-10+sy, ax+10+sx, ay+sy, ax+sx, ay+10+sy, fill="#e84118", outline="#fff")
              
         # Particles
-        for p in self.particles:
-             canvas.create_oval(p.x-p.size+sx, p.y-p.size+sy, p.x+p.size+sx, p.y+p.size+sy, fill=p.color, outline="")
+        self.particles.draw(canvas, sx, sy, centered=True)
              
         # Player (Firewall)
         canvas.create_oval(player.x-25+sx, player.y-25+sy, player.x+25+sx, player.y+25+sy, fill="", outline="#00a8ff", width=4, dash=(4,4))
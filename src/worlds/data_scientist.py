@@ -1,9 +1,8 @@
-import random
 import math
 import tkinter as tk
 from src.utils import WIDTH, HEIGHT, TEXT, clamp
 from src.player import Player
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 from typing import Any
 
 class DataScientistWorld(BaseWorld):
@@ -35,7 +34,7 @@ class DataScientistWorld(BaseWorld):
         self.success = False
         self.message = ""
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.data_points = []
         self.model_accuracy = 50.0
 
@@ -74,9 +73,10 @@ class DataScientistWorld(BaseWorld):
 
         return ("Maintain model confidence by catching valid and bonus datasets.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -86,13 +86,13 @@ class DataScientistWorld(BaseWorld):
         self.model_accuracy = max(0.0, self.model_accuracy - dt * 2.5)
         
         # Spawn data - 30% increase
-        if random.random() < 1.3 * dt:
-            typ = random.choice(["valid", "anomaly", "bonus"])
+        if self.rng.random() < 1.3 * dt:
+            typ = self.rng.choice(["valid", "anomaly", "bonus"])
             if typ == "valid": color, speed = "#2ed573", 100
             elif typ == "anomaly": color, speed = "#ff4757", 150
             else: color, speed = "#ffa502", 80
             
-            self.data_points.append({"x": random.uniform(50, WIDTH-50), "y": -20, "type": typ, "color": color, "speed": speed})
+            self.data_points.append({"x": self.rng.uniform(50, WIDTH-50), "y": -20, "type": typ, "color": color, "speed": speed})
             
         new_data = []
         for d in self.data_points:
@@ -132,14 +132,13 @@ class DataScientistWorld(BaseWorld):
                 self.message = f"Deadline missed! Model confidence too low ({int(self.model_accuracy)}%)."
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
         sx, sy = 0, 0
         if self.shake > 0:
-             sx = random.uniform(-self.shake, self.shake)
-             sy = random.uniform(-self.shake, self.shake)
+             sx = self.fx_rng.uniform(-self.shake, self.shake)
+             sy = self.fx_rng.uniform(-self.shake, self.shake)
              
         bg = "#1e272e" if not self.high_contrast else "#000000"
         canvas.create_rectangle(sx, sy, WIDTH+sx, HEIGHT+sy, fill=bg)
@@ -1,11 +1,10 @@
 import math
-import random
 import tkinter as tk
 from typing import Any
 
 from src.player import Player
 from src.utils import HEIGHT, TEXT, WIDTH, clamp
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 
 
 class DoctorWorld(BaseWorld):
@@ -100,7 +99,7 @@ class DoctorWorld(BaseWorld):
         self.success = False
         self.message = ""
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.tutorial_timer = 4.0
         self.hint_display_timer = 0.0
         self.current_hint_index = 0
@@ -112,7 +111,7 @@ class DoctorWorld(BaseWorld):
         self.active_patient_id = None
 
     def create_patient(self, bed_index: int, case_id: str | None = None) -> dict[str, Any]:
-        case = self.case_by_id[case_id] if case_id else random.choice(self.case_types)
+        case = self.case_by_id[case_id] if case_id else self.rng.choice(self.case_types)
         bed = self.beds[bed_index]
         self.patient_counter += 1
         return {
@@ -125,8 +124,8 @@ class DoctorWorld(BaseWorld):
             "tool": case["tool"],
             "tool_name": case["tool_name"],
             "color": case["color"],
-            "stability": random.uniform(78.0, 96.0),
-            "drain_rate": random.uniform(3.0, 5.0),
+            "stability": self.rng.uniform(78.0, 96.0),
+            "drain_rate": self.rng.uniform(3.0, 5.0),
             "cure_progress": 0.0,
             "status": "waiting",
             "discharge_timer": 0.0,
@@ -142,7 +141,7 @@ class DoctorWorld(BaseWorld):
             if bed_index in occupied_beds:
                 continue
             spawn_rate = 0.9 if len(self.patients) < 2 else 0.45
-            if random.random() < spawn_rate:
+            if self.rng.random() < spawn_rate:
                 self.patients.append(self.create_patient(bed_index))
                 occupied_beds.add(bed_index)
 
@@ -257,10 +256,11 @@ class DoctorWorld(BaseWorld):
             
         return (f"Move to the lowest-stability patient with {patient['condition']}.", target_pos)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         player.update(dt, keys, self.bounds)
@@ -273,7 +273,6 @@ class DoctorWorld(BaseWorld):
                 self.grade = self.calculate_grade()
             else:
                 self.message = f"Shift over! Only {self.saved_patients} patients stabilized. ER integrity low."
-            self.draw(canvas, player)
             return
 
         self.spawn_patients()
@@ -282,11 +281,9 @@ class DoctorWorld(BaseWorld):
             self.handle_patient_treatment(dt, player, keys)
 
         if not self.update_patients(dt):
-            self.draw(canvas, player)
             return
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw_bed(self, canvas: tk.Canvas, bed: dict[str, float], sx: float, sy: float) -> None:
         bx = float(bed["x"])
@@ -346,8 +343,8 @@ class DoctorWorld(BaseWorld):
 
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
-        sx = random.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
-        sy = random.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
+        sx = self.fx_rng.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
+        sy = self.fx_rng.uniform(-self.shake, self.shake) if self.shake > 0 else 0.0
 
         bg = "#dff2ff" if not self.high_contrast else "#000000"
         canvas.create_rectangle(0.0 + sx, 0.0 + sy, WIDTH + sx, HEIGHT + sy, fill=bg, outline="")
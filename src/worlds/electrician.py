@@ -1,11 +1,10 @@
 import math
-import random
 import tkinter as tk
 from typing import Any
 
 from src.player import Player
-from src.utils import HEIGHT, WIDTH, clamp
-from src.worlds.base import BaseWorld
+from src.utils import HEIGHT, WIDTH, SpatialHash, clamp
+from src.worlds.base import BaseWorld, FrameInput
 
 
 class ElectricianWorld(BaseWorld):
@@ -61,6 +60,8 @@ class ElectricianWorld(BaseWorld):
         ]
         self.bounds = (self.BOARD_LEFT, self.BOARD_TOP, self.BOARD_RIGHT, self.BOARD_BOTTOM)
         self.faults: list[dict[str, Any]] = []
+        # Fault indices, keyed on their fixed board positions.
+        self.fault_grid = SpatialHash(65.0)
         self.breaker_states: dict[str, bool] = {}
         self.power_by_group: dict[str, float] = {}
         self.system_health = 100.0
@@ -78,7 +79,7 @@ class ElectricianWorld(BaseWorld):
         self.message = "Inspect the faults, isolate the right circuit, and repair safely."
         self.message_timer = 3.0
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.hint_display_timer = 0.0
         self.current_hint_index = 0
         self.system_health = 100.0
@@ -87,7 +88,7 @@ class ElectricianWorld(BaseWorld):
         self.active_repair_fault = -1
         self.breaker_states = {group["id"]: True for group in self.groups}
         self.power_by_group = {group["id"]: 100.0 for group in self.groups}
-        templates = random.sample(self.fault_templates, 5)
+        templates = self.rng.sample(self.fault_templates, 5)
         self.faults = []
         for index, template in enumerate(templates):
             x, y = self.fault_positions[index]
@@ -104,16 +105,11 @@ class ElectricianWorld(BaseWorld):
                     "y": y,
                 }
             )
+        self.fault_grid.rebuild(range(len(self.faults)), lambda index: (float(self.faults[index]["x"]), float(self.faults[index]["y"])))
 
     def nearest_fault(self, player: Player, radius: float = 65.0) -> int:
-        best_index = -1
-        best_dist = radius
-        for index, fault in enumerate(self.faults):
-            dist = math.hypot(player.x - float(fault["x"]), player.y - float(fault["y"]))
-            if dist < best_dist:
-                best_dist = dist
-                best_index = index
-        return best_index
+        index = self.fault_grid.nearest(player.x, player.y, radius)
+        return -1 if index is None else index
 
     def near_panel(self, player: Player, target: dict[str, float], radius: float = 70.0) -> bool:
         return math.hypot(player.x - target["x"], player.y - target["y"]) < radius
@@ -268,10 +264,11 @@ class ElectricianWorld(BaseWorld):
             return (f"Hold R here until {fault['name']} is fully repaired.", target_pos)
         return (f"Move to the isolated {fault['name']} and hold R to repair it.", target_pos)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -284,7 +281,6 @@ class ElectricianWorld(BaseWorld):
         self.update_fault_effects(dt)
         self.evaluate_outcome()
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw_background(self, canvas: tk.Canvas) -> None:
         canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#101821", outline="")
@@ -403,9 +399,11 @@ class ElectricianWorld(BaseWorld):
             canvas.create_text(x1 + 14, y, anchor="nw", text=label, fill="#dcecff", font=("Helvetica", 9), width=self.SIDE_PANEL_W - 28)
             y += 18
 
+    def draw_static(self, canvas: tk.Canvas) -> None:
+        self.draw_background(canvas)
+
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
-        self.draw_background(canvas)
         self.draw_top_bar(canvas)
         self.draw_fault_network(canvas)
         player.draw(canvas)
@@ -165,7 +165,7 @@ class TycoonWorld(BaseWorld):
         self.confirm_dialog_data = None
         self.scroll_offset = 0
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.tutorial_timer = 5.0
         self.first_purchase_made = False
         self.achievements = []
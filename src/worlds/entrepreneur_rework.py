@@ -1,11 +1,10 @@
 import math
-import random
 import tkinter as tk
 from typing import Any
 
 from src.player import Player
-from src.utils import HEIGHT, WIDTH, clamp
-from src.worlds.base import BaseWorld
+from src.utils import HEIGHT, WIDTH, SpatialHash, clamp
+from src.worlds.base import BaseWorld, FrameInput
 
 
 class TycoonWorld(BaseWorld):
@@ -120,7 +119,7 @@ class TycoonWorld(BaseWorld):
         self.grade = "-"
         self.message = "Scout the market and keep your empire solvent."
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.hint_display_timer = 0.0
         self.current_hint_index = 0
         self.cash = self.starting_cash
@@ -158,39 +157,41 @@ class TycoonWorld(BaseWorld):
         return is_down and not was_down
 
     def spawn_property(self) -> dict[str, Any]:
-        zone = random.choice(self.board_zones)
-        catalog = list(zone["focus"]) + random.sample(list(self.asset_specs.keys()), 2)
-        asset_type = random.choice(catalog)
+        zone = self.rng.choice(self.board_zones)
+        catalog = list(zone["focus"]) + self.rng.sample(list(self.asset_specs.keys()), 2)
+        asset_type = self.rng.choice(catalog)
         spec = self.asset_specs[asset_type]
         
         x, y = 0.0, 0.0
+        taken = SpatialHash(95.0)
+        taken.rebuild(self.properties, lambda p: (p["x"], p["y"]))
         # Try to spawn in zone first
         for _ in range(80):
-            angle = random.uniform(0.0, math.tau)
-            radius = random.uniform(0.0, zone["radius"])
+            angle = self.rng.uniform(0.0, math.tau)
+            radius = self.rng.uniform(0.0, zone["radius"])
             tx = clamp(zone["x"] + math.cos(angle) * radius, self.BOARD_LEFT + 52.0, self.BOARD_RIGHT - 52.0)
             ty = clamp(zone["y"] + math.sin(angle) * radius, self.BOARD_TOP + 18.0, self.BOARD_BOTTOM - 18.0)
             
-            if not any(math.hypot(tx - p["x"], ty - p["y"]) < 95.0 for p in self.properties):
+            if not taken.any_within(tx, ty, 95.0):
                 x, y = tx, ty
                 break
         
         # Global fallback if zone is too crowded
         if x == 0.0:
             for _ in range(100):
-                tx = random.uniform(self.BOARD_LEFT + 52.0, self.BOARD_RIGHT - 52.0)
-                ty = random.uniform(self.BOARD_TOP + 18.0, self.BOARD_BOTTOM - 18.0)
-                if not any(math.hypot(tx - p["x"], ty - p["y"]) < 95.0 for p in self.properties):
+                tx = self.rng.uniform(self.BOARD_LEFT + 52.0, self.BOARD_RIGHT - 52.0)
+                ty = self.rng.uniform(self.BOARD_TOP + 18.0, self.BOARD_BOTTOM - 18.0)
+                if not taken.any_within(tx, ty, 95.0):
                     x, y = tx, ty
                     break
         
         if x == 0.0: return None # Don't spawn if literally no room
 
-        market_price = self.market_prices[spec["price_key"]] * random.uniform(0.88, 1.12) * spec["price_scale"]
-        annual_yield = random.uniform(*spec["yield_range"])
-        annual_expense = random.uniform(*spec["expense_range"])
-        occupancy = random.uniform(0.84, 0.98)
-        quality = random.uniform(0.82, 1.14)
+        market_price = self.market_prices[spec["price_key"]] * self.rng.uniform(0.88, 1.12) * spec["price_scale"]
+        annual_yield = self.rng.uniform(*spec["yield_range"])
+        annual_expense = self.rng.uniform(*spec["expense_range"])
+        occupancy = self.rng.uniform(0.84, 0.98)
+        quality = self.rng.uniform(0.82, 1.14)
         risk = float(spec["volatility"])
 
         def monthly_flow(
@@ -212,13 +213,13 @@ class TycoonWorld(BaseWorld):
         monthly_cash_flow = monthly_flow(market_price, annual_yield, occupancy, annual_expense, quality, risk)
         
         # User wants very few negative deals (<10%). We force it for 95% of spawns.
-        is_hero_deal = random.random() < 0.95 
+        is_hero_deal = self.rng.random() < 0.95 
         boost_attempts = 0
         max_boosts = 8 if is_hero_deal else 3
         while (monthly_cash_flow < 0.0 if is_hero_deal else False) and boost_attempts < max_boosts:
-            annual_yield = min(spec["yield_range"][1], annual_yield + random.uniform(0.01, 0.06))
-            annual_expense = max(spec["expense_range"][0], annual_expense - random.uniform(0.001, 0.005))
-            occupancy = min(0.99, occupancy + random.uniform(0.01, 0.03))
+            annual_yield = min(spec["yield_range"][1], annual_yield + self.rng.uniform(0.01, 0.06))
+            annual_expense = max(spec["expense_range"][0], annual_expense - self.rng.uniform(0.001, 0.005))
+            occupancy = min(0.99, occupancy + self.rng.uniform(0.01, 0.03))
             quality = min(1.25, quality + 0.05)
             risk = max(0.12, risk - 0.03)
             monthly_cash_flow = monthly_flow(market_price, annual_yield, occupancy, annual_expense, quality, risk)
@@ -227,7 +228,7 @@ class TycoonWorld(BaseWorld):
         return {
             "id": len(self.properties) + 1,
             "asset_type": asset_type,
-            "name": f"{spec['label']} {random.randint(11, 98)}",
+            "name": f"{spec['label']} {self.rng.randint(11, 98)}",
             "zone": zone["name"],
             "sector": spec["sector"],
             "price_key": spec["price_key"],
@@ -254,7 +255,7 @@ class TycoonWorld(BaseWorld):
             ("Crypto sentiment breaks sharply lower.", {"crypto_miner": 0.88}),
             ("Urban rents firm up across the market.", {"real_estate": 1.05}),
         ]
-        text, effects = random.choice(events)
+        text, effects = self.rng.choice(events)
         for key, multiplier in effects.items():
             self.market_prices[key] *= multiplier
         self.event_message = text
@@ -328,7 +329,7 @@ class TycoonWorld(BaseWorld):
         self.selected_portfolio_idx = clamp(self.selected_portfolio_idx, 0, len(self.portfolio) - 1)
         index = int(self.selected_portfolio_idx)
         holding = self.portfolio.pop(index)
-        sale_price = float(holding["market_value"]) * random.uniform(0.985, 1.015)
+        sale_price = float(holding["market_value"]) * self.rng.uniform(0.985, 1.015)
         payoff = min(sale_price, float(holding.get("loan_principal", 0.0)))
         self.loan_balance = max(0.0, self.loan_balance - payoff)
         self.cash += sale_price - payoff
@@ -405,7 +406,7 @@ class TycoonWorld(BaseWorld):
             self.event_timer = max(0.0, self.event_timer - dt)
         for key, price in list(self.market_prices.items()):
             drift = self.market_drifts[key]
-            noise = random.uniform(-1.0, 1.0) * (0.012 + abs(drift) * 0.18)
+            noise = self.rng.uniform(-1.0, 1.0) * (0.012 + abs(drift) * 0.18)
             growth = drift * year_fraction + noise * math.sqrt(year_fraction) * 0.06
             if key == "crypto_miner":
                 growth *= 1.10
@@ -417,19 +418,19 @@ class TycoonWorld(BaseWorld):
                 history.pop(0)
         if self.market_timer >= 20.0:
             self.market_timer = 0.0
-            if random.random() < 0.30:
+            if self.rng.random() < 0.30:
                 self.trigger_market_event()
 
     def update_properties(self, dt: float) -> None:
         self.spawn_timer -= dt
         if self.spawn_timer <= 0.0:
-            self.spawn_timer = random.uniform(2.7, 4.6)
+            self.spawn_timer = self.rng.uniform(2.7, 4.6)
             if len(self.properties) < 12:
                 prop = self.spawn_property()
                 if prop: self.properties.append(prop)
         kept: list[dict[str, Any]] = []
         for prop in self.properties:
-            if random.random() < 0.012 * dt:
+            if self.rng.random() < 0.012 * dt:
                 continue
             spec = self.asset_specs[prop["asset_type"]]
             target = self.market_prices[prop["price_key"]] * spec["price_scale"] * prop["quality"]
@@ -460,11 +461,11 @@ class TycoonWorld(BaseWorld):
         for holding in self.portfolio:
             holding["stress"] = min(1.6, float(holding.get("stress", 0.0)) + dt * 0.015)
         if self.task_spawn_timer <= 0.0 and self.portfolio:
-            self.task_spawn_timer = random.uniform(18.0, 32.0)
+            self.task_spawn_timer = self.rng.uniform(18.0, 32.0)
             candidates = [holding for holding in self.portfolio if not any(task["holding_name"] == holding["name"] for task in self.active_tasks)]
             if candidates:
-                holding = random.choice(candidates)
-                task_type = random.choice(
+                holding = self.rng.choice(candidates)
+                task_type = self.rng.choice(
                     [
                         ("Tenant complaint", 240.0),
                         ("Equipment tune-up", 320.0),
@@ -476,8 +477,8 @@ class TycoonWorld(BaseWorld):
                         "holding_name": holding["name"],
                         "title": task_type[0],
                         "cost": task_type[1],
-                        "x": clamp(float(holding["x"]) + random.uniform(-34.0, 34.0), self.BOARD_LEFT + 28.0, self.BOARD_RIGHT - 28.0),
-                        "y": clamp(float(holding["y"]) + random.uniform(-34.0, 34.0), self.BOARD_TOP + 28.0, self.BOARD_BOTTOM - 28.0),
+                        "x": clamp(float(holding["x"]) + self.rng.uniform(-34.0, 34.0), self.BOARD_LEFT + 28.0, self.BOARD_RIGHT - 28.0),
+                        "y": clamp(float(holding["y"]) + self.rng.uniform(-34.0, 34.0), self.BOARD_TOP + 28.0, self.BOARD_BOTTOM - 28.0),
                     }
                 )
 
@@ -490,10 +491,10 @@ class TycoonWorld(BaseWorld):
             target_value = market_base * holding["quality"]
             blend = 0.30 if holding["sector"] in {"real_estate", "industrial"} else 0.52
             holding["market_value"] = holding["market_value"] * (1.0 - blend) + target_value * blend
-            if holding["sector"] in {"real_estate", "industrial"} and random.random() < 0.12 * dt:
+            if holding["sector"] in {"real_estate", "industrial"} and self.rng.random() < 0.12 * dt:
                 # Only increase expense if we have room before hitting the floor
                 if holding["cash_flow"] > holding["min_cash_flow"] + 60.0:
-                    holding["annual_expense"] *= random.uniform(1.01, 1.03)
+                    holding["annual_expense"] *= self.rng.uniform(1.01, 1.03)
             stress = float(holding.get("stress", 0.0))
             if stress > 0.75:
                 holding["annual_expense"] *= 1.0 + dt * 0.01
@@ -596,10 +597,11 @@ class TycoonWorld(BaseWorld):
             
         return ("Net worth target reached. Keep cash flow positive and clear any new service calls.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -636,7 +638,6 @@ class TycoonWorld(BaseWorld):
                 self.message = f"Quarter ended at {self.money(self.net_worth)} with {self.money(self.monthly_cash_flow)}/mo cash flow."
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def money(self, value: float) -> str:
         sign = "-" if value < 0 else ""
@@ -845,9 +846,11 @@ class TycoonWorld(BaseWorld):
             canvas.create_text(58, y, anchor="nw", text=line, fill="#d6e9f8", font=("Helvetica", 10), width=WIDTH - 120)
             y += 18
 
+    def draw_static(self, canvas: tk.Canvas) -> None:
+        self.draw_background(canvas)
+
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
-        self.draw_background(canvas)
         self.draw_top_bar(canvas)
         self.draw_footer(canvas)
         if self.ui_state == "game":
@@ -1,9 +1,8 @@
-import random
 import math
 import tkinter as tk
-from src.utils import WIDTH, HEIGHT, TEXT, clamp, lerp
+from src.utils import WIDTH, HEIGHT, TEXT, SpatialHash, clamp, lerp
 from src.player import Player
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 from typing import Any, cast
 
 class FireRescueWorld(BaseWorld):
@@ -34,6 +33,8 @@ class FireRescueWorld(BaseWorld):
         self.saved = 0
         self.heat = 0.0
         self.spread_cap = 12
+        self.max_flame_r = 34
+        self.flame_grid = SpatialHash(64.0)
 
     def reset(self, player: Player) -> None:
         start_x = self.bounds[0] + 20
@@ -47,8 +48,8 @@ class FireRescueWorld(BaseWorld):
         self.carrying = None
         self.survivors = [
             {
-                "x": random.randint(320, 860),
-                "y": random.randint(100, HEIGHT - 100),
+                "x": self.rng.randint(320, 860),
+                "y": self.rng.randint(100, HEIGHT - 100),
                 "state": "trapped",
                 "progress": 0.0,
             }
@@ -58,20 +59,21 @@ class FireRescueWorld(BaseWorld):
         for _ in range(7):
             self.flames.append(
                 {
-                    "x": random.randint(240, WIDTH - 40),
-                    "y": random.randint(80, HEIGHT - 80),
-                    "dx": random.choice([-1, 1]) * random.uniform(60, 110),
-                    "dy": random.choice([-1, 1]) * random.uniform(50, 100),
-                    "r": random.randint(20, 30),
-                    "spread": random.uniform(6.0, 11.0),
+                    "x": self.rng.randint(240, WIDTH - 40),
+                    "y": self.rng.randint(80, HEIGHT - 80),
+                    "dx": self.rng.choice([-1, 1]) * self.rng.uniform(60, 110),
+                    "dy": self.rng.choice([-1, 1]) * self.rng.uniform(50, 100),
+                    "r": self.rng.randint(20, 30),
+                    "spread": self.rng.uniform(6.0, 11.0),
                 }
             )
+        self.flame_grid.rebuild(self.flames, lambda flame: (flame["x"], flame["y"]))
         self.smoke = [
             {
-                "x": random.uniform(self.bounds[0], self.bounds[2]),
-                "y": random.uniform(self.bounds[1], self.bounds[3]),
-                "r": random.uniform(32, 55),
-                "rise": random.uniform(6, 18),
+                "x": self.rng.uniform(self.bounds[0], self.bounds[2]),
+                "y": self.rng.uniform(self.bounds[1], self.bounds[3]),
+                "r": self.rng.uniform(32, 55),
+                "rise": self.rng.uniform(6, 18),
             }
             for _ in range(10)
         ]
@@ -104,10 +106,11 @@ class FireRescueWorld(BaseWorld):
             
         return ("Move to the next survivor marker and start the rescue.", target_pos)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.update_particles(dt)
         if self.finished:
-            self.draw(canvas, player)
             return
         self.tick_timer(dt)
         x1, y1, x2, y2 = self.bounds
@@ -119,26 +122,28 @@ class FireRescueWorld(BaseWorld):
                 flame["dx"] *= -1
             if flame["y"] < y1 + 10 or flame["y"] > y2 - 10:
                 flame["dy"] *= -1
+            self.flame_grid.move(flame, flame["x"], flame["y"])
             flame["spread"] -= dt
             if flame["spread"] <= 0 and len(self.flames) < self.spread_cap:
-                flame["spread"] = random.uniform(7.0, 11.0)
-                new_r = clamp(flame["r"] + random.uniform(-4, 6), 14, 34)
+                flame["spread"] = self.rng.uniform(7.0, 11.0)
+                new_r = clamp(flame["r"] + self.rng.uniform(-4, 6), 14, self.max_flame_r)
                 self.flames.append(
                     {
-                        "x": clamp(flame["x"] + random.uniform(-30, 30), x1 + 20, x2 - 20),
-                        "y": clamp(flame["y"] + random.uniform(-30, 30), y1 + 20, y2 - 20),
-                        "dx": random.choice([-1, 1]) * random.uniform(70, 120),
-                        "dy": random.choice([-1, 1]) * random.uniform(60, 110),
+                        "x": clamp(flame["x"] + self.rng.uniform(-30, 30), x1 + 20, x2 - 20),
+                        "y": clamp(flame["y"] + self.rng.uniform(-30, 30), y1 + 20, y2 - 20),
+                        "dx": self.rng.choice([-1, 1]) * self.rng.uniform(70, 120),
+                        "dy": self.rng.choice([-1, 1]) * self.rng.uniform(60, 110),
                         "r": new_r,
-                        "spread": random.uniform(7.0, 11.0),
+                        "spread": self.rng.uniform(7.0, 11.0),
                     }
                 )
+                self.flame_grid.insert(self.flames[-1], self.flames[-1]["x"], self.flames[-1]["y"])
         for puff in self.smoke:
             puff["y"] -= puff["rise"] * dt
             puff["x"] += math.sin(puff["y"] * 0.08) * 10 * dt
             if puff["y"] < y1 - 40:
-                puff["y"] = y2 + random.uniform(10, 40)
-                puff["x"] = random.uniform(x1, x2)
+                puff["y"] = y2 + self.rng.uniform(10, 40)
+                puff["x"] = self.rng.uniform(x1, x2)
         # Survivor handling: pick up, carry, and evacuate to the door
         if not self.carrying:
             for survivor in self.survivors:
@@ -166,7 +171,7 @@ class FireRescueWorld(BaseWorld):
                 self.saved += 1
                 self.carrying = None
         self.survivors = [s for s in self.survivors if s["state"] != "saved"]
-        for flame in self.flames:
+        for flame in self.flame_grid.query_radius(player.x, player.y, player.size + self.max_flame_r):
             if math.hypot(player.x - flame["x"], player.y - flame["y"]) < player.size + flame["r"]:
                 self.heat += dt * 35
                 self.shake = 4.0
@@ -193,10 +198,7 @@ class FireRescueWorld(BaseWorld):
             self.grade = "S"
             self.message = "All survivors are safe! You cleared the building."
 
-        self.draw(canvas, player)
-
-    def draw(self, canvas: tk.Canvas, player: Player) -> None:
-        canvas.delete("all")
+    def draw_static(self, canvas: tk.Canvas) -> None:
         x1, y1, x2, y2 = self.bounds
         for i in range(6):
             shade = 20 + i * 6
@@ -221,6 +223,10 @@ class FireRescueWorld(BaseWorld):
         canvas.create_rectangle(dx1, dy1, dx2, dy2, fill="#c24747", outline="#d97e7e", width=3)
         canvas.create_polygon(dx2, dy1 + 10, dx2 + 20, (dy1 + dy2)/2, dx2, dy2 - 10, fill="#ffd166", outline="#ffb703", width=3)
         canvas.create_text(dx1 + 40, dy1 - 15, anchor="w", fill="#ffdd99", font=("Helvetica", 13, "bold"), text="Crew door")
+
+    def draw(self, canvas: tk.Canvas, player: Player) -> None:
+        canvas.delete("all")
+        x1, y1, x2, y2 = self.bounds
         for puff in self.smoke:
             canvas.create_oval(
                 puff["x"] - puff["r"],
@@ -232,7 +238,7 @@ class FireRescueWorld(BaseWorld):
                 width=1,
             )
         for flame in self.flames:
-            flicker = random.randint(-6, 6)
+            flicker = self.fx_rng.randint(-6, 6)
             r = flame["r"] + flicker * 0.15
             canvas.create_oval(
                 flame["x"] - r,
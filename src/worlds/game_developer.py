@@ -9,8 +9,8 @@ import tkinter as tk
 from dataclasses import dataclass
 
 from src.player import Player
-from src.utils import ACCENT, DANGER, HEIGHT, SUCCESS, TEXT, WIDTH, Particle, clamp
-from src.worlds.base import BaseWorld
+from src.utils import ACCENT, DANGER, HEIGHT, SUCCESS, TEXT, WIDTH, clamp
+from src.worlds.base import BaseWorld, FrameInput
 
 
 @dataclass(slots=True)
@@ -230,7 +230,8 @@ class BugDifficultyScaler:
 
 
 class BugManager:
-    def __init__(self, *, bounds: tuple[float, float, float, float], desk_pos: tuple[float, float]) -> None:
+    def __init__(self, *, bounds: tuple[float, float, float, float], desk_pos: tuple[float, float], rng: random.Random) -> None:
+        self.rng = rng
         self.bounds = bounds
         self.desk_pos = desk_pos
         self.bugs: list[Bug] = []
@@ -248,16 +249,16 @@ class BugManager:
             return
         x1, y1, x2, y2 = self.bounds
         for _ in range(n):
-            side = random.choice(["top", "right", "bottom", "left"])
+            side = self.rng.choice(["top", "right", "bottom", "left"])
             if side == "top":
-                x, y = random.uniform(x1 + 20, x2 - 20), y1
+                x, y = self.rng.uniform(x1 + 20, x2 - 20), y1
             elif side == "right":
-                x, y = x2, random.uniform(y1 + 20, y2 - 20)
+                x, y = x2, self.rng.uniform(y1 + 20, y2 - 20)
             elif side == "bottom":
-                x, y = random.uniform(x1 + 20, x2 - 20), y2
+                x, y = self.rng.uniform(x1 + 20, x2 - 20), y2
             else:
-                x, y = x1, random.uniform(y1 + 20, y2 - 20)
-            speed = random.uniform(speed_base * 0.85, speed_base * 1.25)
+                x, y = x1, self.rng.uniform(y1 + 20, y2 - 20)
+            speed = self.rng.uniform(speed_base * 0.85, speed_base * 1.25)
             self.bugs.append(Bug(x=x, y=y, speed=speed))
 
     def update_spawning(self, dt: float, *, spawn_mult: float, speed_base: float) -> None:
@@ -350,7 +351,8 @@ class ComplaintManager:
         "This is fun but broken.",
     ]
 
-    def __init__(self, *, bounds: tuple[float, float, float, float]) -> None:
+    def __init__(self, *, bounds: tuple[float, float, float, float], rng: random.Random) -> None:
+        self.rng = rng
         self.bounds = bounds
         self.popups: list[ComplaintPopup] = []
         self.spawn_timer = 2.8
@@ -366,18 +368,18 @@ class ComplaintManager:
             return
         x1, y1, x2, y2 = self.bounds
         for _ in range(n):
-            x = random.uniform(x1 + 60, x2 - 60)
-            y = random.uniform(y1 + 50, y2 - 50)
-            angle = random.uniform(0.0, math.tau)
-            speed = random.uniform(24.0, 48.0)
+            x = self.rng.uniform(x1 + 60, x2 - 60)
+            y = self.rng.uniform(y1 + 50, y2 - 50)
+            angle = self.rng.uniform(0.0, math.tau)
+            speed = self.rng.uniform(24.0, 48.0)
             self.popups.append(
                 ComplaintPopup(
                     x=x,
                     y=y,
                     vx=math.cos(angle) * speed,
                     vy=math.sin(angle) * speed,
-                    text=random.choice(self.POOL),
-                    timer=random.uniform(7.0, 11.0),
+                    text=self.rng.choice(self.POOL),
+                    timer=self.rng.uniform(7.0, 11.0),
                 )
             )
 
@@ -385,7 +387,7 @@ class ComplaintManager:
         self.spawn_timer -= dt
         if self.spawn_timer > 0.0:
             return
-        self.spawn_timer = random.uniform(3.0, 5.2) / max(0.6, spawn_mult)
+        self.spawn_timer = self.rng.uniform(3.0, 5.2) / max(0.6, spawn_mult)
         self.spawn(n=1)
 
     def update(self, dt: float, *, player: Player, systems: CoreSystems) -> None:
@@ -464,7 +466,8 @@ class ActiveChaosEvent:
 
 
 class ChaosEventManager:
-    def __init__(self) -> None:
+    def __init__(self, *, rng: random.Random) -> None:
+        self.rng = rng
         self.cooldown = 5.2
         self.timer = self.cooldown
         self.active: ActiveChaosEvent | None = None
@@ -491,8 +494,8 @@ class ChaosEventManager:
             if self.timer > 0.0:
                 return effects
             trigger_chance = clamp(0.16 + difficulty.chaos_meter * 0.55, 0.0, 0.85)
-            self.timer = random.uniform(4.2, 6.6) / max(0.6, 1.0 + difficulty.chaos_meter)
-            if random.random() > trigger_chance:
+            self.timer = self.rng.uniform(4.2, 6.6) / max(0.6, 1.0 + difficulty.chaos_meter)
+            if self.rng.random() > trigger_chance:
                 return effects
             self.active = self._roll_event(difficulty)
             self.set_toast(f"CHAOS EVENT: {self.active.name}", 2.4)
@@ -531,7 +534,7 @@ class ChaosEventManager:
             effects.crash_risk_bonus = 0.04 + 0.01 * difficulty.level
             effects.screen_flash = 0.08
             effects.shake = 0.5
-        if name == "Complaint Storm" and random.random() < 0.25 * dt:
+        if name == "Complaint Storm" and self.rng.random() < 0.25 * dt:
             complaints.spawn(n=1)
         return effects
 
@@ -551,7 +554,7 @@ class ChaosEventManager:
             if name == "Deadline Rush":
                 weight += int(difficulty.chaos_meter * 3)
             weights.append(max(1, weight))
-        name, desc, dur, _ = random.choices(events, weights=weights, k=1)[0]
+        name, desc, dur, _ = self.rng.choices(events, weights=weights, k=1)[0]
         return ActiveChaosEvent(name=name, description=desc, time_left=dur + 0.3 * difficulty.level)
 
 
@@ -634,9 +637,9 @@ class GameDeveloperWorld(BaseWorld):
 
         self.abilities = AbilitySystem()
         self.features = FeatureUnlockManager()
-        self.bugs = BugManager(bounds=self.office_bounds, desk_pos=self.desk_pos)
-        self.complaints = ComplaintManager(bounds=self.office_bounds)
-        self.chaos = ChaosEventManager()
+        self.bugs = BugManager(bounds=self.office_bounds, desk_pos=self.desk_pos, rng=self.rng)
+        self.complaints = ComplaintManager(bounds=self.office_bounds, rng=self.rng)
+        self.chaos = ChaosEventManager(rng=self.rng)
         self.panic = PanicModeManager(duration=self.duration)
 
         self.toast_text = ""
@@ -688,9 +691,9 @@ class GameDeveloperWorld(BaseWorld):
 
         self.abilities = AbilitySystem()
         self.features.on_reset()
-        self.bugs = BugManager(bounds=self.office_bounds, desk_pos=self.desk_pos)
-        self.complaints = ComplaintManager(bounds=self.office_bounds)
-        self.chaos = ChaosEventManager()
+        self.bugs = BugManager(bounds=self.office_bounds, desk_pos=self.desk_pos, rng=self.rng)
+        self.complaints = ComplaintManager(bounds=self.office_bounds, rng=self.rng)
+        self.chaos = ChaosEventManager(rng=self.rng)
         self.panic = PanicModeManager(duration=self.duration)
 
         self.toast_text = "Ship features. Survive chaos. Launch anyway."
@@ -706,11 +709,12 @@ class GameDeveloperWorld(BaseWorld):
         self.in_launch_window = False
 
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.update_particles(dt)
@@ -826,7 +830,7 @@ class GameDeveloperWorld(BaseWorld):
 
         # Movement (with bug-glitch interference).
         effective_keys = set(keys)
-        if bug_mod.input_glitch > 0.0 and random.random() < bug_mod.input_glitch:
+        if bug_mod.input_glitch > 0.0 and self.rng.random() < bug_mod.input_glitch:
             swapped = {
                 "Left": "Right",
                 "Right": "Left",
@@ -887,13 +891,13 @@ class GameDeveloperWorld(BaseWorld):
         # Update Pings spawning
         self.ping_timer -= dt
         if self.ping_timer <= 0 and len(self.slack_pings) < 13:
-            px = random.uniform(self.office_bounds[0] + 50, self.office_bounds[2] - 50)
-            py = random.uniform(self.office_bounds[1] + 50, self.office_bounds[3] - 50)
+            px = self.rng.uniform(self.office_bounds[0] + 50, self.office_bounds[2] - 50)
+            py = self.rng.uniform(self.office_bounds[1] + 50, self.office_bounds[3] - 50)
             # Avoid stations
             if math.hypot(px - self.desk_pos[0], py - self.desk_pos[1]) > 100 and \
                math.hypot(px - self.support_pos[0], py - self.support_pos[1]) > 100:
-                self.slack_pings.append({"x": px, "y": py, "life": random.uniform(7.0, 10.0)})
-                self.ping_timer = random.uniform(1.5, 3.5)
+                self.slack_pings.append({"x": px, "y": py, "life": self.rng.uniform(7.0, 10.0)})
+                self.ping_timer = self.rng.uniform(1.5, 3.5)
 
         for ping in list(self.slack_pings):
             ping["life"] -= dt
@@ -904,7 +908,7 @@ class GameDeveloperWorld(BaseWorld):
 
         # Crash risk spikes (13+ bugs and/or System Failure).
         crash_per_sec = bug_mod.crash_risk_per_sec + chaos_fx.crash_risk_bonus
-        if crash_per_sec > 0.0 and random.random() < crash_per_sec * dt:
+        if crash_per_sec > 0.0 and self.rng.random() < crash_per_sec * dt:
             spike = 20.0 + 4.0 * self.difficulty.level
             self.systems.add_stability(-spike)
             self.toast_text = "Crash spike: stack trace everywhere."
@@ -980,7 +984,6 @@ class GameDeveloperWorld(BaseWorld):
             self.status_text = "Move to the Dev Desk to code, then clean bugs and complaints."
 
         self.systems.clamp_all()
-        self.draw(canvas, player)
 
         if self.finished and self.success:
             shipped_count = int(self.features.shipped)
@@ -989,10 +992,7 @@ class GameDeveloperWorld(BaseWorld):
             self._save_meta()
 
     def _spawn_particles(self, x: float, y: float, color: str, n: int, speed: float) -> None:
-        for _ in range(n):
-            ang = random.uniform(0.0, math.tau)
-            mag = random.uniform(speed * 0.35, speed)
-            self.particles.append(Particle(x, y, color, math.cos(ang) * mag, math.sin(ang) * mag, random.uniform(0.25, 0.55), size=random.uniform(2.0, 4.0)))
+        self.particles.burst(x, y, color, n, speed, self.rng)
 
     def _draw_player(self, canvas: tk.Canvas, *, x: float, y: float, size: float) -> None:
         canvas.create_oval(x - size - 4, y - size + 6, x + size + 4, y + size + 8, fill="#0a2235", outline="")
@@ -1034,8 +1034,8 @@ class GameDeveloperWorld(BaseWorld):
         oy = 0.0
         if self.shake > 0.0:
             strength = 6.0 * clamp(self.shake, 0.0, 2.0)
-            ox = random.uniform(-strength, strength)
-            oy = random.uniform(-strength, strength)
+            ox = self.fx_rng.uniform(-strength, strength)
+            oy = self.fx_rng.uniform(-strength, strength)
 
         x1, y1, x2, y2 = self.office_bounds
         x1 += ox
@@ -1102,7 +1102,7 @@ class GameDeveloperWorld(BaseWorld):
         self.draw_particles(canvas)
 
         # Visual warnings.
-        if self.flicker_strength > 0.0 and random.random() < self.flicker_strength:
+        if self.flicker_strength > 0.0 and self.fx_rng.random() < self.flicker_strength:
             canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#ff3344", outline="", stipple="gray25")
         if self.screen_flash > 0.0:
             canvas.create_rectangle(0, 0, WIDTH, HEIGHT, fill="#ffffff", outline="", stipple="gray25")
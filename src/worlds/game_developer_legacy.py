@@ -212,7 +212,7 @@ class GameDeveloperWorld(BaseWorld):
         self.review_log = []
         self.review_score = 0.0
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.section_checkpoint = {"progress": self.progress, "feature_index": 0}
         self.feedback_cooldown = 0.0
         self.interact_cooldown = 0.0
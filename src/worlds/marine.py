@@ -1,9 +1,8 @@
-import random
 import math
 import tkinter as tk
-from src.utils import WIDTH, HEIGHT, TEXT, clamp, lerp
+from src.utils import WIDTH, HEIGHT, TEXT, SpatialHash, clamp, lerp
 from src.player import Player
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 from typing import Any, cast
 
 class MarineWorld(BaseWorld):
@@ -34,6 +33,8 @@ class MarineWorld(BaseWorld):
         self.oxygen = 100.0
         self.scanned_count = 0
         self.collected_count = 0
+        self.fish_grid = SpatialHash(80.0)
+        self.shark_grid = SpatialHash(50.0)
         
         self.scan_target: dict | None = None
         self.scan_timer = 0.0
@@ -59,23 +60,26 @@ class MarineWorld(BaseWorld):
         self.fish = []
         species = [{"name": "Tang", "c": "#1e90ff"}, {"name": "Turtle", "c": "#32cd32"}, {"name": "Jelly", "c": "#e6e6fa"}]
         for _ in range(6):
-            s = random.choice(species)
+            s = self.rng.choice(species)
             self.fish.append({
-                "x": random.uniform(100, WIDTH-100), "y": random.uniform(200, HEIGHT-150),
-                "dx": random.choice([-1, 1]) * random.uniform(50, 90), "dy": random.uniform(-20, 20),
+                "x": self.rng.uniform(100, WIDTH-100), "y": self.rng.uniform(200, HEIGHT-150),
+                "dx": self.rng.choice([-1, 1]) * self.rng.uniform(50, 90), "dy": self.rng.uniform(-20, 20),
                 "color": s["c"], "scanned": False, "w": 40
             })
         
         self.sharks = []
         for _ in range(2):
             self.sharks.append({
-                "x": random.uniform(100, WIDTH-100), "y": random.uniform(300, HEIGHT-100),
-                "dx": random.choice([-1, 1]) * 120, "dy": random.uniform(-18, 18), "w": 60
+                "x": self.rng.uniform(100, WIDTH-100), "y": self.rng.uniform(300, HEIGHT-100),
+                "dx": self.rng.choice([-1, 1]) * 120, "dy": self.rng.uniform(-18, 18), "w": 60
             })
 
+        self.fish_grid.rebuild(self.fish, lambda f: (f["x"], f["y"]))
+        self.shark_grid.rebuild(self.sharks, lambda s: (s["x"], s["y"]))
+
         self.samples = []
         for _ in range(3):
-            self.samples.append({"x": random.uniform(100, WIDTH-100), "y": HEIGHT-70, "collected": False})
+            self.samples.append({"x": self.rng.uniform(100, WIDTH-100), "y": HEIGHT-70, "collected": False})
             
         self.discoveries = [
             {"x": 150, "y": HEIGHT-65, "name": "Sunken Anchor", "found": False, "msg": "An old pirate anchor!"},
@@ -83,8 +87,8 @@ class MarineWorld(BaseWorld):
         ]
 
     def get_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
-        nearby_shark = min(self.sharks, key=lambda s: math.hypot(player.x - s["x"], player.y - s["y"]), default=None)
-        if nearby_shark and math.hypot(player.x - nearby_shark["x"], player.y - nearby_shark["y"]) < 85:
+        nearby_shark = self.shark_grid.nearest(player.x, player.y, 85)
+        if nearby_shark:
             return ("Shark too close. Swim away before collecting anything else.", (float(nearby_shark["x"]), float(nearby_shark["y"])))
 
         if self.collected_count < 3:
@@ -97,9 +101,8 @@ class MarineWorld(BaseWorld):
                 return ("Dive to this glowing seabed sample and collect it.", target_pos)
         
         if self.scanned_count < 3:
-            unscanned = [f for f in self.fish if not f["scanned"]]
-            if unscanned:
-                target = min(unscanned, key=lambda f: math.hypot(player.x - f["x"], player.y - f["y"]))
+            target = self.fish_grid.nearest(player.x, player.y, where=lambda f: not f["scanned"])
+            if target:
                 target_pos = (float(target["x"]), float(target["y"]))
                 if math.hypot(player.x - target_pos[0], player.y - target_pos[1]) < 80:
                     return ("Hold SPACE next to this fish until the scan completes.", target_pos)
@@ -107,10 +110,11 @@ class MarineWorld(BaseWorld):
         
         return ("Expedition goals reached. Keep exploring or wait for surface-ascent.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -135,6 +139,7 @@ class MarineWorld(BaseWorld):
                 f["dx"] *= -1
             if f["y"] <= y1 + 40 or f["y"] >= y2 - 60:
                 f["dy"] *= -1
+            self.fish_grid.move(f, f["x"], f["y"])
         
         for s in self.sharks:
             s["x"] += s["dx"] * dt
@@ -143,31 +148,29 @@ class MarineWorld(BaseWorld):
                 s["dx"] *= -1
             if s["y"] <= y1 + 70 or s["y"] >= y2 - 40:
                 s["dy"] *= -1
-            
-            # Shark Bite Logic
-            dist = math.hypot(player.x - s["x"], player.y - s["y"])
-            if dist < 50:
-                 # Check for recent bite to prevent instant death
-                 if not s.get("bite_cooldown", 0) > 0:
-                      self.oxygen = max(0.0, self.oxygen - 15.0) # BIG HIT
-                      self.shake = 8.0
-                      s["bite_cooldown"] = 2.0 # Wait 2s before biting again
-            
+            self.shark_grid.move(s, s["x"], s["y"])
+
+        # Shark Bite Logic
+        for s in self.shark_grid.query_radius(player.x, player.y, 50):
+            # Check for recent bite to prevent instant death
+            if not s.get("bite_cooldown", 0) > 0:
+                self.oxygen = max(0.0, self.oxygen - 15.0) # BIG HIT
+                self.shake = 8.0
+                s["bite_cooldown"] = 2.0 # Wait 2s before biting again
+        for s in self.sharks:
             if s.get("bite_cooldown", 0) > 0:
                  s["bite_cooldown"] -= dt
 
-        # Scanning
-        self.scan_target = None
-        for f in self.fish:
-            if math.hypot(player.x - f["x"], player.y - f["y"]) < 80 and not f["scanned"]:
-                self.scan_target = f
-                if "space" in keys:
-                    self.scan_timer += dt
-                    if self.scan_timer > 1.2:
-                        f["scanned"] = True
-                        self.scanned_count += 1
-                        self.scan_timer = 0
-                break
+        # Scanning: lock onto the closest unscanned fish in range
+        self.scan_target = self.fish_grid.nearest(player.x, player.y, 80, where=lambda f: not f["scanned"])
+        f = self.scan_target
+        if f is not None:
+            if "space" in keys:
+                self.scan_timer += dt
+                if self.scan_timer > 1.2:
+                    f["scanned"] = True
+                    self.scanned_count += 1
+                    self.scan_timer = 0
         else: self.scan_timer = 0
 
         # Samples
@@ -205,16 +208,17 @@ class MarineWorld(BaseWorld):
                  self.message = "Expedition failure! Too little data collected before blackout."
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
-    def draw(self, canvas: tk.Canvas, player: Player) -> None:
-        canvas.delete("all")
+    def draw_static(self, canvas: tk.Canvas) -> None:
         # Water
         for i in range(5):
              shade = 180 - i*30
              canvas.create_rectangle(0, i*(HEIGHT/5), WIDTH, (i+1)*(HEIGHT/5), fill=f"#00{shade:02x}ff", outline="")
         canvas.create_rectangle(0, HEIGHT-60, WIDTH, HEIGHT, fill="#d2b48c") # Seabed
 
+    def draw(self, canvas: tk.Canvas, player: Player) -> None:
+        canvas.delete("all")
+
         for d in self.discoveries:
              color = "#f1c40f" if not d["found"] else "#7f8c8d"
              canvas.create_text(d["x"], d["y"], text="?", fill=color, font=("Arial", 20, "bold"))
@@ -1,11 +1,12 @@
-import random
 import math
 import time
 import tkinter as tk
-from src.utils import WIDTH, HEIGHT, TEXT, clamp
+from src.utils import WIDTH, HEIGHT, TEXT, EntityStore, clamp
 from src.player import Player
-from src.worlds.base import BaseWorld
-from typing import Any
+from src.worlds.base import BaseWorld, FrameInput
+
+STORM = 1
+CLOUD_ASPECT = 0.6
 
 class PilotWorld(BaseWorld):
     def __init__(self) -> None:
@@ -29,8 +30,9 @@ class PilotWorld(BaseWorld):
         ]
         self.hull = 100.0
         self.fuel = 100.0
-        self.clouds: list[dict[str, Any]] = []
-        self.fuels: list[dict[str, Any]] = []
+        # Clouds: radius is half the width, kind 1 marks a storm cloud. Fuel radius is the pickup reach.
+        self.clouds = EntityStore()
+        self.fuels = EntityStore()
         self.scroll_speed = 300.0
         
     def reset(self, player: Player) -> None:
@@ -41,78 +43,76 @@ class PilotWorld(BaseWorld):
         self.message = ""
         self.hull = 100.0
         self.fuel = 100.0
-        self.clouds = []
-        self.fuels = []
+        self.clouds.clear()
+        self.fuels.clear()
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         player.speed = 600.0
 
     def _build_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
         if self.fuel <= 25:
-            if self.fuels:
-                target = min(self.fuels, key=lambda f: math.hypot(player.x - f["x"], player.y - f["y"]))
-                target_pos = (float(target["x"]), float(target["y"]))
+            target = self.fuels.nearest(player.x, player.y)
+            if target is not None:
+                target_pos = (self.fuels.get(target, "x"), self.fuels.get(target, "y"))
                 return (f"Fuel critical at {int(self.fuel)}%. Intercept this green pickup before you do anything else.", target_pos)
             return (f"Fuel critical at {int(self.fuel)}%. Hold a safe line and scan for the next pickup.", None)
 
-        danger_cloud = min((c for c in self.clouds if c["bad"]), key=lambda c: math.hypot(player.x - c["x"], player.y - c["y"]), default=None)
+        danger_cloud = self.clouds.nearest(player.x, player.y, kind=STORM)
         if danger_cloud is not None:
-            target_pos = (float(danger_cloud["x"]), float(danger_cloud["y"]))
+            target_pos = (self.clouds.get(danger_cloud, "x"), self.clouds.get(danger_cloud, "y"))
             dist = math.hypot(player.x - target_pos[0], player.y - target_pos[1])
             if dist < 130:
                 return (f"Hull at {int(self.hull)}%. Break away from this dark storm cloud immediately.", target_pos)
 
         if self.fuel < 65:
-            safe_fuel = min(self.fuels, key=lambda f: math.hypot(player.x - f["x"], player.y - f["y"]), default=None)
+            safe_fuel = self.fuels.nearest(player.x, player.y)
             if safe_fuel is not None:
-                target_pos = (float(safe_fuel["x"]), float(safe_fuel["y"]))
+                target_pos = (self.fuels.get(safe_fuel, "x"), self.fuels.get(safe_fuel, "y"))
                 return (f"Fuel is down to {int(self.fuel)}%. Top off with this pickup while the sky is clear.", target_pos)
 
         if danger_cloud is not None:
-            return ("A storm front is ahead. Thread the open gap and keep your hull out of the dark cloud.", (float(danger_cloud["x"]), float(danger_cloud["y"])))
+            return ("A storm front is ahead. Thread the open gap and keep your hull out of the dark cloud.", target_pos)
 
         return ("Airspace is clear right now. Stay centered, preserve fuel, and be ready for the next storm line.", None)
 
     def get_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
         return self._build_adaptive_hint(player)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
+        self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
-        # tick_timer handled by engine
+        self.tick_timer(dt)
         player.update(dt, keys, self.bounds)
         self.fuel -= dt * 5  # Balanced drainrate
         
         # Spawn clouds
-        if random.random() < 0.05 + dt:
-            w = random.uniform(80, 200)
-            self.clouds.append({"x": random.uniform(0, WIDTH), "y": -100, "w": w, "h": w*0.6, "bad": random.random() < 0.35})
+        if self.rng.random() < 0.05 + dt:
+            w = self.rng.uniform(80, 200)
+            x = self.rng.uniform(0, WIDTH)
+            kind = STORM if self.rng.random() < 0.35 else 0
+            self.clouds.add(x, -100, vy=self.scroll_speed, radius=w / 2, kind=kind)
             
         # Spawn fuel
-        if random.random() < 0.007 + dt * 0.01:
-            self.fuels.append({"x": random.uniform(20, WIDTH-20), "y": -20})
+        if self.rng.random() < 0.007 + dt * 0.01:
+            self.fuels.add(self.rng.uniform(20, WIDTH-20), -20, vy=self.scroll_speed, radius=30)
             
-        new_clouds = []
         in_bad_cloud = False
         in_cloud = False
         
-        for c in self.clouds:
-            c["y"] += self.scroll_speed * dt
-            
-            # Collision with player
-            if player.x > c["x"] - c["w"]/2 and player.x < c["x"] + c["w"]/2 and player.y > c["y"] - c["h"]/2 and player.y < c["y"] + c["h"]/2:
-                if c["bad"]:
-                    self.hull -= dt * 80
-                    self.shake = 5.0
-                    in_bad_cloud = True
-                else:
-                    in_cloud = True
-                    
-            if c["y"] < HEIGHT + 200:
-                new_clouds.append(c)
-        self.clouds = new_clouds
+        self.clouds.integrate(dt)
+        # Collision with player; a cloud's box is w wide and 0.6 w tall
+        for index in self.clouds.covering(player.x, player.y, aspect=CLOUD_ASPECT):
+            if self.clouds.get(index, "kind") == STORM:
+                self.hull -= dt * 80
+                self.shake = 5.0
+                in_bad_cloud = True
+            else:
+                in_cloud = True
+        self.clouds.remove(self.clouds.outside(-math.inf, -math.inf, math.inf, HEIGHT + 200))
         
         if in_bad_cloud:
             player.speed = 250.0
@@ -121,14 +121,11 @@ class PilotWorld(BaseWorld):
         else:
             player.speed = 520.0
         
-        new_fuels = []
-        for f in self.fuels:
-            f["y"] += self.scroll_speed * dt
-            if abs(player.x - f["x"]) < 30 and abs(player.y - f["y"]) < 30:
-                self.fuel = min(100.0, self.fuel + 15.0)
-            elif f["y"] < HEIGHT + 50:
-                new_fuels.append(f)
-        self.fuels = new_fuels
+        self.fuels.integrate(dt)
+        collected = self.fuels.covering(player.x, player.y)
+        for _ in collected:
+            self.fuel = min(100.0, self.fuel + 15.0)
+        self.fuels.remove(collected + self.fuels.outside(-math.inf, -math.inf, math.inf, HEIGHT + 50))
         
         if self.hull <= 0:
             self.finished = True
@@ -149,26 +146,16 @@ class PilotWorld(BaseWorld):
             elif score >= 50: self.grade = "B"
             else: self.grade = "C"
             self.message = "Mission Accomplished! Destination reached."
-            
-            
-    def get_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
-        return self._build_adaptive_hint(player)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
-        self.keys = keys
-        if self.finished:
-            self.draw(canvas, player)
-            return
+        self.update_particles(dt)
 
-        self.tick_timer(dt)
-        player.update(dt, keys, (0, 0, WIDTH, HEIGHT))
-        self.update_adaptive_guidance(dt, player, keys)
+    def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
         
         sx, sy = 0, 0
         if self.shake > 0:
-             sx = random.uniform(-self.shake, self.shake)
-             sy = random.uniform(-self.shake, self.shake)
+             sx = self.fx_rng.uniform(-self.shake, self.shake)
+             sy = self.fx_rng.uniform(-self.shake, self.shake)
              
         bg = "#4b7bec" if not self.high_contrast else "#000000"
         canvas.create_rectangle(sx, sy, WIDTH+sx, HEIGHT+sy, fill=bg)
@@ -179,15 +166,17 @@ class PilotWorld(BaseWorld):
             canvas.create_line(0, ly, WIDTH, ly, fill="#5588ff", width=1)
             
         # Draw clouds
-        for c in self.clouds:
-            color = "#a5b1c2" if not c["bad"] else "#2c3e50"
-            if self.high_contrast: color = "#222222" if c["bad"] else "#dddddd"
-            canvas.create_oval(c["x"] - c["w"]/2 + sx, c["y"] - c["h"]/2 + sy, c["x"] + c["w"]/2 + sx, c["y"] + c["h"]/2 + sy, fill=color, outline="")
+        for cx, cy, half_w, kind in self.clouds.rows("x", "y", "radius", "kind"):
+            bad = kind == STORM
+            color = "#a5b1c2" if not bad else "#2c3e50"
+            if self.high_contrast: color = "#222222" if bad else "#dddddd"
+            half_h = half_w * CLOUD_ASPECT
+            canvas.create_oval(cx - half_w + sx, cy - half_h + sy, cx + half_w + sx, cy + half_h + sy, fill=color, outline="")
             
         # Draw fuels
-        for f in self.fuels:
-            canvas.create_rectangle(f["x"] - 12 + sx, f["y"] - 15 + sy, f["x"] + 12 + sx, f["y"] + 15 + sy, fill="#20bf6b", outline="#fff", width=2)
-            canvas.create_text(f["x"] + sx, f["y"] + sy, text="F", fill="#fff", font=("Helvetica", 10, "bold"))
+        for fx, fy in self.fuels.rows("x", "y"):
+            canvas.create_rectangle(fx - 12 + sx, fy - 15 + sy, fx + 12 + sx, fy + 15 + sy, fill="#20bf6b", outline="#fff", width=2)
+            canvas.create_text(fx + sx, fy + sy, text="F", fill="#fff", font=("Helvetica", 10, "bold"))
             
         # Draw player
         px, py = player.x + sx, player.y + sy
@@ -207,6 +196,6 @@ class PilotWorld(BaseWorld):
         canvas.create_rectangle(22, 92, 22 + 196 * max(0.0, self.fuel) / 100.0, 108, fill="#20bf6b", outline="")
         canvas.create_text(120, 100, text="FUEL", fill="#fff", font=("Helvetica", 9, "bold"))
         
+        self.draw_hud(canvas)
         if self.finished:
             self.draw_result(canvas)
-        self.draw_hud(canvas)
@@ -1,11 +1,10 @@
 import math
-import random
 import tkinter as tk
 from typing import Any
 
 from src.player import Player
 from src.utils import HEIGHT, TEXT, WIDTH, clamp
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 
 
 class PsychologistWorld(BaseWorld):
@@ -107,7 +106,7 @@ class PsychologistWorld(BaseWorld):
         self.message = "Assess the room, then choose the right intervention."
         self.message_timer = 3.0
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         self.hint_display_timer = 0.0
         self.current_hint_index = 0
         self.active_patient = -1
@@ -116,7 +115,7 @@ class PsychologistWorld(BaseWorld):
         self.completed_sessions = 0
         self.global_risk = 0.0
 
-        templates = random.sample(self.client_templates, 4)
+        templates = self.rng.sample(self.client_templates, 4)
         base_distress = [34.0, 48.0, 56.0, 42.0]
         base_rates = [0.95, 1.6, 1.7, 1.4]
         self.patients = []
@@ -132,9 +131,9 @@ class PsychologistWorld(BaseWorld):
                     "notes": template["notes"],
                     "focus": template["focus"],
                     "secondary_focus": template["secondary_focus"],
-                    "distress": base_distress[index] + random.uniform(-6.0, 10.0),
-                    "baseline_rate": base_rates[index] + random.uniform(-0.35, 0.45),
-                    "rapport": 45.0 + random.uniform(-8.0, 8.0),
+                    "distress": base_distress[index] + self.rng.uniform(-6.0, 10.0),
+                    "baseline_rate": base_rates[index] + self.rng.uniform(-0.35, 0.45),
+                    "rapport": 45.0 + self.rng.uniform(-8.0, 8.0),
                     "progress": 0.0,
                     "speaking": template["cue"],
                     "bubble_timer": 3.5,
@@ -175,10 +174,11 @@ class PsychologistWorld(BaseWorld):
             
         return ("Move to the active client and match their cue words to the right intervention key.", target_pos)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -223,14 +223,14 @@ class PsychologistWorld(BaseWorld):
             patient["bubble_timer"] = max(0.0, float(patient["bubble_timer"]) - dt)
             patient["cooldown"] = max(0.0, float(patient["cooldown"]) - dt)
             if patient["bubble_timer"] <= 0:
-                patient["speaking"] = random.choice(
+                patient["speaking"] = self.rng.choice(
                     [
                         str(patient["cue"]),
                         f"Need: {patient['issue']}",
                         f"Observe: {patient['notes']}",
                     ]
                 )
-                patient["bubble_timer"] = random.uniform(2.6, 4.3)
+                patient["bubble_timer"] = self.rng.uniform(2.6, 4.3)
 
             intervention = self.interventions[self.selected_intervention]
             treating_here = index == self.active_patient and "space" in keys
@@ -245,9 +245,9 @@ class PsychologistWorld(BaseWorld):
                     distress_rate += 0.8
                 patient["distress"] = clamp(float(patient["distress"]) + distress_rate * dt, 0.0, 100.0)
 
-            if not treating_here and random.random() < 0.09 * dt and float(patient["distress"]) < 88:
-                patient["distress"] = clamp(float(patient["distress"]) + random.uniform(5.0, 9.0), 0.0, 100.0)
-                patient["speaking"] = random.choice(
+            if not treating_here and self.rng.random() < 0.09 * dt and float(patient["distress"]) < 88:
+                patient["distress"] = clamp(float(patient["distress"]) + self.rng.uniform(5.0, 9.0), 0.0, 100.0)
+                patient["speaking"] = self.rng.choice(
                     [
                         "I am losing control.",
                         "I cannot organize my thoughts.",
@@ -330,7 +330,6 @@ class PsychologistWorld(BaseWorld):
                 self.grade = "F"
 
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def get_patient_color(self, distress: float) -> str:
         if distress >= 80:
@@ -0,0 +1,97 @@
+import importlib
+from typing import NamedTuple
+
+from src.worlds.base import BaseWorld
+
+
+class WorldSpec(NamedTuple):
+    module: str
+    class_name: str
+    name: str
+    summary: str
+    duration: float
+
+
+# Hub key -> world spec, in hub display order. The hub renders from these
+# alone; a world's module is imported the first time it is actually played.
+WORLD_SPECS: dict[str, WorldSpec] = {
+    "1": WorldSpec(
+        "src.worlds.fire_rescue", "FireRescueWorld", "Firefighter Rescue",
+        "Navigate smoke, dodge flames, and carry survivors out", 55.0,
+    ),
+    "2": WorldSpec(
+        "src.worlds.chef_rush", "ChefRushWorld", "Executive Chef",
+        "Take orders, follow the recipe book, and deliver food to impatient customers!", 75.0,
+    ),
+    "3": WorldSpec(
+        "src.worlds.bug_hunt", "BugHuntWorld", "Systems Engineer",
+        "Secure the network infrastructure before the integrity breach", 50.0,
+    ),
+    "4": WorldSpec(
+        "src.worlds.marine", "MarineWorld", "Marine Biologist",
+        "Dive, scan fish, and collect specimens while avoiding predators", 62.0,
+    ),
+    "5": WorldSpec(
+        "src.worlds.architect", "ArchitectWorld", "Lead Architect",
+        "Lay out a civic library that meets budget, program, adjacencies, and circulation goals.", 75.0,
+    ),
+    "6": WorldSpec(
+        "src.worlds.doctor", "DoctorWorld", "Doctor",
+        "Read patient charts, grab the right treatment, and stabilize the ER.", 60.0,
+    ),
+    "7": WorldSpec(
+        "src.worlds.atc", "ATCWorld", "Air Traffic Control",
+        "Coordinate approach vectors to land aircraft safely", 70.0,
+    ),
+    "8": WorldSpec(
+        "src.worlds.pilot", "PilotWorld", "Pilot",
+        "Safely navigate aircraft through turbulent weather conditions", 60.0,
+    ),
+    "9": WorldSpec(
+        "src.worlds.software_developer", "SoftwareDeveloperWorld", "Software Developer",
+        "Balance incident triage, implementation, review, and interruptions to ship a stable release.", 105.0,
+    ),
+    "0": WorldSpec(
+        "src.worlds.psychologist", "PsychologistWorld", "Psychologist",
+        "Triage clients, identify what they need, and use the right intervention to de-escalate the room.", 90.0,
+    ),
+    "q": WorldSpec(
+        "src.worlds.entrepreneur_rework", "TycoonWorld", "Tycoon Empire",
+        "Scout opportunities, manage a realistic portfolio, and finish the quarter with strong cash flow.", 240.0,
+    ),
+    "w": WorldSpec(
+        "src.worlds.electrician", "ElectricianWorld", "Electrician",
+        "Diagnose overloaded circuits, isolate the right panel, repair faults, and restore the building safely.", 105.0,
+    ),
+    "e": WorldSpec(
+        "src.worlds.game_developer", "GameDeveloperWorld", "Game Developer",
+        "Ship features under chaos. Bugs multiply, complaints swarm, motivation burns. Keep stability alive long enough to launch.",
+        120.0,
+    ),
+    "r": WorldSpec(
+        "src.worlds.data_scientist", "DataScientistWorld", "Data Scientist",
+        "Analyze data to predict system outcomes", 72.0,
+    ),
+    "t": WorldSpec(
+        "src.worlds.ai_engineer", "AIEngineerWorld", "AI Engineer",
+        "Review datasets, filter out bias, and collect enough quality data to train your model.", 120.0,
+    ),
+    "y": WorldSpec(
+        "src.worlds.cybersecurity_analyst", "CybersecurityAnalystWorld", "Cybersecurity Analyst",
+        "Defend systems from cyber attacks", 90.0,
+    ),
+    "u": WorldSpec(
+        "src.worlds.robotics_engineer", "RoboticsEngineerWorld", "Robotics Engineer",
+        "Build and stabilize a functioning robot", 90.0,
+    ),
+}
+WORLD_ORDER = list(WORLD_SPECS)
+
+
+def load_world_class(key: str) -> type[BaseWorld]:
+    spec = WORLD_SPECS[key]
+    return getattr(importlib.import_module(spec.module), spec.class_name)
+
+
+def create_world(key: str) -> BaseWorld:
+    return load_world_class(key)()
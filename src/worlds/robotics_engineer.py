@@ -1,10 +1,9 @@
-import random
 import math
 import time
 import tkinter as tk
 from src.utils import WIDTH, HEIGHT, TEXT, clamp
 from src.player import Player
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 from typing import Any
 
 class RoboticsEngineerWorld(BaseWorld):
@@ -41,10 +40,10 @@ class RoboticsEngineerWorld(BaseWorld):
         self.success = False
         self.message = ""
         self.shake = 0.0
-        self.particles = []
+        self.particles.clear()
         
         self.active_parts = []
-        self.current_req = random.choice(self.parts)
+        self.current_req = self.rng.choice(self.parts)
         self.robots_built = 0
         self.robot_stability = 100.0
         player.speed = 450.0
@@ -72,19 +71,20 @@ class RoboticsEngineerWorld(BaseWorld):
     def get_adaptive_hint(self, player: Player) -> tuple[str, tuple[float, float] | None]:
         return self._build_adaptive_hint(player)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         self.keys = keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
         player.update(dt, keys, (0, 0, WIDTH, HEIGHT))
         self.update_adaptive_guidance(dt, player, keys)
 
-        if random.random() < 2.5 * dt:
-            typ = random.choice(self.parts)
-            side = random.choice(["left", "right"])
+        if self.rng.random() < 2.5 * dt:
+            typ = self.rng.choice(self.parts)
+            side = self.rng.choice(["left", "right"])
             x = 50 if side == "left" else WIDTH - 50
             y = -40
 
@@ -104,7 +104,7 @@ class RoboticsEngineerWorld(BaseWorld):
             if math.hypot(player.x - part["x"], player.y - part["y"]) < 30:
                 if part["type"] == self.current_req:
                     self.robot_stability = min(100.0, self.robot_stability + 10.0)
-                    self.current_req = random.choice(self.parts)
+                    self.current_req = self.rng.choice(self.parts)
                     self.robots_built += 0.34
                 else:
                     self.robot_stability -= 25.0
@@ -134,14 +134,12 @@ class RoboticsEngineerWorld(BaseWorld):
             else:
                 self.message = "Deadline missed! The assembly line failed to produce a working unit."
 
-        self.draw(canvas, player)
-
     def draw(self, canvas: tk.Canvas, player: Player) -> None:
         canvas.delete("all")
         sx, sy = 0, 0
         if self.shake > 0:
-             sx = random.uniform(-self.shake, self.shake)
-             sy = random.uniform(-self.shake, self.shake)
+             sx = self.fx_rng.uniform(-self.shake, self.shake)
+             sy = self.fx_rng.uniform(-self.shake, self.shake)
              
         bg = "#f5f6fa" if not self.high_contrast else "#000000"
         canvas.create_rectangle(sx, sy, WIDTH+sx, HEIGHT+sy, fill=bg)
@@ -1,11 +1,10 @@
 import math
-import random
 import tkinter as tk
 from typing import Any
 
 from src.player import Player
 from src.utils import HEIGHT, WIDTH, clamp
-from src.worlds.base import BaseWorld
+from src.worlds.base import BaseWorld, FrameInput
 
 
 class SoftwareDeveloperWorld(BaseWorld):
@@ -168,9 +167,9 @@ class SoftwareDeveloperWorld(BaseWorld):
         self.ping_spawn_timer -= dt
         inactive = [ping for ping in self.pings if ping["timer"] <= 0.0]
         if self.ping_spawn_timer <= 0.0 and inactive:
-            ping = random.choice(inactive)
-            ping["timer"] = random.uniform(5.0, 8.0)
-            self.ping_spawn_timer = random.uniform(4.0, 6.5)
+            ping = self.rng.choice(inactive)
+            ping["timer"] = self.rng.uniform(5.0, 8.0)
+            self.ping_spawn_timer = self.rng.uniform(4.0, 6.5)
 
         for ping in self.pings:
             if ping["timer"] <= 0.0:
@@ -350,9 +349,10 @@ class SoftwareDeveloperWorld(BaseWorld):
             
         return ("Select the next unfinished ticket with 1-4 and continue the workflow.", None)
 
-    def update(self, dt: float, canvas: tk.Canvas, player: Player, keys: set[str], mouse_pos: tuple[int, int]) -> None:
+    def simulate(self, dt: float, frame: FrameInput) -> None:
+        player = self.player
+        keys = frame.keys
         if self.finished:
-            self.draw(canvas, player)
             return
 
         self.tick_timer(dt)
@@ -365,7 +365,6 @@ class SoftwareDeveloperWorld(BaseWorld):
         self.handle_deploy(dt, player, keys)
         self.evaluate_failure()
         self.update_particles(dt)
-        self.draw(canvas, player)
 
     def draw_ticket_card(self, canvas: tk.Canvas, index: int, ticket: dict[str, Any]) -> None:
         x = 28
@@ -451,9 +450,7 @@ class SoftwareDeveloperWorld(BaseWorld):
             canvas.create_rectangle(x1 + 14, y2 - 28, x2 - 14, y2 - 14, fill="#09111a", outline="#29445c")
             canvas.create_rectangle(x1 + 16, y2 - 26, x1 + 16 + (x2 - x1 - 32) * (self.deploy_progress / 100.0), y2 - 16, fill="#4bd18b", outline="")
 
-    def draw(self, canvas: tk.Canvas, player: Player) -> None:
-        canvas.delete("all")
-
+    def draw_static(self, canvas: tk.Canvas) -> None:
         for i in range(7):
             blend = i / 6
             red = int(8 + 10 * blend)
@@ -474,6 +471,9 @@ class SoftwareDeveloperWorld(BaseWorld):
         canvas.create_text(38, 68, anchor="w", text="Sprint Queue", fill="#d2e9ff", font=("Helvetica", 13, "bold"))
         canvas.create_text(312, 68, anchor="w", text="Incident Floor", fill="#d2e9ff", font=("Helvetica", 13, "bold"))
 
+    def draw(self, canvas: tk.Canvas, player: Player) -> None:
+        canvas.delete("all")
+
         selected = self.selected_ticket()
         for index, ticket in enumerate(self.tickets):
             self.draw_ticket_card(canvas, index, ticket)
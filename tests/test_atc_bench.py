@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+
+from src.atc_bench import run_level, write_report
+
+
+class TestATCBenchmark(unittest.TestCase):
+    def test_level_holds_traffic_past_the_plane_limit(self) -> None:
+        result = run_level(60, 0.5, seed=2)
+        self.assertEqual(result.ticks, 30)
+        self.assertGreater(result.mean_planes, 35)
+        self.assertGreater(result.routes_assigned, 0)
+        self.assertGreater(result.detect_ms, 0.0)
+        self.assertLessEqual(result.detect_ms, result.tick_ms)
+        self.assertGreaterEqual(result.sweep_ms, result.detect_ms)
+
+    def test_report_is_a_markdown_table(self) -> None:
+        results = [run_level(10, 0.2, seed=1)]
+        args = Namespace(seconds=0.2, max_wall=30.0, spawn_rate=40.0, routes_per_tick=4, seed=1, render=False)
+        with tempfile.TemporaryDirectory() as folder:
+            path = write_report(os.path.join(folder, "report.md"), results, args)
+            with open(path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        rows = [line for line in lines if line.startswith("| 10 |")]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].count("|"), 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
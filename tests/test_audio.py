@@ -0,0 +1,53 @@
+import sys
+import types
+import unittest
+from unittest import mock
+
+from src.audio import MusicPlayer
+
+
+class FakeMusic:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def load(self, path: str) -> None:
+        self.calls.append(("load", path))
+
+    def play(self, loops: int) -> None:
+        self.calls.append(("play", loops))
+
+    def stop(self) -> None:
+        self.calls.append(("stop",))
+
+
+def fake_pygame() -> types.ModuleType:
+    module = types.ModuleType("pygame")
+    module.mixer = types.SimpleNamespace(init=lambda: None, quit=lambda: None, music=FakeMusic())
+    return module
+
+
+class TestMusicPlayer(unittest.TestCase):
+    def test_play_is_queued_until_the_mixer_is_ready(self) -> None:
+        pygame = fake_pygame()
+        player = MusicPlayer()
+        player.play("theme.wav")
+        with mock.patch.dict(sys.modules, {"pygame": pygame}):
+            player.start()
+            player.thread.join(5)
+        self.assertTrue(player.available)
+        self.assertEqual(pygame.mixer.music.calls, [("load", "theme.wav"), ("play", -1)])
+
+    def test_missing_pygame_degrades_to_silence(self) -> None:
+        player = MusicPlayer()
+        with mock.patch.dict(sys.modules, {"pygame": None}):
+            player.start()
+            player.thread.join(5)
+        self.assertEqual(player.state, "unavailable")
+        player.play("theme.wav")
+        player.stop()
+        player.shutdown()
+        self.assertIsNone(player.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import itertools
+import math
+import random
+import unittest
+
+from src.conflicts import ConflictDetector
+from src.utils import Route, load_numpy
+
+
+def plane(x: float, y: float, vx: float = 0.0, vy: float = 0.0, path: list | None = None, speed: float = 60.0) -> dict:
+    return {"x": x, "y": y, "vx": vx, "vy": vy, "path": path or [], "speed": speed}
+
+
+class TestConflictDetector(unittest.TestCase):
+    def test_head_on_pair_reports_time_to_separation_loss(self) -> None:
+        detector = ConflictDetector(separation=20.0, horizon=3.0)
+        a = plane(0.0, 0.0, vx=50.0)
+        b = plane(200.0, 0.0, vx=-50.0)
+        c = plane(0.0, 300.0, vx=50.0)
+        conflicts = detector.detect([a, b, c])
+        self.assertEqual(len(conflicts), 1)
+        self.assertIs(conflicts[0].first, a)
+        self.assertIs(conflicts[0].second, b)
+        self.assertAlmostEqual(conflicts[0].time, 1.8)
+        self.assertEqual(conflicts[0].distance, 200.0)
+        self.assertFalse(conflicts[0].imminent)
+
+    def test_follows_drawn_routes(self) -> None:
+        detector = ConflictDetector(separation=20.0, horizon=3.0)
+        # Its heading points away, but the drawn route turns it back onto the parked plane.
+        a = plane(0.0, 0.0, vx=-60.0, path=[(60.0, 0.0), (60.0, 100.0)])
+        b = plane(60.0, 120.0)
+        conflicts = detector.detect([b, a])
+        self.assertEqual(len(conflicts), 1)
+        self.assertIs(conflicts[0].first, b)
+        self.assertAlmostEqual(conflicts[0].time, 1.0 + 100.0 / 60.0)
+        a["path"] = []
+        self.assertEqual(detector.detect([b, a]), [])
+
+    def test_bounces_off_the_airspace_edge(self) -> None:
+        detector = ConflictDetector(separation=20.0, horizon=3.0, bounds=(0.0, 0.0, 960.0, 600.0))
+        a = plane(930.0, 100.0, vx=60.0)
+        b = plane(850.0, 100.0)
+        self.assertEqual(len(detector.detect([a, b])), 1)
+        self.assertEqual(ConflictDetector(separation=20.0, horizon=3.0).detect([a, b]), [])
+
+    def test_current_separation_losses_match_brute_force(self) -> None:
+        rng = random.Random(3)
+        detector = ConflictDetector(separation=55.0, horizon=3.0, bounds=(0.0, 0.0, 960.0, 600.0))
+        for _ in range(20):
+            planes = [plane(rng.uniform(0, 960), rng.uniform(0, 600), rng.uniform(-80, 80), rng.uniform(-80, 80)) for _ in range(60)]
+            imminent = {(id(c.first), id(c.second)) for c in detector.detect(planes) if c.imminent}
+            expected = {(id(a), id(b)) for a, b in itertools.combinations(planes, 2) if math.hypot(a["x"] - b["x"], a["y"] - b["y"]) < 55.0}
+            self.assertEqual(imminent, expected)
+            self.assertLess(detector.pairs_tested, 60 * 59 // 2)
+
+    def test_straight_tracks_skip_the_projection(self) -> None:
+        detector = ConflictDetector(separation=20.0, horizon=3.0, bounds=(0.0, 0.0, 960.0, 600.0))
+        straight = plane(100.0, 100.0, vx=60.0, vy=-20.0)
+        for mine, theirs in zip(detector.track(straight), detector.project(straight)):
+            for a, b in zip(mine, theirs):
+                self.assertAlmostEqual(a, b)
+        # Near the edge the track bounces, so it is projected like a routed one.
+        edge = plane(930.0, 100.0, vx=60.0)
+        self.assertEqual(detector.track(edge), detector.project(edge))
+
+    def test_sliced_broadphase_matches_an_all_pairs_solve(self) -> None:
+        rng = random.Random(5)
+        detector = ConflictDetector(separation=55.0, horizon=3.0, bounds=(0.0, 0.0, 960.0, 600.0), use_numpy=False)
+        for _ in range(5):
+            planes = []
+            for _ in range(50):
+                heading, speed = rng.uniform(0.0, math.tau), rng.uniform(55.0, 80.0)
+                path = Route([(rng.uniform(0, 960), rng.uniform(0, 600)) for _ in range(3)]) if rng.random() < 0.3 else Route()
+                planes.append(plane(rng.uniform(0, 960), rng.uniform(0, 600), math.cos(heading) * speed, math.sin(heading) * speed, path, speed))
+            tracks = [detector.project(p) for p in planes]
+            expected = {}
+            for (i, (axs, ays)), (j, (bxs, bys)) in itertools.combinations(enumerate(tracks), 2):
+                for k in range(detector.samples * 20 + 1):
+                    # Dense reference: interpolate both tracks at 1/20 of a step.
+                    slice_index, s = min(k // 20, detector.samples - 1), (k - min(k // 20, detector.samples - 1) * 20) / 20
+                    ax = axs[slice_index] + (axs[slice_index + 1] - axs[slice_index]) * s
+                    ay = ays[slice_index] + (ays[slice_index + 1] - ays[slice_index]) * s
+                    bx = bxs[slice_index] + (bxs[slice_index + 1] - bxs[slice_index]) * s
+                    by = bys[slice_index] + (bys[slice_index + 1] - bys[slice_index]) * s
+                    if math.hypot(ax - bx, ay - by) < 55.0:
+                        expected[(id(planes[i]), id(planes[j]))] = k * detector.step / 20
+                        break
+            found = {(id(c.first), id(c.second)): c.time for c in detector.detect(planes)}
+            self.assertEqual(found.keys(), expected.keys())
+            for key, time in found.items():
+                self.assertLessEqual(time, expected[key] + 1e-9)
+                self.assertGreater(time, expected[key] - detector.step / 20)
+            self.assertLess(detector.pairs_tested / detector.samples, 50 * 49 // 2 // 4)
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_numpy_backend_matches_grid(self) -> None:
+        rng = random.Random(8)
+        bounds = (0.0, 0.0, 960.0, 600.0)
+        grid = ConflictDetector(separation=55.0, horizon=3.0, bounds=bounds, use_numpy=False)
+        arrays = ConflictDetector(separation=55.0, horizon=3.0, bounds=bounds, use_numpy=True)
+        for _ in range(10):
+            planes = []
+            for _ in range(80):
+                heading, speed = rng.uniform(0.0, math.tau), rng.uniform(55.0, 80.0)
+                path = Route([(rng.uniform(0, 960), rng.uniform(0, 600)) for _ in range(3)]) if rng.random() < 0.3 else Route()
+                planes.append(plane(rng.uniform(0, 960), rng.uniform(0, 600), math.cos(heading) * speed, math.sin(heading) * speed, path, speed))
+            expected, got = grid.detect(planes), arrays.detect(planes)
+            self.assertEqual([(id(c.first), id(c.second)) for c in got], [(id(c.first), id(c.second)) for c in expected])
+            for mine, theirs in zip(got, expected):
+                self.assertAlmostEqual(mine.time, theirs.time)
+                self.assertAlmostEqual(mine.distance, theirs.distance)
+            self.assertEqual(arrays.pairs_tested, grid.pairs_tested)
+
+    def test_update_reruns_the_prediction_each_interval(self) -> None:
+        detector = ConflictDetector(separation=20.0, horizon=3.0, interval=0.25)
+        a = plane(0.0, 0.0, vx=50.0)
+        b = plane(200.0, 0.0, vx=-50.0)
+        first = detector.update([a, b], 1 / 60)
+        self.assertEqual(len(first), 1)
+        for _ in range(14):
+            self.assertIs(detector.update([a, b], 1 / 60), first)
+        self.assertAlmostEqual(detector.age, 14 / 60)
+        b["vx"] = 50.0
+        self.assertEqual(detector.update([a, b], 1 / 60), [])
+        self.assertEqual(detector.age, 0.0)
+        detector.reset()
+        self.assertIsNone(detector.conflicts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,29 +1,13 @@
 import unittest
 
 from src.player import Player
+from src.scene import NullCanvas
 from src.worlds.doctor import DoctorWorld
 
 
-class MockCanvas:
-    def create_rectangle(self, *args, **kwargs):
-        pass
-
-    def create_oval(self, *args, **kwargs):
-        pass
-
-    def create_text(self, *args, **kwargs):
-        pass
-
-    def create_line(self, *args, **kwargs):
-        pass
-
-    def delete(self, *args, **kwargs):
-        pass
-
-
 class TestDoctorWorld(unittest.TestCase):
     def test_patient_can_be_cured_with_correct_treatment(self) -> None:
-        canvas = MockCanvas()
+        canvas = NullCanvas()
         player = Player()
         world = DoctorWorld()
         world.reset(player)
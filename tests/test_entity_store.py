@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from src.utils import EntityStore, load_numpy
+
+
+def populate(store: EntityStore, count: int) -> EntityStore:
+    rng = random.Random(11)
+    for index in range(count):
+        store.add(rng.uniform(0, 960), rng.uniform(0, 600), rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(5, 30), rng.uniform(40, 90), index % 3)
+    return store
+
+
+class TestEntityStore(unittest.TestCase):
+    def test_python_backend_operations(self) -> None:
+        store = EntityStore(use_numpy=False)
+        store.add(0.0, 0.0, vx=10.0, radius=5.0)
+        store.add(100.0, 0.0, radius=5.0, speed=20.0, kind=1)
+        store.add(50.0, 700.0, vy=-60.0, radius=40.0)
+        store.integrate(0.5)
+        self.assertEqual(store.get(0, "x"), 5.0)
+        self.assertEqual(store.touching(8.0, 0.0, 1.0), [0])
+        self.assertEqual(store.covering(60.0, 660.0, aspect=0.6), [2])
+        self.assertEqual(store.outside(0.0, 0.0, 960.0, 600.0), [2])
+        self.assertEqual(store.nearest(90.0, 0.0, kind=0), 0)
+        store.home(100.0, 100.0)
+        self.assertAlmostEqual(store.get(1, "vy"), 20.0)
+        store.remove([0, 2])
+        self.assertEqual(len(store), 1)
+        self.assertEqual(list(store.rows("x", "kind")), [(100.0, 1.0)])
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_numpy_backend_matches_python(self) -> None:
+        plain, fast = populate(EntityStore(use_numpy=False), 200), populate(EntityStore(use_numpy=True), 200)
+        for _ in range(30):
+            for store in (plain, fast):
+                store.home(480.0, 300.0)
+                store.integrate(1.0 / 60.0)
+            self.assertEqual(plain.touching(300.0, 200.0, 10.0), fast.touching(300.0, 200.0, 10.0))
+            self.assertEqual(plain.covering(700.0, 400.0, 0.6), fast.covering(700.0, 400.0, 0.6))
+            self.assertEqual(plain.nearest(10.0, 10.0, kind=2), fast.nearest(10.0, 10.0, kind=2))
+            hits = plain.touching(480.0, 300.0, 40.0, use_radius=False)
+            self.assertEqual(hits, fast.touching(480.0, 300.0, 40.0, use_radius=False))
+            plain.remove(hits)
+            fast.remove(hits)
+        self.assertEqual(len(plain), len(fast))
+        # Bit-identical, not just close: replays must not depend on which backend ran.
+        self.assertEqual(list(plain.rows("x", "y", "vx", "vy")), list(fast.rows("x", "y", "vx", "vy")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import random
+import unittest
+
+from src.batch_sim import run_batch
+from src.headless import random_policy, run_world, scripted_policy
+from src.worlds.registry import WORLD_ORDER
+
+
+class TestHeadlessRunner(unittest.TestCase):
+    def test_every_world_runs_without_a_display(self) -> None:
+        for key in WORLD_ORDER:
+            with self.subTest(world=key):
+                report = run_world(key, 3.0, random_policy(random.Random(7)), render=True)
+                self.assertGreater(report.ticks, 0)
+                self.assertLessEqual(report.sim_seconds, 3.0 + 1e-9)
+
+    def test_scripted_policy_runs_for_the_requested_time(self) -> None:
+        report = run_world("1", 1.0, scripted_policy([(0.0, {"d"}), (0.5, set())]))
+        self.assertEqual(report.ticks, 60)
+        self.assertFalse(report.finished)
+
+    def test_same_seed_replays_the_same_session(self) -> None:
+        for key in ("5", "9", "t"):
+            with self.subTest(world=key):
+                first = run_world(key, 10.0, random_policy(random.Random(3)), seed=42)
+                random.seed(999)
+                second = run_world(key, 10.0, random_policy(random.Random(3)), seed=42)
+                self.assertEqual(first.seed, 42)
+                self.assertEqual(
+                    (first.ticks, first.grade, first.message, first.time_remaining),
+                    (second.ticks, second.grade, second.message, second.time_remaining),
+                )
+
+    def test_batch_results_do_not_depend_on_worker_count(self) -> None:
+        serial = run_batch("7", 4, seed=11, workers=1, seconds=5.0)
+        pooled = run_batch("7", 4, seed=11, workers=2, seconds=5.0)
+        self.assertEqual(serial.sessions, 4)
+        self.assertEqual(serial.grades, pooled.grades)
+        self.assertEqual(serial.completion_times, pooled.completion_times)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import math
+import random
+import unittest
+
+from src.utils import Particle, ParticleEmitter, ParticleSystem
+
+
+class OvalCanvas:
+    def __init__(self) -> None:
+        self.ovals: list[tuple] = []
+
+    def create_oval(self, *coords, **options):
+        self.ovals.append((coords, options["fill"]))
+
+
+class TestParticleSystem(unittest.TestCase):
+    def test_dead_slots_are_reused_and_capacity_is_fixed(self) -> None:
+        system = ParticleSystem(capacity=3)
+        self.assertTrue(system.emit(0.0, 0.0, "a", 10.0, 0.0, 0.1))
+        self.assertTrue(system.emit(0.0, 0.0, "b", 0.0, 10.0, 1.0))
+        self.assertTrue(system.emit(0.0, 0.0, "c", 0.0, 0.0, 1.0))
+        self.assertFalse(system.emit(0.0, 0.0, "d", 0.0, 0.0, 1.0))
+
+        system.update(0.5, random.Random(0))
+        self.assertEqual(len(system), 2)
+        self.assertEqual(sorted(system.color[:len(system)]), ["b", "c"])
+        self.assertTrue(system.emit(0.0, 0.0, "e", 0.0, 0.0, 1.0))
+        self.assertEqual(len(system.x), 3)
+        self.assertEqual({particle.color: particle.y for particle in system}, {"b": 5.0, "c": 0.0, "e": 0.0})
+
+        system.clear()
+        self.assertFalse(system)
+
+    def test_burst_matches_the_per_object_particles_it_replaced(self) -> None:
+        rng = random.Random(4)
+        expected = []
+        for _ in range(6):
+            ang = rng.uniform(0.0, math.tau)
+            mag = rng.uniform(240 * 0.35, 240)
+            expected.append(Particle(5.0, 6.0, "#fff", math.cos(ang) * mag, math.sin(ang) * mag, rng.uniform(0.25, 0.55), size=rng.uniform(2.0, 4.0)))
+
+        system = ParticleSystem()
+        system.burst(5.0, 6.0, "#fff", 6, 240, random.Random(4))
+        for particle in expected:
+            particle.update(0.1)
+        system.update(0.1, random.Random(0))
+        got = list(system)
+        self.assertEqual(len(got), 6)
+        for mine, theirs in zip(got, expected):
+            self.assertAlmostEqual(mine.x, theirs.x)
+            self.assertAlmostEqual(mine.y, theirs.y)
+            self.assertAlmostEqual(mine.life, theirs.life)
+            self.assertEqual(mine.size, theirs.size)
+
+    def test_emitter_fires_at_its_rate_from_the_given_rng(self) -> None:
+        def run(seed: int) -> tuple[ParticleSystem, ParticleEmitter]:
+            system = ParticleSystem()
+            emitter = system.add_emitter(ParticleEmitter(0.0, 0.0, "#fff", rate=30.0, speed=10.0, life=(5.0, 5.0)))
+            rng = random.Random(seed)
+            for _ in range(60):
+                system.update(1 / 60, rng)
+            return system, emitter
+
+        system, emitter = run(1)
+        self.assertEqual(len(system), 30)
+        again, _ = run(1)
+        self.assertEqual(list(system.vx[:30]), list(again.vx[:30]))
+        self.assertEqual(list(system.size[:30]), list(again.size[:30]))
+        self.assertNotEqual(list(system.vx[:30]), list(run(2)[0].vx[:30]))
+        emitter.active = False
+        system.update(1.0, random.Random(1))
+        self.assertEqual(len(system), 30)
+
+    def test_draw_emits_one_oval_per_live_particle(self) -> None:
+        system = ParticleSystem()
+        system.emit(10.0, 20.0, "#f00", 0.0, 0.0, 1.0, 4.0)
+        canvas = OvalCanvas()
+        system.draw(canvas)
+        system.draw(canvas, 1.0, 1.0, centered=True)
+        self.assertEqual(canvas.ovals, [((10.0, 20.0, 14.0, 24.0), "#f00"), ((7.0, 17.0, 15.0, 25.0), "#f00")])
+
+
+if __name__ == "__main__":
+    unittest.main()
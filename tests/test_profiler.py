@@ -0,0 +1,61 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from src.player import Player
+from src.profiler import PhaseProfiler, StartupTimer, percentile
+from src.utils import SIM_STEP
+from src.worlds.base import FrameInput
+from src.worlds.registry import create_world
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_percentiles_use_the_rolling_window(self) -> None:
+        profiler = PhaseProfiler(window=100)
+        for ms in range(1, 201):
+            profiler.add("simulate", ms / 1000.0)
+        row = profiler.summary()[0]
+        self.assertEqual(row["samples"], 200)
+        self.assertAlmostEqual(row["p50_ms"], 150.0)
+        self.assertAlmostEqual(row["p99_ms"], 199.0)
+        self.assertAlmostEqual(row["max_ms"], 200.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_world_step_reports_each_phase(self) -> None:
+        world = create_world("2")
+        player = Player()
+        world.reset(player)
+        world.start_session(player)
+        profiler = PhaseProfiler()
+        for _ in range(10):
+            world.step(SIM_STEP, FrameInput(set(), (0.0, 0.0)), profiler)
+        self.assertEqual(set(profiler.samples), {"tick_timer", "simulate", "guidance"})
+        self.assertEqual(len(profiler.samples["simulate"]), 10)
+
+    def test_export_writes_csv_and_json(self) -> None:
+        profiler = PhaseProfiler()
+        profiler.add("render", 0.002)
+        with tempfile.TemporaryDirectory() as folder:
+            profiler.export(os.path.join(folder, "p.json"))
+            profiler.export(os.path.join(folder, "p.csv"))
+            with open(os.path.join(folder, "p.json"), encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["phases"][0]["phase"], "render")
+            with open(os.path.join(folder, "p.csv"), encoding="utf-8") as file:
+                self.assertEqual(next(csv.DictReader(file))["phase"], "render")
+
+    def test_startup_timer_reports_against_a_budget(self) -> None:
+        timer = StartupTimer()
+        timer.lap("imports")
+        timer.lap("first_frame")
+        timer.add_background("mixer_init", 0.25)
+        lines = timer.format_lines(budget_ms=60000)
+        self.assertEqual([line.split()[0] for line in lines[1:3]], ["imports", "first_frame"])
+        self.assertIn("mixer_init (background)", lines[-2])
+        self.assertTrue(lines[-1].startswith("within"))
+        self.assertTrue(timer.format_lines(budget_ms=-1)[-1].startswith("OVER"))
+
+
+if __name__ == "__main__":
+    unittest.main()
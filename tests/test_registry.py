@@ -0,0 +1,30 @@
+import sys
+import unittest
+
+from src.worlds.registry import WORLD_ORDER, WORLD_SPECS, create_world
+
+
+class TestWorldRegistry(unittest.TestCase):
+    def test_metadata_matches_each_world(self) -> None:
+        for key in WORLD_ORDER:
+            spec = WORLD_SPECS[key]
+            with self.subTest(world=key):
+                world = create_world(key)
+                self.assertEqual(type(world).__name__, spec.class_name)
+                self.assertEqual((world.name, world.summary, world.duration), (spec.name, spec.summary, spec.duration))
+
+    def test_registry_import_does_not_load_world_modules(self) -> None:
+        saved = {name: module for name, module in sys.modules.items() if name.startswith("src.worlds")}
+        try:
+            for name in saved:
+                del sys.modules[name]
+            import src.worlds.registry  # noqa: F401
+
+            self.assertNotIn("src.worlds.game_developer", sys.modules)
+            self.assertNotIn("src.worlds.entrepreneur_rework", sys.modules)
+        finally:
+            sys.modules.update(saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from src.headless import random_policy
+from src.player import Player
+from src.replay import InputRecorder, Replay, play_replay
+from src.scene import NullCanvas
+from src.utils import SIM_STEP
+from src.worlds.registry import create_world
+
+
+def record_session(key: str, seed: int, seconds: float) -> tuple[Replay, object]:
+    world = create_world(key)
+    player = Player()
+    world.seed_rng(seed)
+    world.reset(player)
+    world.start_session(player)
+    canvas = NullCanvas()
+    recorder = InputRecorder(key, seed, player)
+    policy = random_policy(random.Random(seed))
+    for tick in range(int(seconds / SIM_STEP)):
+        frame = policy(world, player, tick)
+        recorder.record(SIM_STEP, frame)
+        world.step(SIM_STEP, frame)
+        # Draw every tick, as GameEngine.step_world does; play_replay draws nothing.
+        world.render(canvas)
+        world.draw_adaptive_hint(canvas, player)
+        if world.finished:
+            break
+    if world.finished:
+        world.grade = world.calculate_grade()
+    return recorder.replay, world
+
+
+class TestReplay(unittest.TestCase):
+    def test_log_round_trips_through_bytes(self) -> None:
+        replay, _ = record_session("3", 5, 4.0)
+        data = replay.to_bytes()
+        loaded = Replay.from_bytes(data)
+        self.assertEqual(loaded.world_key, "3")
+        self.assertEqual(loaded.seed, 5)
+        self.assertEqual(loaded.player_state, replay.player_state)
+        self.assertEqual(loaded.ticks, replay.ticks)
+        self.assertLess(len(data), len(replay.ticks) * 8)
+
+    def test_replay_reproduces_the_recorded_session(self) -> None:
+        for key in ("1", "7", "e"):
+            with self.subTest(world=key):
+                replay, world = record_session(key, 3, 30.0)
+                report = play_replay(Replay.from_bytes(replay.to_bytes()))
+                self.assertEqual(report.ticks, len(replay.ticks))
+                self.assertEqual(
+                    (report.finished, report.grade, report.message, report.time_remaining, report.scores),
+                    (world.finished, world.grade, world.message, world.timer, world.run_scores()),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
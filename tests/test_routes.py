@@ -0,0 +1,34 @@
+import unittest
+
+from src.utils import Route, simplify_path
+
+
+class TestSimplifyPath(unittest.TestCase):
+    def test_drops_points_within_tolerance_and_keeps_corners(self) -> None:
+        points = [(0.0, 0.0), (15.0, 1.0), (30.0, -1.0), (45.0, 0.5), (60.0, 0.0), (60.0, 15.0), (61.0, 30.0), (60.0, 45.0)]
+        self.assertEqual(simplify_path(points, 4.0), [(0.0, 0.0), (60.0, 0.0), (60.0, 45.0)])
+        self.assertEqual(len(simplify_path(points, 0.1)), len(points))
+
+    def test_short_and_closed_paths(self) -> None:
+        self.assertEqual(simplify_path([(1.0, 2.0), (3.0, 4.0)], 4.0), [(1.0, 2.0), (3.0, 4.0)])
+        loop = [(0.0, 0.0), (50.0, 0.0), (50.0, 50.0), (0.0, 0.0)]
+        self.assertEqual(simplify_path(loop, 4.0), loop)
+
+
+class TestRoute(unittest.TestCase):
+    def test_coords_are_cached_until_a_waypoint_is_consumed(self) -> None:
+        route = Route([(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)])
+        coords = route.coords()
+        self.assertEqual(coords, (1.0, 2.0, 3.0, 4.0, 5.0, 6.0))
+        self.assertIs(route.coords(), coords)
+        route.advance()
+        self.assertEqual(route[0], (3.0, 4.0))
+        self.assertEqual(route.coords(), (3.0, 4.0, 5.0, 6.0))
+        route.advance()
+        route.advance()
+        self.assertFalse(route)
+        self.assertEqual(route.coords(), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
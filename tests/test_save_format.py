@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+from src import save_format
+from src.save_system import SaveSystem
+
+
+class TestSaveFormat(unittest.TestCase):
+    def test_both_formats_round_trip_a_snapshot(self) -> None:
+        snapshot = save_format.sample_snapshot(200)
+        for fmt in save_format.FORMATS:
+            with self.subTest(fmt=fmt):
+                data = save_format.dumps(snapshot, b"key", fmt)
+                loaded = save_format.loads(data, b"key")
+                self.assertEqual(loaded["progress"], snapshot["progress"])
+                self.assertEqual(loaded["settings"], snapshot["settings"])
+                self.assertEqual(len(loaded["runs"]), 200)
+                self.assertEqual(loaded["runs"][7]["seed"], snapshot["runs"][7]["seed"])
+                self.assertAlmostEqual(loaded["runs"][7]["duration"], snapshot["runs"][7]["duration"])
+
+    def test_binary_round_trip_keeps_integer_scores(self) -> None:
+        snapshot = save_format.sample_snapshot(50)
+        snapshot["runs"][0]["scores"] = {"landed_count": 3, "review_score": 2.5}
+        loaded = save_format.loads(save_format.dumps(snapshot, b"key", "binary"), b"key")
+        self.assertEqual(loaded, snapshot)
+        self.assertIs(type(loaded["runs"][0]["scores"]["landed_count"]), int)
+        self.assertIs(type(loaded["runs"][0]["scores"]["review_score"]), float)
+
+    def test_binary_is_smaller_and_rejects_tampering(self) -> None:
+        snapshot = save_format.sample_snapshot(500)
+        binary = save_format.dumps(snapshot, b"key", "binary")
+        self.assertLess(len(binary), len(save_format.dumps(snapshot, b"key", "json")) / 2)
+        tampered = bytearray(binary)
+        tampered[40] ^= 1
+        with self.assertRaises(save_format.SaveFormatError):
+            save_format.loads(bytes(tampered), b"key")
+        with self.assertRaises(save_format.SaveFormatError):
+            save_format.loads(binary, b"other key")
+
+    def test_profile_export_follows_the_format_setting(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            source = SaveSystem(os.path.join(folder, "a.db"), legacy_path=os.path.join(folder, "none.json"))
+            source.set_setting("save_format", "binary")
+            source.mark_world_complete("7", "A", "Air Traffic Control")
+            source.record_run("7", "A", success=True, time_left=12.0, duration=48.0, seed=5, scores={"landed_count": 21})
+            export_path = os.path.join(folder, "profile.sav")
+            source.export_profile(export_path)
+            source.close()
+            with open(export_path, "rb") as file:
+                self.assertEqual(file.read(4), save_format.MAGIC)
+
+            target = SaveSystem(os.path.join(folder, "b.db"), "guest", legacy_path=os.path.join(folder, "none.json"))
+            target.import_profile(export_path)
+            self.assertEqual(target.get_grade("7"), "A")
+            self.assertEqual(target.get_completed_worlds(), ["Air Traffic Control"])
+            self.assertEqual(target.get_run_stats("7").best_time, 48.0)
+            self.assertEqual(target.get_run_history("7")[0]["scores"], {"landed_count": 21})
+            target.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
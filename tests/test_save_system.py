@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from src.save_system import COMPACT_EVERY, SaveSystem, SaveWriter
+
+
+class TestSaveWriter(unittest.TestCase):
+    def test_burst_of_saves_coalesces_into_one_write(self) -> None:
+        written: list[str] = []
+        writer = SaveWriter(written.append, delay=0.05)
+        for index in range(5):
+            writer.submit(str(index))
+        deadline = time.monotonic() + 2.0
+        while not written and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        self.assertEqual(written, ["4"])
+        writer.close()
+
+    def test_flush_writes_immediately(self) -> None:
+        written: list[str] = []
+        writer = SaveWriter(written.append, delay=60.0)
+        writer.submit("a")
+        writer.flush()
+        self.assertEqual(written, ["a"])
+        writer.flush()
+        self.assertEqual(written, ["a"])
+        writer.close()
+
+
+class TestSaveSystem(unittest.TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "save_data.db")
+        self.legacy_path = os.path.join(self.folder.name, "save_data.json")
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def open(self, profile: str = "default") -> SaveSystem:
+        return SaveSystem(self.path, profile, legacy_path=self.legacy_path)
+
+    def test_settings_survive_a_flush_and_reload(self) -> None:
+        save = self.open()
+        save.set_setting("music_on", False)
+        save.mark_world_complete("7", "A", "Air Traffic Control")
+        save.close()
+
+        reloaded = self.open()
+        self.assertFalse(reloaded.integrity_error)
+        self.assertFalse(reloaded.get_setting("music_on"))
+        self.assertEqual(reloaded.get_grade("7"), "A")
+        self.assertEqual(reloaded.get_completed_world_count(), 1)
+        reloaded.close()
+
+    def test_profiles_keep_separate_progress(self) -> None:
+        save = self.open("ada")
+        save.mark_world_complete("7", "S", "Air Traffic Control")
+        save.switch_profile("grace")
+        self.assertIsNone(save.get_grade("7"))
+        self.assertEqual(save.get_completed_world_count(), 0)
+        save.mark_world_complete("7", "C", "Air Traffic Control")
+        save.mark_world_complete("7", "B", "Air Traffic Control")
+        self.assertEqual(save.get_grade("7"), "B")
+        self.assertEqual([grade for grade, _ in save.get_grade_history("7")], ["C", "B"])
+        self.assertEqual(save.list_profiles(), ["ada", "grace"])
+        save.switch_profile("ada")
+        self.assertEqual(save.get_grade("7"), "S")
+        save.close()
+
+    def test_tampered_row_is_dropped_without_losing_the_rest(self) -> None:
+        save = self.open()
+        save.mark_world_complete("1", "A", "One")
+        save.mark_world_complete("2", "B", "Two")
+        save.close()
+
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("UPDATE world_grades SET grade = 'S' WHERE world_id = '1'")
+
+        reloaded = self.open()
+        self.assertFalse(reloaded.integrity_error)
+        self.assertIsNone(reloaded.get_grade("1"))
+        self.assertEqual(reloaded.get_grade("2"), "B")
+        self.assertEqual(reloaded.get_completed_world_count(), 2)
+        self.assertTrue(reloaded.integrity_error)
+        self.assertEqual(reloaded.get_quarantined_count(), 1)
+        reloaded.close()
+
+        again = self.open()
+        self.assertIsNone(again.get_grade("1"))
+        self.assertFalse(again.integrity_error)
+        again.close()
+
+    def test_forged_completion_is_not_counted(self) -> None:
+        save = self.open()
+        save.mark_world_complete("1", "A", "One")
+        save.close()
+
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("INSERT INTO completed_worlds (profile_id, name, signature) SELECT id, 'Two', 'forged' FROM profiles")
+
+        reloaded = self.open()
+        self.assertEqual(reloaded.get_completed_world_count(), 1)
+        self.assertEqual(reloaded.get_completed_worlds(), ["One"])
+        reloaded.close()
+
+    def test_existing_json_save_is_migrated_once(self) -> None:
+        payload = json.dumps(
+            {
+                "version": 2,
+                "progress": {"completed_worlds": ["Air Traffic Control"], "world_grades": {"7": "A"}},
+                "settings": {"high_contrast": True, "music_on": True},
+            },
+            sort_keys=True,
+        )
+        probe = self.open()
+        signature = probe.get_signature(payload)
+        probe.close()
+        os.remove(self.path)
+        with open(self.legacy_path, "w", encoding="utf-8") as file:
+            json.dump({"payload": payload, "signature": signature}, file)
+
+        save = self.open()
+        self.assertEqual(save.get_grade("7"), "A")
+        self.assertEqual(save.get_completed_worlds(), ["Air Traffic Control"])
+        self.assertTrue(save.get_setting("high_contrast"))
+        save.set_setting("high_contrast", False)
+        save.close()
+
+        reloaded = self.open()
+        self.assertFalse(reloaded.get_setting("high_contrast"))
+        reloaded.close()
+
+    def test_run_stats_match_across_compaction(self) -> None:
+        save = self.open()
+        for index in range(COMPACT_EVERY + 3):
+            grade = "A" if index % 2 else "C"
+            save.record_run("7", grade, success=index % 2 == 1, time_left=10.0, duration=30.0 + index, seed=index, scores={"landed_count": index})
+        stats = save.get_run_stats("7")
+        self.assertEqual(stats.attempts, COMPACT_EVERY + 3)
+        self.assertEqual(stats.best_time, 31.0)
+        self.assertEqual(stats.average_rank, "B")
+        self.assertEqual(save.pending_runs, 3)
+        save.close()
+
+        reloaded = self.open()
+        self.assertEqual(reloaded.pending_runs, 0)
+        self.assertEqual(reloaded.get_run_stats("7"), stats)
+        history = reloaded.get_run_history("7")
+        self.assertEqual(len(history), COMPACT_EVERY + 3)
+        self.assertEqual(history[-1]["scores"], {"landed_count": COMPACT_EVERY + 2})
+        self.assertEqual(reloaded.get_run_stats("1").attempts, 0)
+        reloaded.close()
+
+    def test_tampered_summary_is_rebuilt_from_the_journal(self) -> None:
+        save = self.open()
+        save.record_run("7", "S", success=True, time_left=5.0, duration=40.0)
+        save.close()
+
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("UPDATE run_summary SET attempts = 99")
+
+        reloaded = self.open()
+        self.assertEqual(reloaded.get_run_stats("7").attempts, 1)
+        reloaded.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
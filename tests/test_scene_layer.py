@@ -0,0 +1,161 @@
+import unittest
+
+from src.scene import SceneLayer
+
+
+class RecordingCanvas:
+    def __init__(self) -> None:
+        self.next_id = 1
+        self.live: dict[int, tuple] = {}
+        self.calls: list[str] = []
+
+    def _create(self, kind, *args, **kwargs):
+        item_id = self.next_id
+        self.next_id += 1
+        self.live[item_id] = (kind, args, kwargs)
+        self.calls.append("create")
+        return item_id
+
+    def create_rectangle(self, *args, **kwargs):
+        return self._create("rectangle", *args, **kwargs)
+
+    def create_text(self, *args, **kwargs):
+        return self._create("text", *args, **kwargs)
+
+    def create_line(self, *args, **kwargs):
+        return self._create("line", *args, **kwargs)
+
+    def coords(self, item_id, *args):
+        kind, _, kwargs = self.live[item_id]
+        self.live[item_id] = (kind, args, kwargs)
+        self.calls.append("coords")
+
+    def itemconfigure(self, item_id, **kwargs):
+        kind, args, options = self.live[item_id]
+        self.live[item_id] = (kind, args, {**options, **kwargs})
+        self.calls.append("itemconfigure")
+
+    def tag_lower(self, item_id, below=None):
+        self.calls.append("tag_lower")
+
+    def delete(self, *tags):
+        for tag in tags:
+            if isinstance(tag, int):
+                self.live.pop(tag, None)
+            else:
+                for item_id, (_, _, kwargs) in list(self.live.items()):
+                    if tag in kwargs.get("tags", ()):
+                        del self.live[item_id]
+        self.calls.append("delete")
+
+
+class TestSceneLayer(unittest.TestCase):
+    def draw(self, scene: SceneLayer, x: float, label: str) -> None:
+        scene.delete("all")
+        scene.create_rectangle(0, 0, 960, 600, fill="#000000", outline="")
+        scene.create_rectangle(x, 10, x + 20, 30, fill="#ffffff")
+        scene.create_text(100, 100, text=label, fill="#ffffff")
+        scene.end_frame()
+
+    def test_unchanged_frame_makes_no_tk_calls(self) -> None:
+        canvas = RecordingCanvas()
+        scene = SceneLayer(canvas)
+        self.draw(scene, 10, "A")
+        canvas.calls.clear()
+        self.draw(scene, 10, "A")
+        self.assertEqual(canvas.calls, [])
+
+    def test_changes_reuse_existing_items(self) -> None:
+        canvas = RecordingCanvas()
+        scene = SceneLayer(canvas)
+        self.draw(scene, 10, "A")
+        canvas.calls.clear()
+        self.draw(scene, 40, "B")
+        self.assertEqual(canvas.calls, ["coords", "itemconfigure"])
+        self.assertEqual(len(canvas.live), 3)
+
+    def test_shorter_frame_removes_leftover_items(self) -> None:
+        canvas = RecordingCanvas()
+        scene = SceneLayer(canvas)
+        self.draw(scene, 10, "A")
+        scene.delete("all")
+        scene.create_text(5, 5, text="only", fill="#ffffff")
+        scene.end_frame()
+        self.assertEqual(len(canvas.live), 1)
+        self.assertEqual(len(scene.items), 1)
+
+    def test_viewport_is_applied_at_emission(self) -> None:
+        canvas = RecordingCanvas()
+        scene = SceneLayer(canvas)
+        scene.set_viewport(2.0, 40.0, 0.0)
+        scene.delete("all")
+        item_id = scene.create_text(100, 50, text="A", font=("Helvetica", 12, "bold"), width=200)
+        scene.end_frame()
+        _, args, options = canvas.live[item_id]
+        self.assertEqual(list(args), [240.0, 100.0])
+        self.assertEqual(options["font"], ("Helvetica", 24, "bold"))
+        self.assertEqual(options["width"], 400.0)
+
+        canvas.calls.clear()
+        scene.set_viewport(1.0, 0.0, 0.0)
+        scene.delete("all")
+        scene.create_text(100, 50, text="A", font=("Helvetica", 12, "bold"), width=200)
+        scene.end_frame()
+        self.assertEqual(canvas.calls, ["delete", "coords", "itemconfigure"])
+        _, args, options = canvas.live[item_id]
+        self.assertEqual(list(args), [100.0, 50.0])
+        self.assertEqual(options["font"], ("Helvetica", 12, "bold"))
+
+    def test_keyed_items_ignore_draw_order_and_compare_coords_by_identity(self) -> None:
+        canvas = RecordingCanvas()
+        scene = SceneLayer(canvas)
+        route = (0.0, 0.0, 50.0, 50.0, 100.0, 0.0)
+
+        def frame(labels: int, coords: tuple | None) -> None:
+            scene.delete("all")
+            for index in range(labels):
+                scene.create_text(10, 10 * index, text=str(index), fill="#ffffff")
+            if coords is not None:
+                scene.create_keyed("route", "line", coords, fill="#ffffff")
+            scene.end_frame()
+
+        frame(1, route)
+        line = scene.keyed["route"][0]
+        canvas.calls.clear()
+        frame(3, route)
+        self.assertEqual(canvas.calls, ["create", "create"])
+        self.assertEqual(scene.keyed["route"][0], line)
+        canvas.calls.clear()
+        frame(3, route[2:])
+        self.assertEqual(canvas.calls, ["coords"])
+        self.assertEqual(canvas.live[line][1], (50.0, 50.0, 100.0, 0.0))
+        frame(3, None)
+        self.assertNotIn(line, canvas.live)
+        self.assertEqual(scene.keyed, {})
+
+    def test_static_layer_is_painted_once_until_invalidated(self) -> None:
+        canvas = RecordingCanvas()
+        scene = SceneLayer(canvas)
+        painted = []
+
+        def painter(target) -> None:
+            painted.append(True)
+            target.create_rectangle(0, 0, 960, 600, fill="#101821", outline="")
+
+        for _ in range(3):
+            scene.set_static("world", painter)
+            self.draw(scene, 10, "A")
+        self.assertEqual(len(painted), 1)
+        self.assertEqual(len(canvas.live), 4)
+
+        scene.invalidate_static()
+        scene.set_static("world", painter)
+        self.assertEqual(len(painted), 2)
+        self.assertEqual(len(canvas.live), 4)
+
+        scene.set_static(None, None)
+        self.assertEqual(len(canvas.live), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import math
+import random
+import unittest
+
+from src.utils import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(3)
+        self.points = [{"x": rng.uniform(0, 960), "y": rng.uniform(0, 600)} for _ in range(300)]
+        self.grid = SpatialHash(40.0)
+        self.grid.rebuild(self.points, lambda p: (p["x"], p["y"]))
+
+    def brute(self, x: float, y: float, radius: float) -> list[dict]:
+        return [p for p in self.points if math.hypot(p["x"] - x, p["y"] - y) < radius]
+
+    def test_radius_query_matches_a_linear_scan(self) -> None:
+        for x, y, radius in [(100, 100, 30), (480, 300, 95), (0, 0, 500), (959, 599, 12)]:
+            found = self.grid.query_radius(x, y, radius)
+            self.assertCountEqual(map(id, found), map(id, self.brute(x, y, radius)))
+
+    def test_nearest_matches_a_linear_scan(self) -> None:
+        rng = random.Random(9)
+        for _ in range(50):
+            x, y = rng.uniform(-100, 1060), rng.uniform(-100, 700)
+            expected = min(self.points, key=lambda p: math.hypot(p["x"] - x, p["y"] - y))
+            self.assertIs(self.grid.nearest(x, y), expected)
+            limited = self.grid.nearest(x, y, 25.0)
+            if math.hypot(expected["x"] - x, expected["y"] - y) < 25.0:
+                self.assertIs(limited, expected)
+            else:
+                self.assertIsNone(limited)
+
+    def test_move_and_remove_keep_queries_correct(self) -> None:
+        moved = self.points[0]
+        moved["x"], moved["y"] = 900.0, 20.0
+        self.grid.move(moved, 900.0, 20.0)
+        self.assertIs(self.grid.nearest(901.0, 21.0), moved)
+        self.grid.remove(moved)
+        self.points.remove(moved)
+        self.assertNotIn(moved, self.grid)
+        self.assertEqual(len(self.grid), 299)
+        self.assertCountEqual(map(id, self.grid.query_radius(900, 20, 60)), map(id, self.brute(900, 20, 60)))
+
+    def test_pairs_within_reports_each_close_pair_once(self) -> None:
+        expected = {
+            frozenset((id(a), id(b)))
+            for i, a in enumerate(self.points)
+            for b in self.points[i + 1:]
+            if math.hypot(a["x"] - b["x"], a["y"] - b["y"]) < 22.0
+        }
+        pairs = [frozenset((id(a), id(b))) for a, b in self.grid.pairs_within(22.0)]
+        self.assertEqual(len(pairs), len(set(pairs)))
+        self.assertEqual(set(pairs), expected)
+
+    def test_neighbour_pairs_cover_every_pair_within_a_cell(self) -> None:
+        pairs = [frozenset((id(a), id(b))) for a, b in self.grid.neighbour_pairs()]
+        self.assertEqual(len(pairs), len(set(pairs)))
+        close = {frozenset((id(a), id(b))) for a, b in self.grid.pairs_within(40.0)}
+        self.assertLessEqual(close, set(pairs))
+        self.assertLess(len(pairs), len(self.points) * (len(self.points) - 1) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
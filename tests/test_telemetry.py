@@ -0,0 +1,71 @@
+import unittest
+
+from src.player import Player
+from src.scene import SceneLayer
+from src.telemetry import CanvasTelemetry
+from src.worlds.registry import create_world
+
+
+class CountingCanvas:
+    def __init__(self) -> None:
+        self.live: set[int] = set()
+        self.next_id = 1
+
+    def __getattr__(self, name: str):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+
+        def create(*args, **kwargs) -> int:
+            item_id = self.next_id
+            self.next_id += 1
+            self.live.add(item_id)
+            return item_id
+
+        return create
+
+    def coords(self, item_id, *args) -> None:
+        pass
+
+    def itemconfigure(self, item_id, **kwargs) -> None:
+        pass
+
+    def tag_lower(self, *args) -> None:
+        pass
+
+    def delete(self, *tags) -> None:
+        for tag in tags:
+            self.live.discard(tag)
+
+    def find_all(self) -> tuple[int, ...]:
+        return tuple(self.live)
+
+
+class TestCanvasTelemetry(unittest.TestCase):
+    def test_calls_are_charged_to_the_world_draw_method(self) -> None:
+        telemetry = CanvasTelemetry(CountingCanvas())
+        scene = SceneLayer(telemetry)
+        world = create_world("q")
+        player = Player()
+        world.reset(player)
+        world.start_session(player)
+
+        telemetry.begin_frame()
+        world.render(scene)
+        scene.end_frame()
+        telemetry.end_frame(len(scene.items))
+
+        self.assertEqual(telemetry.last_ops["create"], len(scene.items))
+        self.assertEqual(telemetry.last_items, len(scene.items))
+        self.assertIn("TycoonWorld.draw_market_strip", telemetry.last_sites)
+        self.assertIn("Player.draw", telemetry.last_sites)
+
+        telemetry.begin_frame()
+        world.render(scene)
+        scene.end_frame()
+        telemetry.end_frame(len(scene.items))
+        self.assertEqual(telemetry.last_ops["create"], 0)
+        self.assertEqual(telemetry.frames, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
-import tkinter as tk
 from src.player import Player
+from src.scene import NullCanvas
 from src.worlds.marine import MarineWorld
 from src.worlds.architect import ArchitectWorld
 from src.worlds.doctor import DoctorWorld
@@ -9,18 +9,15 @@ from src.save_system import SaveSystem
 
 class TestExpansion(unittest.TestCase):
     def setUp(self):
-        self.root = tk.Tk()
-        self.canvas = tk.Canvas(self.root, width=800, height=600)
+        self.canvas = NullCanvas()
         self.player = Player()
         self.keys = set()
-    
-    def tearDown(self):
-        self.root.destroy()
-        
+
+
     def test_marine_world(self):
         world = MarineWorld()
         world.reset(self.player)
-        world.update(0.1, self.canvas, self.player, self.keys)
+        world.update(0.1, self.canvas, self.player, self.keys, (0, 0))
         self.assertFalse(world.finished)
         
     def test_architect_world(self):
@@ -29,19 +26,19 @@ class TestExpansion(unittest.TestCase):
         # Test building
         self.keys.add("1")
         self.keys.add("space")
-        world.update(0.1, self.canvas, self.player, self.keys)
+        world.update(0.1, self.canvas, self.player, self.keys, (0, 0))
         self.assertFalse(world.finished)
         
     def test_doctor_world(self):
         world = DoctorWorld()
         world.reset(self.player)
-        world.update(0.1, self.canvas, self.player, self.keys)
+        world.update(0.1, self.canvas, self.player, self.keys, (0, 0))
         self.assertFalse(world.finished)
         
     def test_atc_world(self):
         world = ATCWorld()
         world.reset(self.player)
-        world.update(0.1, self.canvas, self.player, self.keys)
+        world.update(0.1, self.canvas, self.player, self.keys, (0, 0))
         self.assertFalse(world.finished)
         
     def test_save_system(self):
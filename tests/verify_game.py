@@ -11,20 +11,12 @@ from src.worlds.fire_rescue import FireRescueWorld
 from src.worlds.chef_rush import ChefRushWorld
 from src.worlds.bug_hunt import BugHuntWorld
 from src.player import Player
+from src.scene import NullCanvas
 from src.utils import WIDTH, HEIGHT
 
-class MockCanvas:
-    def create_rectangle(self, *args, **kwargs): pass
-    def create_oval(self, *args, **kwargs): pass
-    def create_text(self, *args, **kwargs): pass
-    def create_line(self, *args, **kwargs): pass
-    def create_polygon(self, *args, **kwargs): pass
-    def create_arc(self, *args, **kwargs): pass
-    def delete(self, *args, **kwargs): pass
-
 class TestGameWinnable(unittest.TestCase):
     def setUp(self):
-        self.canvas = MockCanvas()
+        self.canvas = NullCanvas()
         self.player = Player()
 
     def test_fire_rescue_winnable(self):